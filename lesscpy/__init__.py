@@ -1,10 +1,20 @@
+import threading
+
 __version_info__ = ('0', '11', '1')
 __version__ = '.'.join(__version_info__)
 
+# Parsers are expensive to build (lexer and LALR tables), keep one per thread.
+# Parsed imports are shared by all of them, see ImportCache.
+_local = threading.local()
+_imports = None
+_imports_lock = threading.Lock()
+
 
 def compile(file, minify=False, xminify=False, tabs=False, spaces=True):
+    from .lessc import cache
     from .lessc import parser
     from .lessc import formatter
+    global _imports
 
     class Opt(object):
         def __init__(self):
@@ -13,9 +23,16 @@ def compile(file, minify=False, xminify=False, tabs=False, spaces=True):
             self.tabs = tabs
             self.spaces = spaces
 
-    p = parser.LessParser(fail_with_exc=True)
+    p = getattr(_local, 'parser', None)
+    if p is None:
+        with _imports_lock:
+            if _imports is None:
+                _imports = cache.ImportCache()
+        p = _local.parser = parser.LessParser(fail_with_exc=True,
+                                              import_cache=_imports)
+    else:
+        p.reset()
     opt = Opt()
     p.parse(file=file)
     f = formatter.Formatter(opt)
     return f.format(p)
-
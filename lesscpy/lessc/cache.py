@@ -0,0 +1,552 @@
+# -*- coding: utf8 -*-
+"""
+.. module:: lesscpy.lessc.cache
+    :synopsis: Caches for parsed files.
+
+    Copyright (c)
+    See LICENSE for details.
+"""
+import array
+import copy
+import hashlib
+import json
+import marshal
+import os
+import re
+import sys
+import tempfile
+import threading
+import zlib
+
+import ply.lex as lex
+from six import StringIO, string_types
+
+from lesscpy import __version__
+from lesscpy.lib import reserved
+from . import stats
+from .lexer import DOM_ELEMENTS, IDENT_TYPES, LessLexer
+from .scope import fingerprint
+
+# Token types by index in the binary token stream format
+TOKEN_TYPES = LessLexer.tokens + list(LessLexer.literals)
+TOKEN_INDEX = dict((t, i) for i, t in enumerate(TOKEN_TYPES))
+# Binary token stream format: version, array item size and byte order
+TOKEN_FORMAT = (1, array.array('I').itemsize, sys.byteorder)
+
+
+def file_digest(filename):
+    """ Hash of file content
+    args:
+        filename (str): path
+    returns:
+        str
+    """
+    with open(filename, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def text_digest(text):
+    """ Hash of text
+    args:
+        text (str): text
+    returns:
+        str
+    """
+    if not isinstance(text, bytes):
+        text = text.encode('utf-8')
+    return hashlib.sha1(text).hexdigest()
+
+
+def file_stamp(filename):
+    """ Stat stamp of file
+    args:
+        filename (str): path
+    returns:
+        tuple
+    """
+    st = os.stat(filename)
+    return (st.st_mtime, st.st_size)
+
+
+class ImportEntry(object):
+
+    """ Parse result of an imported file, before the post parse
+    cycle, along with what the parse added to the scope.
+    """
+
+    def __init__(self, result, levels, mixins, depends):
+        """
+        args:
+            result (list): Parse result
+            levels (list): Scope levels added by the file
+            mixins (list): (Mixin, outer variable count) pairs
+            depends (list): (kind, name, fingerprint) lookups the
+                            parse made in the importing scope
+        """
+        self.result = result
+        self.levels = levels
+        self.mixins = mixins
+        self.depends = depends
+
+    def valid(self, scope):
+        """ Entry can be used in scope if the lookups the parse made
+        in the importing scope still give the same result.
+        args:
+            scope (Scope): Importing scope
+        returns:
+            bool
+        """
+        for kind, name, value in self.depends:
+            found = getattr(scope, kind)(name)
+            if value is None:
+                if found:
+                    return False
+            elif fingerprint(found) != value:
+                return False
+        return True
+
+    def copy(self, memo=None):
+        """ Return a deep copy of self. Objects in memo are kept.
+        returns:
+            ImportEntry object
+        """
+        return ImportEntry(*copy.deepcopy(
+            (self.result, self.levels, self.mixins), memo),
+            depends=self.depends)
+
+
+class ImportCache(object):
+
+    """ Cache of parsed imports keyed by absolute path.
+    Entries are checked against the file's mtime and size, and
+    the content hash if those changed. Entries are never handed
+    out directly, only copies. Parsers in several threads can
+    share the cache.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def get(self, filename):
+        """ Get entry for file if file is unchanged.
+        args:
+            filename (str): path
+        returns:
+            ImportEntry OR None
+        """
+        filename = os.path.abspath(filename)
+        with self.lock:
+            if filename not in self.entries:
+                return None
+            stamp, digest, entry = self.entries[filename]
+            current = file_stamp(filename)
+            if current != stamp:
+                if file_digest(filename) != digest:
+                    del self.entries[filename]
+                    return None
+                self.entries[filename] = (current, digest, entry)
+            return entry
+
+    def add(self, filename, stamp, digest, entry):
+        """ Add entry for file.
+        args:
+            filename (str): path
+            stamp (tuple): Stat stamp taken before parsing
+            digest (str): Content hash taken before parsing
+            entry (ImportEntry): Entry
+        """
+        with self.lock:
+            self.entries[os.path.abspath(filename)] = (stamp, digest, entry)
+
+    def clear(self):
+        """ Remove all entries
+        """
+        with self.lock:
+            self.entries.clear()
+
+
+class CallCache(object):
+
+    """ Expanded output of mixin calls, keyed by mixin and the
+    values of the variables its body uses. The least recently
+    used entry is dropped when the cache is full, entries keep the
+    tick of their last use (no OrderedDict on Python 2.6). Hits and
+    misses are counted as mixin_memo_hit and mixin_memo_miss.
+    """
+
+    def __init__(self, size=512):
+        """
+        args:
+            size (int): Maximum number of entries
+        """
+        self.size = size
+        self.entries = {}
+        self.tick = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """ Get output for key.
+        args:
+            key (tuple): Mixin and variable values
+        returns:
+            list OR None
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            if stats.local.active:
+                stats.local.active.count('mixin_memo_miss')
+            return None
+        self.tick += 1
+        entry[0] = self.tick
+        self.hits += 1
+        if stats.local.active:
+            stats.local.active.count('mixin_memo_hit')
+        return entry[1]
+
+    def add(self, key, output):
+        """ Add output for key.
+        args:
+            key (tuple): Mixin and variable values
+            output (list): Parsed nodes
+        """
+        self.tick += 1
+        self.entries[key] = [self.tick, output]
+        if len(self.entries) > self.size:
+            del self.entries[min(self.entries,
+                                 key=lambda k: self.entries[k][0])]
+
+
+class BuildCache(object):
+
+    """ On-disk cache of compiled entry files. Every entry file
+    has a manifest in the cache directory with the compiled output
+    and the stamp and content hash of every file it was compiled
+    from, imports that were not found included. Manifests are keyed
+    by the absolute path of the entry file and the options string,
+    so a change in compiler options or version never reuses output.
+    """
+
+    def __init__(self, directory, options=''):
+        """
+        args:
+            directory (str): Cache directory, created if missing
+            options (str): Compiler options and version
+        """
+        self.directory = directory
+        self.options = options
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def path(self, filename):
+        """ Manifest path for entry file
+        args:
+            filename (str): path
+        returns:
+            str
+        """
+        key = '%s\0%s' % (os.path.abspath(filename), self.options)
+        name = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, name + '.json')
+
+    def get(self, filename):
+        """ Get compiled output of file if neither the file nor any
+        of its dependencies changed.
+        args:
+            filename (str): path
+        returns:
+            str OR None
+        """
+        try:
+            with open(self.path(filename)) as f:
+                manifest = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+        changed = False
+        for dep in manifest['files']:
+            path, stamp, digest = dep
+            try:
+                current = list(file_stamp(path))
+            except OSError:
+                current = None
+            if current == stamp:
+                continue
+            if current is None or digest is None \
+                    or file_digest(path) != digest:
+                return None
+            dep[1] = current
+            changed = True
+        if changed:
+            self.store(filename, manifest)
+        return manifest['css']
+
+    def add(self, filename, dependencies, css):
+        """ Add compiled output of file.
+        args:
+            filename (str): path
+            dependencies (list): Files the output was compiled from
+            css (str): Compiled output
+        """
+        files = []
+        for path in [filename] + dependencies:
+            path = os.path.abspath(path)
+            if any(path == f[0] for f in files):
+                continue
+            try:
+                files.append([path, list(file_stamp(path)),
+                              file_digest(path)])
+            except (IOError, OSError):
+                files.append([path, None, None])
+        self.store(filename, {'filename': os.path.abspath(filename),
+                              'files': files,
+                              'css': css})
+
+    def store(self, filename, manifest):
+        """ Write manifest for file. The manifest is written to a
+        temporary file first so readers never see half of it.
+        args:
+            filename (str): path
+            manifest (dict): Manifest
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(manifest, f)
+        os.rename(tmp, self.path(filename))
+
+
+def token_signature():
+    """ Signature of what the token stream of a text depends on
+    besides the text: the lexer rules, the identifier and reserved
+    name tables and the package version.
+    returns:
+        str
+    """
+    spec = (__version__, LessLexer.signature(re.UNICODE | re.IGNORECASE),
+            sorted(IDENT_TYPES.items()), sorted(DOM_ELEMENTS),
+            sorted(reserved.tokens.items()))
+    return hashlib.sha1(repr(spec).encode('utf-8')).hexdigest()
+
+
+def _frombytes(data):
+    """ Unsigned int array from bytes
+    """
+    a = array.array('I')
+    if hasattr(a, 'frombytes'):
+        a.frombytes(data)
+    else:  # Python 2
+        a.fromstring(data)
+    return a
+
+
+def _tobytes(a):
+    """ Bytes of array
+    """
+    if hasattr(a, 'tobytes'):
+        return a.tobytes()
+    return a.tostring()  # Python 2
+
+
+def dump_tokens(tokens):
+    """ Compact binary form of a token stream: one byte per token
+    type, values as indexes into a table of the distinct values, and
+    line numbers and positions as deltas, compressed with zlib.
+    args:
+        tokens (list): (type, value, lineno, lexpos) tuples
+    returns:
+        bytes
+    """
+    types = bytearray()
+    values = {}
+    index = array.array('I')
+    lines = array.array('I')
+    positions = array.array('I')
+    lineno = lexpos = 0
+    for t in tokens:
+        types.append(TOKEN_INDEX[t[0]])
+        index.append(values.setdefault(t[1], len(values)))
+        lines.append(t[2] - lineno)
+        positions.append(t[3] - lexpos)
+        lineno, lexpos = t[2], t[3]
+    table = tuple(sorted(values, key=values.get))
+    return zlib.compress(marshal.dumps(
+        (TOKEN_FORMAT, bytes(types), table, _tobytes(index),
+         _tobytes(lines), _tobytes(positions))))
+
+
+def load_tokens(data):
+    """ Token stream from its binary form, see dump_tokens()
+    args:
+        data (bytes): Binary form
+    returns:
+        list of (type, value, lineno, lexpos) tuples
+    raises:
+        ValueError
+    """
+    (form, types, table, index, lines,
+     positions) = marshal.loads(zlib.decompress(data))
+    if tuple(form) != TOKEN_FORMAT:
+        raise ValueError('Token stream format %r' % (form,))
+    types = bytearray(types)
+    index = _frombytes(index)
+    lines = _frombytes(lines)
+    positions = _frombytes(positions)
+    if not len(types) == len(index) == len(lines) == len(positions):
+        raise ValueError('Truncated token stream')
+    tokens = []
+    lineno = lexpos = 0
+    for t, i, dl, dp in zip(types, index, lines, positions):
+        lineno += dl
+        lexpos += dp
+        tokens.append((TOKEN_TYPES[t], table[i], lineno, lexpos))
+    return tokens
+
+
+class TokenCache(object):
+
+    """ On-disk cache of token streams as the lexer returns them,
+    after whitespace filtering and ';' injection. Streams are keyed
+    by the hash of the lexed text and the token signature, so a new
+    lexer or new identifier tables never reuse a stream. Hits and
+    misses are counted as token_cache_hit and token_cache_miss.
+    """
+
+    def __init__(self, directory, signature=None):
+        """
+        args:
+            directory (str): Cache directory, created if missing
+        kwargs:
+            signature (str): Token signature, see token_signature()
+        """
+        self.directory = directory
+        self.signature = signature or token_signature()
+        self.hits = 0
+        self.misses = 0
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def path(self, digest):
+        """ Stream path for text
+        args:
+            digest (str): Hash of text
+        returns:
+            str
+        """
+        key = '%s\0%s' % (digest, self.signature)
+        name = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, name + '.tok')
+
+    def get(self, digest):
+        """ Get token stream of text.
+        args:
+            digest (str): Hash of text
+        returns:
+            list OR None
+        """
+        try:
+            with open(self.path(digest), 'rb') as f:
+                tokens = load_tokens(f.read())
+        except (IOError, OSError, ValueError, EOFError, TypeError,
+                IndexError, zlib.error):
+            self.misses += 1
+            if stats.local.active:
+                stats.local.active.count('token_cache_miss')
+            return None
+        self.hits += 1
+        if stats.local.active:
+            stats.local.active.count('token_cache_hit')
+        return tokens
+
+    def add(self, digest, tokens):
+        """ Add token stream of text. The stream is written to a
+        temporary file first so readers never see half of it.
+        args:
+            digest (str): Hash of text
+            tokens (list): (type, value, lineno, lexpos) tuples
+        """
+        try:
+            data = dump_tokens(tokens)
+        except (KeyError, OverflowError, ValueError):
+            # Not a stream of the lexer
+            return
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.rename(tmp, self.path(digest))
+
+
+class CachedLexer(object):
+
+    """ Lexer wrapper replaying token streams from a TokenCache.
+    Streams of new text are recorded as the lexer returns them
+    and added to the cache when the lexer reaches the end.
+    """
+
+    def __init__(self, lexer, cache):
+        """
+        args:
+            lexer (LessLexer): Lexer
+            cache (TokenCache): Cache
+        """
+        self.lexer = lexer
+        self.cache = cache
+        self.replay = None
+        self.record = None
+        self.digest = None
+
+    def clone(self):
+        """
+        Return a new wrapper of a clone of the lexer.
+        """
+        return CachedLexer(self.lexer.clone(), self.cache)
+
+    def reset(self):
+        self.lexer.reset()
+        self.replay = self.record = None
+
+    def file(self, filename):
+        """
+        Lex file.
+        """
+        self.input(filename)
+        return self
+
+    def input(self, file):
+        """
+        Load content from `file` which can be a path or a file like
+        object, from the cache if it was lexed before.
+        """
+        self.reset()
+        if isinstance(file, string_types):
+            with open(file) as f:
+                text = f.read()
+        else:
+            text = file.read()
+        self.digest = text_digest(text)
+        tokens = self.cache.get(self.digest)
+        if tokens is not None:
+            self.replay = iter(tokens)
+        else:
+            self.record = []
+            self.lexer.input(StringIO(text))
+
+    def token(self):
+        if self.replay is not None:
+            t = next(self.replay, None)
+            if t is None:
+                return None
+            tok = lex.LexToken()
+            tok.type, tok.value, tok.lineno, tok.lexpos = t
+            return tok
+        t = self.lexer.token()
+        if self.record is not None:
+            if t is None:
+                self.cache.add(self.digest, self.record)
+                self.record = None
+            else:
+                self.record.append((t.type, t.value, t.lineno, t.lexpos))
+        return t
+
+    def __getattr__(self, name):
+        return getattr(self.lexer, name)
@@ -7,6 +7,55 @@
     See LICENSE for details.
 .. moduleauthor:: Johann T. Mariusson <jtm@robot.is>
 """
+from six import StringIO
+
+
+class StripWriter(object):
+
+    """ File like object that writes to stream with leading
+    whitespace and trailing chars left out, and optionally tab
+    inserted after every newline. Only the trailing chars seen
+    so far are held back.
+    """
+
+    def __init__(self, stream, lstrip=False, chars=None, nl='', tab=''):
+        """
+        args:
+            stream (file): File like object to write to
+        kwargs:
+            lstrip (bool): Leave out leading whitespace
+            chars (str): Trailing chars to leave out, None for
+                         whitespace
+            nl (str): Newline
+            tab (str): Indent after newlines
+        """
+        self.stream = stream
+        self.lstrip = lstrip
+        self.chars = chars
+        self.nl = nl
+        self.tab = tab
+        self.pending = ''
+
+    def write(self, s):
+        """ Write string
+        args:
+            s (str): String
+        """
+        if self.nl and self.tab:
+            s = s.replace(self.nl, self.nl + self.tab)
+        if self.lstrip:
+            s = s.lstrip()
+            if not s:
+                return
+            self.lstrip = False
+        body = s.rstrip(self.chars)
+        if body:
+            if self.pending:
+                self.stream.write(self.pending)
+            self.stream.write(body)
+            self.pending = s[len(body):]
+        else:
+            self.pending += s
 
 
 class Formatter(object):
@@ -15,10 +64,42 @@ class Formatter(object):
         self.args = args
 
     def format(self, parse):
+        """ Format parse result
+        args:
+            parse (LessParser): Parsed file
+        returns:
+            str
         """
+        out = StringIO()
+        self.write(parse, out)
+        return out.getvalue()
+
+    def write(self, parse, stream):
+        """ Write formatted parse result to stream as it is formatted,
+        so the whole output is never held in memory. Leading and
+        trailing whitespace is left out.
+        args:
+            parse (LessParser): Parsed file
+            stream (file): File like object to write to
         """
         if not parse.result:
-            return ''
+            return
+        stats = getattr(parse, 'stats', None)
+        if stats:
+            stats.start('format')
+        try:
+            self.setup()
+            stream = StripWriter(stream, lstrip=True)
+            for u in parse.result:
+                if u:
+                    u.write(self.items, stream)
+        finally:
+            if stats:
+                stats.stop()
+
+    def setup(self):
+        """ Set up format items from args
+        """
         eb = '\n'
         if self.args.xminify:
             eb = ''
@@ -39,7 +120,3 @@ class Formatter(object):
                 'ws': ' ',
                 'eb': eb
             })
-        self.out = [u.fmt(self.items)
-                    for u in parse.result
-                    if u]
-        return ''.join(self.out).strip()
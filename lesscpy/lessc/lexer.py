@@ -9,14 +9,94 @@
     See LICENSE for details.
     <jtm@robot.is>
 """
+import copy
+import hashlib
+import json
 import re
 import ply.lex as lex
-from six import string_types
+from six import binary_type, string_types
 
 from lesscpy.lib import dom
 from lesscpy.lib import css
 from lesscpy.lib import reserved
 
+# Lexer tables bundled with the package, see scripts/build_tables.py
+LEXTAB = 'lesscpy.lessc.lextab'
+
+# Token type of identifiers by value. Less keywords take precedence over
+# properties, properties over DOM elements.
+IDENT_TYPES = dict.fromkeys(dom.elements, 'css_dom')
+IDENT_TYPES.update(dict.fromkeys(css.propertys, 'css_property'))
+IDENT_TYPES.update({
+    'when': 'less_when',
+    'and': 'less_and',
+    'not': 'less_not',
+    'from': 'css_keyframe_selector',
+    'to': 'css_keyframe_selector',
+})
+# DOM elements also match lowercased identifiers
+DOM_ELEMENTS = frozenset(dom.elements)
+
+
+def ident_type(v, in_property_decl):
+    """ Token type of identifier
+    args:
+        v (str): Identifier
+        in_property_decl (bool): Lexer is in a property declaration
+    returns:
+        tuple (token type, in_property_decl)
+    """
+    c = v[0]
+    if c == '.':
+        # In some cases, only the '.' can be marked as CSS class.
+        #
+        # Example: .@{name}
+        #
+        return 'css_class', in_property_decl
+    if c == '#':
+        if len(v) in [4, 7]:
+            try:
+                int(v[1:], 16)
+                return 'css_color', in_property_decl
+            except ValueError:
+                pass
+        return 'css_id', in_property_decl
+    kind = IDENT_TYPES.get(v)
+    if kind is None and v.lower() in DOM_ELEMENTS:
+        kind = 'css_dom'
+    if kind == 'css_property':
+        return kind, True
+    if kind == 'css_dom':
+        # DOM elements can't be part of property declarations, avoids ambiguity between 'rect' DOM
+        # element and rect() CSS function.
+        if in_property_decl:
+            return 'css_ident', in_property_decl
+        return kind, in_property_decl
+    if kind:
+        return kind, in_property_decl
+    if c == '-':
+        return 'css_vendor_property', True
+    return 'css_ident', in_property_decl
+
+
+def comment_end(lexer, pos):
+    """ End of the comment opened at pos. The position of the last
+    '*/' in the input is kept on lexer, openers after it are not
+    searched.
+    args:
+        lexer (object): Has the input as lexdata
+        pos (int): Position of '/*'
+    returns:
+        int (position after '*/', -1 if the comment is not closed)
+    """
+    data = lexer.lexdata
+    last = lexer.last_comment_end
+    if last is None or last[0] is not data:
+        last = lexer.last_comment_end = (data, data.rfind('*/'))
+    if last[1] < pos + 2:
+        return -1
+    return data.find('*/', pos + 2) + 2
+
 
 class LessLexer:
     states = (
@@ -79,7 +159,8 @@ class LessLexer:
         't_bopen',
         't_bclose'
     ]
-    tokens += list(set(reserved.tokens.values()))
+    # Sorted, the token order is part of the parser table signature
+    tokens += sorted(set(reserved.tokens.values()))
     # Tokens with significant following whitespace
     significant_ws = set([
         'css_class',
@@ -100,11 +181,14 @@ class LessLexer:
     ])
     significant_ws.update(reserved.tokens.values())
 
-    def __init__(self):
-        self.build(reflags=re.UNICODE | re.IGNORECASE)
-        self.last = None
-        self.next_ = None
-        self.pretok = True
+    def __init__(self, optimize=True):
+        """
+        Kwargs:
+            optimize (bool): Load the bundled lexer tables if they were
+                             generated from the current rules
+        """
+        self.build(optimize=optimize, reflags=re.UNICODE | re.IGNORECASE)
+        self.reset()
 
     def t_css_filter(self, t):
         (r'\[[^\]]*\]'
@@ -150,42 +234,11 @@ class LessLexer:
          '|\\\[^\s\r\n0-9a-f])*)'
          '|\.')
         v = t.value.strip()
-        c = v[0]
-        if c == '.':
-            # In some cases, only the '.' can be marked as CSS class.
-            #
-            # Example: .@{name}
-            #
-            t.type = 'css_class'
-            if t.lexer.lexstate != "iselector":
-                # Selector-chaining case (a.b.c), we are already in state 'iselector'
-                t.lexer.push_state("iselector")
-        elif c == '#':
-            t.type = 'css_id'
-            if len(v) in [4, 7]:
-                try:
-                    int(v[1:], 16)
-                    t.type = 'css_color'
-                except ValueError:
-                    pass
-        elif v == 'when':
-            t.type = 'less_when'
-        elif v == 'and':
-            t.type = 'less_and'
-        elif v == 'not':
-            t.type = 'less_not'
-        elif v in ('from', 'to'):
-            t.type = 'css_keyframe_selector'
-        elif v in css.propertys:
-            t.type = 'css_property'
-            t.lexer.in_property_decl = True
-        elif (v in dom.elements or v.lower() in dom.elements) and not t.lexer.in_property_decl:
-            # DOM elements can't be part of property declarations, avoids ambiguity between 'rect' DOM
-            # element and rect() CSS function.
-            t.type = 'css_dom'
-        elif c == '-':
-            t.type = 'css_vendor_property'
-            t.lexer.in_property_decl = True
+        t.type, t.lexer.in_property_decl = ident_type(
+            v, t.lexer.in_property_decl)
+        if t.type == 'css_class' and t.lexer.lexstate != "iselector":
+            # Selector-chaining case (a.b.c), we are already in state 'iselector'
+            t.lexer.push_state("iselector")
         t.value = v
         return t
 
@@ -311,7 +364,7 @@ class LessLexer:
         (r'data:[^\)]+'
          '|(([a-z]+://)?'
          '('
-         '(/?[\.a-z:]+[\w\.:]*[\\/][\\/]?)+'
+         '(/?[\.a-z:][\w\.:]*[\\/][\\/]?)+'
          '|([a-z][\w\.\-]+(\.[a-z0-9]+))'
          '(\#[a-z]+)?)'
          ')+')
@@ -332,9 +385,17 @@ class LessLexer:
         t.lexer.lineno += t.value.count('\n')
 
     def t_css_comment(self, t):
-        r'(/\*(.|\n|\r)*?\*/)'
-        t.lexer.lineno += t.value.count('\n')
-        pass
+        r'/\*'
+        # The end is found with str.find(), a pattern would scan to the
+        # end of the input for every opener after the last '*/'.
+        end = comment_end(t.lexer, t.lexpos)
+        if end < 0:
+            # Not a comment, '/' is a literal
+            t.type = t.value = '/'
+            t.lexer.lexpos = t.lexpos + 1
+            return t
+        t.lexer.lineno += t.lexer.lexdata.count('\n', t.lexpos, end)
+        t.lexer.lexpos = end
 
     def t_less_comment(self, t):
         r'//.*'
@@ -452,15 +513,82 @@ class LessLexer:
         t.lexer.skip(1)
 
     # Build the lexer
-    def build(self, **kwargs):
+    def build(self, optimize=False, **kwargs):
+        """
+        Build the lexer. With optimize the bundled tables are used when
+        they match the rules, nothing is ever written.
+        """
+        reflags = kwargs.get('reflags', int(re.VERBOSE))
+        if optimize and self.tables_current(reflags):
+            kwargs.update(optimize=True, lextab=LEXTAB)
         self.lexer = lex.lex(module=self, **kwargs)
         # State-tracking variable, see http://www.dabeaz.com/ply/ply.html#ply_nn18
         self.lexer.in_property_decl = False
+        # Input and position of its last '*/', see comment_end()
+        self.lexer.last_comment_end = None
+
+    @classmethod
+    def signature(cls, reflags):
+        """
+        Signature of the lexer rules: tokens, literals, states, flags and
+        the pattern of every rule, in the order PLY tries them.
+        """
+        rules = sorted((f.__code__.co_firstlineno, name,
+                        getattr(f, 'regex', f.__doc__))
+                       for name, f in vars(cls).items()
+                       if name.startswith('t_') and callable(f))
+        # Patterns are byte strings on Python 2, JSON escapes their
+        # characters the same on both versions.
+        spec = (cls.tokens, cls.literals, cls.states, int(reflags),
+                [(name, pattern.decode('latin-1')
+                  if isinstance(pattern, binary_type) else pattern)
+                 for _, name, pattern in rules])
+        return hashlib.sha1(json.dumps(spec).encode('ascii')).hexdigest()
+
+    @classmethod
+    def tables_current(cls, reflags):
+        """
+        The bundled lexer tables exist, are for this PLY version and were
+        generated from the current rules. Tables that fail to load, for
+        one with a syntax error on this Python version, are not current
+        and the lexer is built in memory.
+        """
+        try:
+            tables = __import__(LEXTAB, fromlist=['_lexsignature'])
+        except Exception:
+            return False
+        return (getattr(tables, '_tabversion', None) == lex.__tabversion__
+                and getattr(tables, '_lexsignature', None) ==
+                cls.signature(reflags))
+
+    def clone(self):
+        """
+        Return a new lexer sharing the compiled rules of this one.
+        Used to lex imported files without rebuilding the lexer.
+        """
+        clone = copy.copy(self)
+        clone.lexer = self.lexer.clone()
+        clone.reset()
+        return clone
+
+    def reset(self):
+        """
+        Reset lexer state (line number, state stack and token
+        hacks) so the lexer can be reused for new input.
+        """
+        self.last = None
+        self.next_ = None
+        self.pretok = True
+        self.lexer.lineno = 1
+        self.lexer.lexstatestack = []
+        self.lexer.begin('INITIAL')
+        self.lexer.in_property_decl = False
 
     def file(self, filename):
         """
         Lex file.
         """
+        self.reset()
         with open(filename) as f:
             self.lexer.input(f.read())
         return self
@@ -470,6 +598,7 @@ class LessLexer:
         Load lexer with content from `file` which can be a path or a file
         like object.
         """
+        self.reset()
         if isinstance(file, string_types):
             with open(file) as f:
                 self.lexer.input(f.read())
@@ -491,6 +620,10 @@ class LessLexer:
         while True:
             t = self.lexer.token()
             if not t:
+                # Drop the input, a lexer kept for reuse would
+                # otherwise hold on to the whole file.
+                self.lexer.input('')
+                self.lexer.last_comment_end = None
                 return t
             if t.type == 't_ws' and (
                 self.pretok or (self.last
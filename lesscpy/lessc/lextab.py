@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('css_charset', 'css_class', 'css_color', 'css_comment', 'css_dom', 'css_filter', 'css_font_face', 'css_id', 'css_ident', 'css_import', 'css_important', 'css_keyframe_selector', 'css_keyframes', 'css_media', 'css_media_feature', 'css_media_type', 'css_ms_filter', 'css_namespace', 'css_number', 'css_page', 'css_property', 'css_string', 'css_uri', 'css_vendor_hack', 'css_vendor_property', 'css_viewport', 'less_and', 'less_arguments', 'less_comment', 'less_not', 'less_open_format', 'less_variable', 'less_when', 't_and', 't_bclose', 't_bopen', 't_colon', 't_comma', 't_eclose', 't_eopen', 't_isclose', 't_isopen', 't_not', 't_only', 't_pclose', 't_popen', 't_semicolon', 't_tilde', 't_ws'))
+_lexreflags   = 34
+_lexliterals  = '<>=%!/*-+&'
+_lexstateinfo = {'INITIAL': 'inclusive', 'parn': 'inclusive', 'escapequotes': 'inclusive', 'escapeapostrophe': 'inclusive', 'istringquotes': 'inclusive', 'istringapostrophe': 'inclusive', 'iselector': 'inclusive', 'mediaquery': 'inclusive', 'import': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_css_filter>\\[[^\\]]*\\]|(not|lang|nth-[a-z\\-]+)\\(.+\\)|and[ \t]\\([^><=\\{]+\\))|(?P<t_css_ms_filter>(?:progid:|DX\\.)[^;\\(]*)|(?P<t_t_bopen>\\{)|(?P<t_t_bclose>\\})|(?P<t_t_colon>:)|(?P<t_t_comma>,)|(?P<t_css_number>-?(\\d*\\.\\d+|\\d+)(s|%|in|ex|[ecm]m|p[txc]|deg|g?rad|ms?|k?hz|dpi|dpcm|dppx)?)|(?P<t_css_ident>([\\-\\.\\#]?([_a-z]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])([_a-z0-9\\-]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])*)|\\.)|(?P<t_less_variable>@@?[\\w-]+|@\\{[^@\\}]+\\})|(?P<t_css_color>\\#[0-9]([0-9a-f]{5}|[0-9a-f]{2}))|(?P<t_newline>[\\n\\r]+)|(?P<t_css_comment>/\\*)|(?P<t_less_comment>//.*)|(?P<t_css_important>!\\s*important)|(?P<t_t_ws>[ \\t\\f\\v]+)|(?P<t_t_popen>\\()|(?P<t_less_open_format>%\\()|(?P<t_t_pclose>\\))|(?P<t_t_semicolon>;)|(?P<t_t_eopen>~"|~\\\')|(?P<t_t_tilde>~)|(?P<t_css_string>"[^"@]*"|\\\'[^\\\'@]*\\\')|(?P<t_t_isopen>"|\\\')', [None, ('t_css_filter', 'css_filter'), None, ('t_css_ms_filter', 'css_ms_filter'), ('t_t_bopen', 't_bopen'), ('t_t_bclose', 't_bclose'), ('t_t_colon', 't_colon'), ('t_t_comma', 't_comma'), ('t_css_number', 'css_number'), None, None, ('t_css_ident', 'css_ident'), None, None, None, ('t_less_variable', 'less_variable'), ('t_css_color', 'css_color'), None, ('t_newline', 'newline'), ('t_css_comment', 'css_comment'), ('t_less_comment', 'less_comment'), ('t_css_important', 'css_important'), ('t_t_ws', 't_ws'), ('t_t_popen', 't_popen'), ('t_less_open_format', 'less_open_format'), ('t_t_pclose', 't_pclose'), ('t_t_semicolon', 't_semicolon'), ('t_t_eopen', 't_eopen'), ('t_t_tilde', 't_tilde'), ('t_css_string', 'css_string'), ('t_t_isopen', 't_isopen')])], 'parn': [('(?P<t_parn_css_uri>data:[^\\)]+|(([a-z]+://)?((/?[\\.a-z:][\\w\\.:]*[\\/][\\/]?)+|([a-z][\\w\\.\\-]+(\\.[a-z0-9]+))(\\#[a-z]+)?))+)|(?P<t_parn_css_ident>(([_a-z]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\r\n\\s0-9a-f])([_a-z0-9\\-]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\r\n\\s0-9a-f])*))|(?P<t_parn_t_pclose>\\))', [None, ('t_parn_css_uri', 'css_uri'), None, None, None, None, None, None, None, ('t_parn_css_ident', 'css_ident'), None, None, None, ('t_parn_t_pclose', 't_pclose')]), ('(?P<t_css_filter>\\[[^\\]]*\\]|(not|lang|nth-[a-z\\-]+)\\(.+\\)|and[ \t]\\([^><=\\{]+\\))|(?P<t_css_ms_filter>(?:progid:|DX\\.)[^;\\(]*)|(?P<t_t_bopen>\\{)|(?P<t_t_bclose>\\})|(?P<t_t_colon>:)|(?P<t_t_comma>,)|(?P<t_css_number>-?(\\d*\\.\\d+|\\d+)(s|%|in|ex|[ecm]m|p[txc]|deg|g?rad|ms?|k?hz|dpi|dpcm|dppx)?)|(?P<t_css_ident>([\\-\\.\\#]?([_a-z]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])([_a-z0-9\\-]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])*)|\\.)|(?P<t_less_variable>@@?[\\w-]+|@\\{[^@\\}]+\\})|(?P<t_css_color>\\#[0-9]([0-9a-f]{5}|[0-9a-f]{2}))|(?P<t_newline>[\\n\\r]+)|(?P<t_css_comment>/\\*)|(?P<t_less_comment>//.*)|(?P<t_css_important>!\\s*important)|(?P<t_t_ws>[ \\t\\f\\v]+)|(?P<t_t_popen>\\()|(?P<t_less_open_format>%\\()|(?P<t_t_pclose>\\))|(?P<t_t_semicolon>;)|(?P<t_t_eopen>~"|~\\\')|(?P<t_t_tilde>~)|(?P<t_css_string>"[^"@]*"|\\\'[^\\\'@]*\\\')|(?P<t_t_isopen>"|\\\')', [None, ('t_css_filter', 'css_filter'), None, ('t_css_ms_filter', 'css_ms_filter'), ('t_t_bopen', 't_bopen'), ('t_t_bclose', 't_bclose'), ('t_t_colon', 't_colon'), ('t_t_comma', 't_comma'), ('t_css_number', 'css_number'), None, None, ('t_css_ident', 'css_ident'), None, None, None, ('t_less_variable', 'less_variable'), ('t_css_color', 'css_color'), None, ('t_newline', 'newline'), ('t_css_comment', 'css_comment'), ('t_less_comment', 'less_comment'), ('t_css_important', 'css_important'), ('t_t_ws', 't_ws'), ('t_t_popen', 't_popen'), ('t_less_open_format', 'less_open_format'), ('t_t_pclose', 't_pclose'), ('t_t_semicolon', 't_semicolon'), ('t_t_eopen', 't_eopen'), ('t_t_tilde', 't_tilde'), ('t_css_string', 'css_string'), ('t_t_isopen', 't_isopen')])], 'escapequotes': [('(?P<t_escapequotes_less_variable>@\\{[^@"\\}]+\\})|(?P<t_escapequotes_t_eclose>")', [None, ('t_escapequotes_less_variable', 'less_variable'), ('t_escapequotes_t_eclose', 't_eclose')]), ('(?P<t_css_filter>\\[[^\\]]*\\]|(not|lang|nth-[a-z\\-]+)\\(.+\\)|and[ \t]\\([^><=\\{]+\\))|(?P<t_css_ms_filter>(?:progid:|DX\\.)[^;\\(]*)|(?P<t_t_bopen>\\{)|(?P<t_t_bclose>\\})|(?P<t_t_colon>:)|(?P<t_t_comma>,)|(?P<t_css_number>-?(\\d*\\.\\d+|\\d+)(s|%|in|ex|[ecm]m|p[txc]|deg|g?rad|ms?|k?hz|dpi|dpcm|dppx)?)|(?P<t_css_ident>([\\-\\.\\#]?([_a-z]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])([_a-z0-9\\-]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])*)|\\.)|(?P<t_less_variable>@@?[\\w-]+|@\\{[^@\\}]+\\})|(?P<t_css_color>\\#[0-9]([0-9a-f]{5}|[0-9a-f]{2}))|(?P<t_newline>[\\n\\r]+)|(?P<t_css_comment>/\\*)|(?P<t_less_comment>//.*)|(?P<t_css_important>!\\s*important)|(?P<t_t_ws>[ \\t\\f\\v]+)|(?P<t_t_popen>\\()|(?P<t_less_open_format>%\\()|(?P<t_t_pclose>\\))|(?P<t_t_semicolon>;)|(?P<t_t_eopen>~"|~\\\')|(?P<t_t_tilde>~)|(?P<t_css_string>"[^"@]*"|\\\'[^\\\'@]*\\\')|(?P<t_t_isopen>"|\\\')', [None, ('t_css_filter', 'css_filter'), None, ('t_css_ms_filter', 'css_ms_filter'), ('t_t_bopen', 't_bopen'), ('t_t_bclose', 't_bclose'), ('t_t_colon', 't_colon'), ('t_t_comma', 't_comma'), ('t_css_number', 'css_number'), None, None, ('t_css_ident', 'css_ident'), None, None, None, ('t_less_variable', 'less_variable'), ('t_css_color', 'css_color'), None, ('t_newline', 'newline'), ('t_css_comment', 'css_comment'), ('t_less_comment', 'less_comment'), ('t_css_important', 'css_important'), ('t_t_ws', 't_ws'), ('t_t_popen', 't_popen'), ('t_less_open_format', 'less_open_format'), ('t_t_pclose', 't_pclose'), ('t_t_semicolon', 't_semicolon'), ('t_t_eopen', 't_eopen'), ('t_t_tilde', 't_tilde'), ('t_css_string', 'css_string'), ('t_t_isopen', 't_isopen')])], 'escapeapostrophe': [("(?P<t_escapeapostrophe_less_variable>@\\{[^@\\'\\}]+\\})|(?P<t_escapeapostrophe_t_eclose>\\')", [None, ('t_escapeapostrophe_less_variable', 'less_variable'), ('t_escapeapostrophe_t_eclose', 't_eclose')]), ('(?P<t_css_filter>\\[[^\\]]*\\]|(not|lang|nth-[a-z\\-]+)\\(.+\\)|and[ \t]\\([^><=\\{]+\\))|(?P<t_css_ms_filter>(?:progid:|DX\\.)[^;\\(]*)|(?P<t_t_bopen>\\{)|(?P<t_t_bclose>\\})|(?P<t_t_colon>:)|(?P<t_t_comma>,)|(?P<t_css_number>-?(\\d*\\.\\d+|\\d+)(s|%|in|ex|[ecm]m|p[txc]|deg|g?rad|ms?|k?hz|dpi|dpcm|dppx)?)|(?P<t_css_ident>([\\-\\.\\#]?([_a-z]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])([_a-z0-9\\-]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])*)|\\.)|(?P<t_less_variable>@@?[\\w-]+|@\\{[^@\\}]+\\})|(?P<t_css_color>\\#[0-9]([0-9a-f]{5}|[0-9a-f]{2}))|(?P<t_newline>[\\n\\r]+)|(?P<t_css_comment>/\\*)|(?P<t_less_comment>//.*)|(?P<t_css_important>!\\s*important)|(?P<t_t_ws>[ \\t\\f\\v]+)|(?P<t_t_popen>\\()|(?P<t_less_open_format>%\\()|(?P<t_t_pclose>\\))|(?P<t_t_semicolon>;)|(?P<t_t_eopen>~"|~\\\')|(?P<t_t_tilde>~)|(?P<t_css_string>"[^"@]*"|\\\'[^\\\'@]*\\\')|(?P<t_t_isopen>"|\\\')', [None, ('t_css_filter', 'css_filter'), None, ('t_css_ms_filter', 'css_ms_filter'), ('t_t_bopen', 't_bopen'), ('t_t_bclose', 't_bclose'), ('t_t_colon', 't_colon'), ('t_t_comma', 't_comma'), ('t_css_number', 'css_number'), None, None, ('t_css_ident', 'css_ident'), None, None, None, ('t_less_variable', 'less_variable'), ('t_css_color', 'css_color'), None, ('t_newline', 'newline'), ('t_css_comment', 'css_comment'), ('t_less_comment', 'less_comment'), ('t_css_important', 'css_important'), ('t_t_ws', 't_ws'), ('t_t_popen', 't_popen'), ('t_less_open_format', 'less_open_format'), ('t_t_pclose', 't_pclose'), ('t_t_semicolon', 't_semicolon'), ('t_t_eopen', 't_eopen'), ('t_t_tilde', 't_tilde'), ('t_css_string', 'css_string'), ('t_t_isopen', 't_isopen')])], 'istringquotes': [('(?P<t_istringquotes_less_variable>@\\{[^@"\\}]+\\})|(?P<t_istringquotes_css_string>[^"@]+)|(?P<t_istringquotes_t_isclose>")', [None, ('t_istringquotes_less_variable', 'less_variable'), ('t_istringquotes_css_string', 'css_string'), ('t_istringquotes_t_isclose', 't_isclose')]), ('(?P<t_css_filter>\\[[^\\]]*\\]|(not|lang|nth-[a-z\\-]+)\\(.+\\)|and[ \t]\\([^><=\\{]+\\))|(?P<t_css_ms_filter>(?:progid:|DX\\.)[^;\\(]*)|(?P<t_t_bopen>\\{)|(?P<t_t_bclose>\\})|(?P<t_t_colon>:)|(?P<t_t_comma>,)|(?P<t_css_number>-?(\\d*\\.\\d+|\\d+)(s|%|in|ex|[ecm]m|p[txc]|deg|g?rad|ms?|k?hz|dpi|dpcm|dppx)?)|(?P<t_css_ident>([\\-\\.\\#]?([_a-z]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])([_a-z0-9\\-]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])*)|\\.)|(?P<t_less_variable>@@?[\\w-]+|@\\{[^@\\}]+\\})|(?P<t_css_color>\\#[0-9]([0-9a-f]{5}|[0-9a-f]{2}))|(?P<t_newline>[\\n\\r]+)|(?P<t_css_comment>/\\*)|(?P<t_less_comment>//.*)|(?P<t_css_important>!\\s*important)|(?P<t_t_ws>[ \\t\\f\\v]+)|(?P<t_t_popen>\\()|(?P<t_less_open_format>%\\()|(?P<t_t_pclose>\\))|(?P<t_t_semicolon>;)|(?P<t_t_eopen>~"|~\\\')|(?P<t_t_tilde>~)|(?P<t_css_string>"[^"@]*"|\\\'[^\\\'@]*\\\')|(?P<t_t_isopen>"|\\\')', [None, ('t_css_filter', 'css_filter'), None, ('t_css_ms_filter', 'css_ms_filter'), ('t_t_bopen', 't_bopen'), ('t_t_bclose', 't_bclose'), ('t_t_colon', 't_colon'), ('t_t_comma', 't_comma'), ('t_css_number', 'css_number'), None, None, ('t_css_ident', 'css_ident'), None, None, None, ('t_less_variable', 'less_variable'), ('t_css_color', 'css_color'), None, ('t_newline', 'newline'), ('t_css_comment', 'css_comment'), ('t_less_comment', 'less_comment'), ('t_css_important', 'css_important'), ('t_t_ws', 't_ws'), ('t_t_popen', 't_popen'), ('t_less_open_format', 'less_open_format'), ('t_t_pclose', 't_pclose'), ('t_t_semicolon', 't_semicolon'), ('t_t_eopen', 't_eopen'), ('t_t_tilde', 't_tilde'), ('t_css_string', 'css_string'), ('t_t_isopen', 't_isopen')])], 'istringapostrophe': [("(?P<t_istringapostrophe_less_variable>@\\{[^@\\'\\}]+\\})|(?P<t_istringapostrophe_css_string>[^\\'@]+)|(?P<t_istringapostrophe_t_isclose>\\')", [None, ('t_istringapostrophe_less_variable', 'less_variable'), ('t_istringapostrophe_css_string', 'css_string'), ('t_istringapostrophe_t_isclose', 't_isclose')]), ('(?P<t_css_filter>\\[[^\\]]*\\]|(not|lang|nth-[a-z\\-]+)\\(.+\\)|and[ \t]\\([^><=\\{]+\\))|(?P<t_css_ms_filter>(?:progid:|DX\\.)[^;\\(]*)|(?P<t_t_bopen>\\{)|(?P<t_t_bclose>\\})|(?P<t_t_colon>:)|(?P<t_t_comma>,)|(?P<t_css_number>-?(\\d*\\.\\d+|\\d+)(s|%|in|ex|[ecm]m|p[txc]|deg|g?rad|ms?|k?hz|dpi|dpcm|dppx)?)|(?P<t_css_ident>([\\-\\.\\#]?([_a-z]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])([_a-z0-9\\-]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])*)|\\.)|(?P<t_less_variable>@@?[\\w-]+|@\\{[^@\\}]+\\})|(?P<t_css_color>\\#[0-9]([0-9a-f]{5}|[0-9a-f]{2}))|(?P<t_newline>[\\n\\r]+)|(?P<t_css_comment>/\\*)|(?P<t_less_comment>//.*)|(?P<t_css_important>!\\s*important)|(?P<t_t_ws>[ \\t\\f\\v]+)|(?P<t_t_popen>\\()|(?P<t_less_open_format>%\\()|(?P<t_t_pclose>\\))|(?P<t_t_semicolon>;)|(?P<t_t_eopen>~"|~\\\')|(?P<t_t_tilde>~)|(?P<t_css_string>"[^"@]*"|\\\'[^\\\'@]*\\\')|(?P<t_t_isopen>"|\\\')', [None, ('t_css_filter', 'css_filter'), None, ('t_css_ms_filter', 'css_ms_filter'), ('t_t_bopen', 't_bopen'), ('t_t_bclose', 't_bclose'), ('t_t_colon', 't_colon'), ('t_t_comma', 't_comma'), ('t_css_number', 'css_number'), None, None, ('t_css_ident', 'css_ident'), None, None, None, ('t_less_variable', 'less_variable'), ('t_css_color', 'css_color'), None, ('t_newline', 'newline'), ('t_css_comment', 'css_comment'), ('t_less_comment', 'less_comment'), ('t_css_important', 'css_important'), ('t_t_ws', 't_ws'), ('t_t_popen', 't_popen'), ('t_less_open_format', 'less_open_format'), ('t_t_pclose', 't_pclose'), ('t_t_semicolon', 't_semicolon'), ('t_t_eopen', 't_eopen'), ('t_t_tilde', 't_tilde'), ('t_css_string', 'css_string'), ('t_t_isopen', 't_isopen')])], 'iselector': [('(?P<t_iselector_less_variable>@\\{[^@\\}]+\\})|(?P<t_iselector_t_eclose>"|\\\')|(?P<t_iselector_css_filter>\\[[^\\]]*\\]|(not|lang|nth-[a-z\\-]+)\\(.+\\)|and[ \t]\\([^><\\{]+\\))|(?P<t_iselector_css_class>[_a-z0-9\\-]+)|(?P<t_iselector_t_ws>[ \\t\\f\\v]+)|(?P<t_iselector_t_bopen>\\{)|(?P<t_iselector_t_colon>:)', [None, ('t_iselector_less_variable', 'less_variable'), ('t_iselector_t_eclose', 't_eclose'), ('t_iselector_css_filter', 'css_filter'), None, ('t_iselector_css_class', 'css_class'), ('t_iselector_t_ws', 't_ws'), ('t_iselector_t_bopen', 't_bopen'), ('t_iselector_t_colon', 't_colon')]), ('(?P<t_css_filter>\\[[^\\]]*\\]|(not|lang|nth-[a-z\\-]+)\\(.+\\)|and[ \t]\\([^><=\\{]+\\))|(?P<t_css_ms_filter>(?:progid:|DX\\.)[^;\\(]*)|(?P<t_t_bopen>\\{)|(?P<t_t_bclose>\\})|(?P<t_t_colon>:)|(?P<t_t_comma>,)|(?P<t_css_number>-?(\\d*\\.\\d+|\\d+)(s|%|in|ex|[ecm]m|p[txc]|deg|g?rad|ms?|k?hz|dpi|dpcm|dppx)?)|(?P<t_css_ident>([\\-\\.\\#]?([_a-z]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])([_a-z0-9\\-]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])*)|\\.)|(?P<t_less_variable>@@?[\\w-]+|@\\{[^@\\}]+\\})|(?P<t_css_color>\\#[0-9]([0-9a-f]{5}|[0-9a-f]{2}))|(?P<t_newline>[\\n\\r]+)|(?P<t_css_comment>/\\*)|(?P<t_less_comment>//.*)|(?P<t_css_important>!\\s*important)|(?P<t_t_ws>[ \\t\\f\\v]+)|(?P<t_t_popen>\\()|(?P<t_less_open_format>%\\()|(?P<t_t_pclose>\\))|(?P<t_t_semicolon>;)|(?P<t_t_eopen>~"|~\\\')|(?P<t_t_tilde>~)|(?P<t_css_string>"[^"@]*"|\\\'[^\\\'@]*\\\')|(?P<t_t_isopen>"|\\\')', [None, ('t_css_filter', 'css_filter'), None, ('t_css_ms_filter', 'css_ms_filter'), ('t_t_bopen', 't_bopen'), ('t_t_bclose', 't_bclose'), ('t_t_colon', 't_colon'), ('t_t_comma', 't_comma'), ('t_css_number', 'css_number'), None, None, ('t_css_ident', 'css_ident'), None, None, None, ('t_less_variable', 'less_variable'), ('t_css_color', 'css_color'), None, ('t_newline', 'newline'), ('t_css_comment', 'css_comment'), ('t_less_comment', 'less_comment'), ('t_css_important', 'css_important'), ('t_t_ws', 't_ws'), ('t_t_popen', 't_popen'), ('t_less_open_format', 'less_open_format'), ('t_t_pclose', 't_pclose'), ('t_t_semicolon', 't_semicolon'), ('t_t_eopen', 't_eopen'), ('t_t_tilde', 't_tilde'), ('t_css_string', 'css_string'), ('t_t_isopen', 't_isopen')])], 'mediaquery': [('(?P<t_mediaquery_t_not>not)|(?P<t_mediaquery_t_only>only)|(?P<t_mediaquery_t_and>and)|(?P<t_mediaquery_t_popen>\\()|(?P<t_mediaquery_css_media_type>all|aural|braille|handheld|print|projection|screen|tty|tv|embossed|speech)|(?P<t_mediaquery_css_media_feature>width|min-width|max-width|height|min-height|max-height|device-width|min-device-width|max-device-width|device-height|min-device-height|max-device-height|orientation|aspect-ratio|min-aspect-ratio|max-aspect-ratio|device-aspect-ratio|min-device-aspect-ratio|max-device-aspect-ratio|color|min-color|max-color|color-index|min-color-index|max-color-index|monochrome|min-monochrome|max-monochrome|resolution|min-resolution|max-resolution|scan|grid|-webkit-min-device-pixel-ratio|min--moz-device-pixel-ratio|-o-min-device-pixel-ratio|min-device-pixel-ratio)|(?P<t_mediaquery_t_bopen>\\{)|(?P<t_mediaquery_t_semicolon>;)', [None, ('t_mediaquery_t_not', 't_not'), ('t_mediaquery_t_only', 't_only'), ('t_mediaquery_t_and', 't_and'), ('t_mediaquery_t_popen', 't_popen'), ('t_mediaquery_css_media_type', 'css_media_type'), ('t_mediaquery_css_media_feature', 'css_media_feature'), ('t_mediaquery_t_bopen', 't_bopen'), ('t_mediaquery_t_semicolon', 't_semicolon')]), ('(?P<t_css_filter>\\[[^\\]]*\\]|(not|lang|nth-[a-z\\-]+)\\(.+\\)|and[ \t]\\([^><=\\{]+\\))|(?P<t_css_ms_filter>(?:progid:|DX\\.)[^;\\(]*)|(?P<t_t_bopen>\\{)|(?P<t_t_bclose>\\})|(?P<t_t_colon>:)|(?P<t_t_comma>,)|(?P<t_css_number>-?(\\d*\\.\\d+|\\d+)(s|%|in|ex|[ecm]m|p[txc]|deg|g?rad|ms?|k?hz|dpi|dpcm|dppx)?)|(?P<t_css_ident>([\\-\\.\\#]?([_a-z]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])([_a-z0-9\\-]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])*)|\\.)|(?P<t_less_variable>@@?[\\w-]+|@\\{[^@\\}]+\\})|(?P<t_css_color>\\#[0-9]([0-9a-f]{5}|[0-9a-f]{2}))|(?P<t_newline>[\\n\\r]+)|(?P<t_css_comment>/\\*)|(?P<t_less_comment>//.*)|(?P<t_css_important>!\\s*important)|(?P<t_t_ws>[ \\t\\f\\v]+)|(?P<t_t_popen>\\()|(?P<t_less_open_format>%\\()|(?P<t_t_pclose>\\))|(?P<t_t_semicolon>;)|(?P<t_t_eopen>~"|~\\\')|(?P<t_t_tilde>~)|(?P<t_css_string>"[^"@]*"|\\\'[^\\\'@]*\\\')|(?P<t_t_isopen>"|\\\')', [None, ('t_css_filter', 'css_filter'), None, ('t_css_ms_filter', 'css_ms_filter'), ('t_t_bopen', 't_bopen'), ('t_t_bclose', 't_bclose'), ('t_t_colon', 't_colon'), ('t_t_comma', 't_comma'), ('t_css_number', 'css_number'), None, None, ('t_css_ident', 'css_ident'), None, None, None, ('t_less_variable', 'less_variable'), ('t_css_color', 'css_color'), None, ('t_newline', 'newline'), ('t_css_comment', 'css_comment'), ('t_less_comment', 'less_comment'), ('t_css_important', 'css_important'), ('t_t_ws', 't_ws'), ('t_t_popen', 't_popen'), ('t_less_open_format', 'less_open_format'), ('t_t_pclose', 't_pclose'), ('t_t_semicolon', 't_semicolon'), ('t_t_eopen', 't_eopen'), ('t_t_tilde', 't_tilde'), ('t_css_string', 'css_string'), ('t_t_isopen', 't_isopen')])], 'import': [('(?P<t_import_css_media_type>all|aural|braille|handheld|print|projection|screen|tty|tv|embossed|speech)|(?P<t_import_t_semicolon>;)', [None, ('t_import_css_media_type', 'css_media_type'), ('t_import_t_semicolon', 't_semicolon')]), ('(?P<t_css_filter>\\[[^\\]]*\\]|(not|lang|nth-[a-z\\-]+)\\(.+\\)|and[ \t]\\([^><=\\{]+\\))|(?P<t_css_ms_filter>(?:progid:|DX\\.)[^;\\(]*)|(?P<t_t_bopen>\\{)|(?P<t_t_bclose>\\})|(?P<t_t_colon>:)|(?P<t_t_comma>,)|(?P<t_css_number>-?(\\d*\\.\\d+|\\d+)(s|%|in|ex|[ecm]m|p[txc]|deg|g?rad|ms?|k?hz|dpi|dpcm|dppx)?)|(?P<t_css_ident>([\\-\\.\\#]?([_a-z]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])([_a-z0-9\\-]|[\x80-\xff]|\\\\[0-9a-f]{1,6}|\\\\[^\\s\r\n0-9a-f])*)|\\.)|(?P<t_less_variable>@@?[\\w-]+|@\\{[^@\\}]+\\})|(?P<t_css_color>\\#[0-9]([0-9a-f]{5}|[0-9a-f]{2}))|(?P<t_newline>[\\n\\r]+)|(?P<t_css_comment>/\\*)|(?P<t_less_comment>//.*)|(?P<t_css_important>!\\s*important)|(?P<t_t_ws>[ \\t\\f\\v]+)|(?P<t_t_popen>\\()|(?P<t_less_open_format>%\\()|(?P<t_t_pclose>\\))|(?P<t_t_semicolon>;)|(?P<t_t_eopen>~"|~\\\')|(?P<t_t_tilde>~)|(?P<t_css_string>"[^"@]*"|\\\'[^\\\'@]*\\\')|(?P<t_t_isopen>"|\\\')', [None, ('t_css_filter', 'css_filter'), None, ('t_css_ms_filter', 'css_ms_filter'), ('t_t_bopen', 't_bopen'), ('t_t_bclose', 't_bclose'), ('t_t_colon', 't_colon'), ('t_t_comma', 't_comma'), ('t_css_number', 'css_number'), None, None, ('t_css_ident', 'css_ident'), None, None, None, ('t_less_variable', 'less_variable'), ('t_css_color', 'css_color'), None, ('t_newline', 'newline'), ('t_css_comment', 'css_comment'), ('t_less_comment', 'less_comment'), ('t_css_important', 'css_important'), ('t_t_ws', 't_ws'), ('t_t_popen', 't_popen'), ('t_less_open_format', 'less_open_format'), ('t_t_pclose', 't_pclose'), ('t_t_semicolon', 't_semicolon'), ('t_t_eopen', 't_eopen'), ('t_t_tilde', 't_tilde'), ('t_css_string', 'css_string'), ('t_t_isopen', 't_isopen')])]}
+_lexstateignore = {'INITIAL': '', 'parn': '', 'escapequotes': '', 'escapeapostrophe': '', 'istringquotes': '', 'istringapostrophe': '', 'iselector': '', 'mediaquery': '', 'import': ''}
+_lexstateerrorf = {'INITIAL': 't_error', 'parn': 't_error', 'escapequotes': 't_error', 'escapeapostrophe': 't_error', 'istringquotes': 't_error', 'istringapostrophe': 't_error', 'iselector': 't_error', 'mediaquery': 't_error', 'import': 't_error'}
+_lexstateeoff = {}
+_lexsignature = 'd8c17a8878e1cc414998137b81d0be2a1aaa142e'
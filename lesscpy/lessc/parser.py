@@ -14,6 +14,7 @@
 
 from __future__ import print_function
 
+import copy
 import os
 import tempfile
 import sys
@@ -21,7 +22,11 @@ import ply.yacc
 import six
 
 from . import lexer
+from . import scanner
 from . import utility
+from .cache import (CachedLexer, CallCache, ImportEntry, file_digest,
+                    file_stamp)
+from .stats import TimedLexer
 from .scope import Scope
 from .color import Color
 from lesscpy.exceptions import CompilationError
@@ -35,8 +40,13 @@ class ErrorRegister(object):
     """
     def __init__(self):
         self.errors = []
+        self.count = 0
+        self.error_count = 0
 
     def register(self, error):
+        self.count += 1
+        if error[0] != 'W':
+            self.error_count += 1
         self.errors.append(error)  # we could store them or just raise here.
 
     def __close__(self):
@@ -53,9 +63,14 @@ class PrintErrorRegister(object):
     """
     def __init__(self):
         self.has_errored = False
+        self.count = 0
+        self.error_count = 0
 
     def register(self, error):
         self.has_errored = True
+        self.count += 1
+        if error[0] != 'W':
+            self.error_count += 1
         color = '\x1b[31m' if error[0] == 'E' else '\x1b[33m'
         print("%s%s\x1b[0m" % (color, error), end='\x1b[0m', file=sys.stderr)
 
@@ -65,6 +80,10 @@ class PrintErrorRegister(object):
     close = __close__
 
 
+# Parser tables bundled with the package, see scripts/build_tables.py
+YACCTAB = 'lesscpy.lessc.yacctab'
+
+
 class LessParser(object):
     precedence = (
         ('left', '+', '-'),
@@ -74,66 +93,109 @@ class LessParser(object):
     def __init__(self,
                  lex_optimize=True,
                  yacc_optimize=True,
-                 tabfile='yacctab',
+                 tabfile=None,
                  yacc_debug=False,
                  scope=None,
-                 outputdir=tempfile.gettempdir(),
+                 outputdir=None,
                  importlvl=0,
                  verbose=False,
-                 fail_with_exc=False
+                 fail_with_exc=False,
+                 import_cache=None,
+                 stats=None,
+                 mixin_cache=512,
+                 mixin_budget=10000,
+                 fast_lexer=False,
+                 token_cache=None
                  ):
         """ Parser object
 
             Kwargs:
-                lex_optimize (bool): Optimize lexer
-                yacc_optimize (bool): Optimize parser
-                tabfile (str): Yacc tab filename
+                lex_optimize (bool): Use the bundled lexer tables
+                yacc_optimize (bool): Unused, parser tables are always
+                                      used when they match the grammar
+                tabfile (str): Parser table module, defaults to the
+                               bundled tables
                 yacc_debug (bool): yacc debug mode
                 scope (Scope): Inherited scope
-                outputdir (str): Output (debugging)
+                outputdir (str): Output directory of yacc debug mode
                 importlvl (int): Import depth
                 verbose (bool): Verbose mode
                 fail_with_exc (bool): Throw exception on syntax error instead
                                       of printing to stderr
+                import_cache (ImportCache): Cache for parsed imports
+                stats (Stats): Record phase times and event counts
+                mixin_cache (int): Number of mixin calls to memoize,
+                                   0 disables memoization
+                mixin_budget (int): Number of mixin calls a mixin call
+                                    may expand to, recursively
+                fast_lexer (bool): Use the hand-written scanner, it
+                                   produces the tokens of the lexer
+                                   and reads the input in chunks
+                token_cache (TokenCache): Replay the tokens of text
+                                          lexed before
         """
         self.verbose = verbose
-        self.importlvl = importlvl
-        self.lex = lexer.LessLexer()
-        if not tabfile:
-            tabfile = 'yacctab'
+        if fast_lexer:
+            self.lex = scanner.LessScanner()
+        else:
+            self.lex = lexer.LessLexer(optimize=lex_optimize)
+        if token_cache is not None:
+            self.lex = CachedLexer(self.lex, token_cache)
 
         self.ignored = ('css_comment', 'less_comment',
                         'css_vendor_hack')
 
         self.tokens = [t for t in self.lex.tokens
                        if t not in self.ignored]
+        # The tables are checked against the grammar signature and
+        # built in memory if they do not match, nothing is written.
         self.parser = ply.yacc.yacc(
             module=self,
             start='tunit',
             debug=yacc_debug,
-            optimize=yacc_optimize,
-            tabmodule=tabfile,
-            outputdir=outputdir
+            optimize=False,
+            write_tables=False,
+            tabmodule=tabfile or YACCTAB,
+            outputdir=outputdir or tempfile.gettempdir()
         )
-        self.scope = scope if scope else Scope()
+        # Lexer and LR parser per import depth, see _parse_import()
+        self._levels = [(self.lex, self.parser)]
+        self.fail_with_exc = fail_with_exc
+        self.import_cache = import_cache
+        self.stats = stats
+        self.mixin_cache = mixin_cache
+        self.mixin_budget = mixin_budget
+        self.reset(scope, importlvl)
+
+    def reset(self, scope=None, importlvl=0):
+        """ Reset compilation state. The lexer and parser tables
+        are kept, so one parser can compile any number of files.
+            Kwargs:
+                scope (Scope): Inherited scope
+                importlvl (int): Import depth
+        """
+        self.importlvl = importlvl
+        if not scope:
+            scope = Scope()
+        if scope.calls is None and self.mixin_cache:
+            scope.calls = CallCache(self.mixin_cache)
+        scope.budget = self.mixin_budget
+        self.scope = scope
         self.stash = {}
         self.result = None
         self.target = None
-        self.fail_with_exc = fail_with_exc
-        if fail_with_exc:
+        self.dependencies = []
+        if self.fail_with_exc:
             self.register = ErrorRegister()
         else:
             self.register = PrintErrorRegister()
 
-
     def parse(self, filename=None, file=None, debuglevel=0):
         """ Parse file.
         kwargs:
             filename (str): File to parse
             debuglevel (int): Parser debuglevel
         """
-        self.scope.push()
-
         if not file:
             # We use a path.
             file = filename
@@ -147,14 +209,132 @@ class LessParser(object):
             else:
                 filename = '(stream)'
 
+        if self.stats:
+            with self.stats:
+                self._parse(file, filename, debuglevel)
+        else:
+            self._parse(file, filename, debuglevel)
+        self.register.close()
+
+    def _parse(self, file, filename, debuglevel=0, cache=None):
+        """ Parse file into current scope and run post parse cycle.
+        args:
+            file (mixed): Path or file like object
+            filename (str): Name of target
+        kwargs:
+            debuglevel (int): Parser debuglevel
+            cache (ImportCache): Store parse result here if it did
+                                 not depend on the importing scope
+        """
+        if cache is not None:
+            stamp = file_stamp(filename)
+            digest = file_digest(filename)
+            errors = self.register.count
+            watch = self.scope.watch()
+        self.scope.push()
         self.target = filename
         if self.verbose and not self.fail_with_exc:
             print('Compiling target: %s' % filename, file=sys.stderr)
-        self.result = self.parser.parse(
-            file, lexer=self.lex, debug=debuglevel)
+        lexer = self.lex
+        if self.stats:
+            lexer = TimedLexer(lexer, self.stats)
+            self.stats.start('parse')
+        try:
+            self.result = self.parser.parse(
+                file, lexer=lexer, debug=debuglevel)
+        finally:
+            if self.stats:
+                self.stats.stop()
+            if cache is not None:
+                self.scope.unwatch(watch)
+        if (cache is not None and not watch.external
+                and errors == self.register.count):
+            cache.add(filename, stamp, digest, self._import_entry(watch))
 
         self.post_parse()
-        self.register.close()
+
+    def _parse_import(self, filename):
+        """ Parse imported file with this parser. Each import depth
+        gets its own lexer and LR parser state (sharing the tables),
+        so the importing file can resume when the import is done.
+        args:
+            filename (str): Path to imported file
+        returns:
+            list (parse result)
+        """
+        for watch in self.scope.watches:
+            # Only files without imports are cached
+            watch.external = True
+        cache = self.import_cache
+        if cache is not None and self.scope.scopename:
+            # Imported into a block, the parse depends on it.
+            cache = None
+        depth = self.importlvl + 1
+        while len(self._levels) <= depth:
+            lex, parser = self._levels[0]
+            self._levels.append((lex.clone(), copy.copy(parser)))
+        state = (self.lex, self.parser, self.importlvl,
+                 self.target, self.result)
+        self.lex, self.parser = self._levels[depth]
+        self.importlvl = depth
+        try:
+            entry = cache.get(filename) if cache is not None else None
+            if self.stats:
+                self.stats.count('import')
+            if entry is not None and entry.valid(self.scope):
+                if self.stats:
+                    self.stats.count('import_cached')
+                self._splice_import(filename, entry)
+            else:
+                self._parse(filename, filename, cache=cache)
+            return self.result
+        finally:
+            (self.lex, self.parser, self.importlvl,
+             self.target, self.result) = state
+
+    def _import_entry(self, watch):
+        """ Cache entry for the file just parsed. Variables from the
+        importing scope, captured by mixins for closures, are left
+        out of the copy.
+        args:
+            watch (Watch): Watch started before the parse
+        returns:
+            ImportEntry object
+        """
+        outer = [v for s in self.scope[:watch.level]
+                 for v in s['__variables__'].values()]
+        entry = ImportEntry(self.result, self.scope[watch.level:],
+                            watch.mixins, watch.depends)
+        entry = entry.copy(dict((id(v), v) for v in outer))
+        for mixin, n in entry.mixins:
+            mixin.vars = mixin.vars[n:]
+        return entry
+
+    def _splice_import(self, filename, entry):
+        """ Add a copy of a cached import to scope, as if the file
+        had been parsed, and run the post parse cycle on it.
+        args:
+            filename (str): Path to imported file
+            entry (ImportEntry): Cached entry
+        """
+        outer = [v for s in self.scope
+                 for v in s['__variables__'].values()]
+        entry = entry.copy()
+        for level in entry.levels:
+            self.scope.push()
+            self.scope.current = level['__current__']
+            for variable in level['__variables__'].values():
+                self.scope.add_variable(variable)
+            for block in level['__blocks__']:
+                self.scope.add_block(block)
+        for mixin, _ in entry.mixins:
+            mixin.vars = outer + mixin.vars
+            self.scope.add_mixin(mixin)
+        self.target = filename
+        if self.verbose and not self.fail_with_exc:
+            print('Compiling target: %s' % filename, file=sys.stderr)
+        self.result = entry.result
+        self.post_parse()
 
     def post_parse(self):
         """ Post parse cycle. nodejs version allows calls to mixins
@@ -162,12 +342,18 @@ class LessParser(object):
         to mixins until after first cycle when all names are known.
         """
         if self.result:
+            if self.stats:
+                self.stats.start('post_parse')
             out = []
-            for pu in self.result:
-                try:
-                    out.append(pu.parse(self.scope))
-                except SyntaxError as e:
-                    self.handle_error(e, 0)
+            try:
+                for pu in self.result:
+                    try:
+                        out.append(pu.parse(self.scope))
+                    except SyntaxError as e:
+                        self.handle_error(e, 0)
+            finally:
+                if self.stats:
+                    self.stats.stop()
             self.result = list(utility.flatten(out))
 
     def scopemap(self):
@@ -253,17 +439,15 @@ class LessParser(object):
                 if not fe:
                     ipath += '.less'
                 filename = "%s%s%s" % (cpath, os.sep, ipath)
+                self.dependencies.append(filename)
                 if os.path.exists(filename):
-                    recurse = LessParser(importlvl=self.importlvl + 1,
-                                         verbose=self.verbose, scope=self.scope)
-                    recurse.parse(filename=filename, debuglevel=0)
-                    p[0] = recurse.result
+                    p[0] = self._parse_import(filename)
                 else:
                     err = "Cannot import '%s', file not found" % filename
                     self.handle_error(err, p.lineno(1), 'W')
                     p[0] = None
             except ImportError as e:
-                self.handle_error(e, p)
+                self.handle_error(e, p.lineno(1))
         else:
             p[0] = Statement(list(p)[1:], p.lineno(1))
             p[0].parse(None)
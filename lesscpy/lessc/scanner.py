@@ -0,0 +1,594 @@
+# -*- coding: utf8 -*-
+"""
+.. module:: lesscpy.lessc.scanner
+    :synopsis: Hand-written scanner for LESSCSS.
+
+    Produces the token stream of LessLexer (types, values, line
+    numbers and lexer states) in one pass over the input. Rules are
+    picked by the first character instead of trying the master regex
+    of every state, and whitespace filtering and ';' injection are
+    done in the same loop. The input is read in chunks, only the
+    unscanned part of it is kept.
+
+    Copyright (c)
+    See LICENSE for details.
+"""
+import re
+
+import ply.lex as lex
+from six import string_types
+
+from lesscpy.lib import reserved
+from .lexer import LessLexer, ident_type
+
+
+def _rule(f):
+    """ Compiled pattern of a LessLexer rule
+    args:
+        f (function): Rule
+    returns:
+        pattern
+    """
+    return re.compile(getattr(f, 'regex', None) or f.__doc__,
+                      re.UNICODE | re.IGNORECASE)
+
+
+FILTER = _rule(LessLexer.t_css_filter)
+MS_FILTER = _rule(LessLexer.t_css_ms_filter)
+NUMBER = _rule(LessLexer.t_css_number)
+IDENT = _rule(LessLexer.t_css_ident)
+VARIABLE = _rule(LessLexer.t_less_variable)
+COLOR = _rule(LessLexer.t_css_color)
+NEWLINE = _rule(LessLexer.t_newline)
+LESS_COMMENT = _rule(LessLexer.t_less_comment)
+IMPORTANT = _rule(LessLexer.t_css_important)
+WS = _rule(LessLexer.t_t_ws)
+STRING = _rule(LessLexer.t_css_string)
+PARN_URI = _rule(LessLexer.t_parn_css_uri)
+PARN_IDENT = _rule(LessLexer.t_parn_css_ident)
+ISELECTOR_VARIABLE = _rule(LessLexer.t_iselector_less_variable)
+ISELECTOR_FILTER = _rule(LessLexer.t_iselector_css_filter)
+ISELECTOR_CLASS = _rule(LessLexer.t_iselector_css_class)
+MEDIA_NOT = _rule(LessLexer.t_mediaquery_t_not)
+MEDIA_ONLY = _rule(LessLexer.t_mediaquery_t_only)
+MEDIA_AND = _rule(LessLexer.t_mediaquery_t_and)
+MEDIA_TYPE = _rule(LessLexer.t_mediaquery_css_media_type)
+MEDIA_FEATURE = _rule(LessLexer.t_mediaquery_css_media_feature)
+ESCAPE_VARIABLE = {
+    'escapequotes': _rule(LessLexer.t_escapequotes_less_variable),
+    'escapeapostrophe': _rule(LessLexer.t_escapeapostrophe_less_variable),
+}
+ISTRING_VARIABLE = {
+    'istringquotes': _rule(LessLexer.t_istringquotes_less_variable),
+    'istringapostrophe': _rule(LessLexer.t_istringapostrophe_less_variable),
+}
+ISTRING = {
+    'istringquotes': (_rule(LessLexer.t_istringquotes_css_string), '"'),
+    'istringapostrophe': (_rule(LessLexer.t_istringapostrophe_css_string),
+                          "'"),
+}
+ESCAPE_CLOSE = {'escapequotes': '"', 'escapeapostrophe': "'"}
+
+LETTERS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+DIGITS = frozenset('0123456789')
+# First characters of the rules, ASCII only. Other characters try
+# every rule that can match them.
+FILTER_START = frozenset('[nNlLaA')
+MS_FILTER_START = frozenset('pPdD')
+IDENT_START = LETTERS | frozenset('_\\')
+URI_START = LETTERS | frozenset('/.:')
+CLASS_CHARS = LETTERS | DIGITS | frozenset('_-')
+WS_CHARS = frozenset(' \t\f\v')
+LITERALS = frozenset(LessLexer.literals)
+# Identifiers matched by t_css_ident, their type is set by ident_type()
+IDENT_TOKEN = 'ident'
+# Characters read from the input at a time, at least
+CHUNK_SIZE = 64 * 1024
+# Rules match within a line, except for those with a pattern below.
+# Those match no further than the first match of their pattern. A
+# match of them that fails or ends with the buffer is repeated once
+# the input is read up to there, see LessScanner.fill().
+LINE_END = re.compile('\n')
+NEWLINE_END = re.compile('[^\n\r]')
+COMMENT_END = re.compile(r'\*/')
+BRACKET_END = re.compile(r'\]')
+AND_END = re.compile('[<>{]')
+MS_FILTER_END = re.compile('[;(]')
+URI_END = re.compile(r'\)')
+VARIABLE_END = re.compile('[@}]')
+IMPORTANT_END = re.compile(r'\S')
+STRING_END = {'"': re.compile('["@]'), "'": re.compile("['@]")}
+
+
+class LessScanner(object):
+
+    """ Drop-in alternative to LessLexer, see LessParser(fast_lexer=True).
+    The rules and their order are those of LessLexer, only ASCII
+    characters are dispatched by hand.
+    """
+    tokens = LessLexer.tokens
+    significant_ws = LessLexer.significant_ws
+
+    def __init__(self):
+        self.opened = None
+        self.reset()
+
+    def clone(self):
+        """
+        Return a new scanner, scanners share all tables.
+        """
+        return LessScanner()
+
+    def reset(self):
+        """
+        Reset scanner state so the scanner can be reused for new input.
+        """
+        self.lineno = 1
+        self.lexstate = 'INITIAL'
+        self.lexstatestack = []
+        if self.opened is not None:
+            self.opened.close()
+            self.opened = None
+        self.stream = iter(())
+        # Unscanned input, position of its start in the input, file
+        # it is read from and where the patterns of fill() matched.
+        self.lexdata = ''
+        self.lexbase = 0
+        self.source = None
+        self.seen = {}
+
+    def file(self, filename):
+        """
+        Lex file.
+        """
+        self.input(filename)
+        return self
+
+    def input(self, file):
+        """
+        Load scanner with content from `file` which can be a path or a
+        file like object. The input is read as it is scanned.
+        """
+        self.reset()
+        if isinstance(file, string_types):
+            self.opened = file = open(file)
+        self.source = file
+        self.stream = self.scan(file, opened=file is self.opened)
+
+    def token(self):
+        """
+        Next token, None at the end of the input.
+        """
+        return next(self.stream, None)
+
+    def read(self):
+        """ Append a chunk of the input to the buffer. Chunks grow
+        with the buffer, a long token is not copied once per chunk.
+        returns:
+            bool (False at the end of the input)
+        """
+        if self.source is None:
+            return False
+        chunk = self.source.read(max(CHUNK_SIZE, len(self.lexdata)))
+        if not chunk:
+            self.source = None
+            return False
+        self.lexdata += chunk
+        return True
+
+    def fill(self, pos, stop):
+        """ Read input until stop matches in the buffer at or after
+        pos, or the input ends. The part of the input searched is
+        kept for every pattern, no part is searched twice.
+        args:
+            pos (int): Position in the buffer
+            stop (pattern): Pattern of at most two characters
+        returns:
+            int (position of the first match, -1 if there is none)
+        """
+        base = self.lexbase
+        start = pos
+        seen = self.seen.get(stop)
+        if seen is not None:
+            first, last, found = seen
+            if found and last >= base + pos:
+                return last - base
+            if not found and first <= base + pos:
+                start = max(pos, last - base - 1)
+        while True:
+            data = self.lexdata
+            m = stop.search(data, start)
+            if m:
+                self.seen[stop] = (base + pos, base + m.start(), True)
+                return m.start()
+            self.seen[stop] = (base + pos, base + len(data), False)
+            if not self.read():
+                return -1
+            start = max(start, len(data) - 1)
+
+    def scan(self, source, opened=False):
+        """ Token generator. Whitespace is dropped where it is not
+        significant and ';' is injected before '}', as LessLexer.token
+        does. Every rule sees the input up to the end of the line,
+        rules that match across lines call fill().
+        args:
+            source (file): Input, self.source
+            opened (bool): Source was opened by input(), close it at
+                           the end, after an error reset() does
+        """
+        fill = self.fill
+        data = ''
+        pos = base = ready = 0
+        lineno = 1
+        state = 'INITIAL'
+        stack = self.lexstatestack
+        in_property_decl = False
+        significant_ws = self.significant_ws
+        last = None
+        pretok = True
+        while True:
+            if pos >= ready:
+                if pos > CHUNK_SIZE and pos * 2 > len(data):
+                    # Drop the scanned input
+                    data = self.lexdata = data[pos:]
+                    base = self.lexbase = base + pos
+                    pos = 0
+                ready = data.find('\n', pos) + 1
+                if not ready:
+                    ready = fill(pos, LINE_END) + 1
+                    data = self.lexdata
+                if pos >= len(data):
+                    break
+                if not ready:
+                    ready = len(data)
+            c = data[pos]
+            typ = m = value = None
+            # Rules of the current state, inclusive states fall back to
+            # the INITIAL rules below.
+            if state == 'INITIAL':
+                pass
+            elif state == 'iselector':
+                if c == '@':
+                    m = ISELECTOR_VARIABLE.match(data, pos)
+                    if m is None or m.end() == len(data):
+                        fill(pos + 1, VARIABLE_END)
+                        data = self.lexdata
+                        m = ISELECTOR_VARIABLE.match(data, pos)
+                    if m:
+                        typ = 'less_variable'
+                elif c == '"' or c == "'":
+                    typ = 't_eclose'
+                    state = stack.pop()
+                elif c in FILTER_START:
+                    data = self.filter_input(pos, c)
+                    m = ISELECTOR_FILTER.match(data, pos)
+                    if m:
+                        typ = 'css_filter'
+                if typ is not None:
+                    pass
+                elif c in CLASS_CHARS or c > '\x7f':
+                    m = ISELECTOR_CLASS.match(data, pos)
+                    if m:
+                        typ = 'css_class'
+                elif c in WS_CHARS:
+                    m = WS.match(data, pos)
+                    typ = 't_ws'
+                    state = stack.pop()
+                elif c == '{':
+                    typ = 't_bopen'
+                    state = stack.pop()
+                elif c == ':':
+                    typ = 't_colon'
+                    state = stack.pop()
+            elif state == 'parn':
+                if c in URI_START or c > '\x7f':
+                    m = PARN_URI.match(data, pos)
+                    if m is not None and m.end() == len(data):
+                        fill(pos + 1, URI_END)
+                        data = self.lexdata
+                        m = PARN_URI.match(data, pos)
+                    if m:
+                        typ = 'css_uri'
+                if typ is not None:
+                    pass
+                elif c in IDENT_START or c > '\x7f':
+                    m = PARN_IDENT.match(data, pos)
+                    if m:
+                        typ = 'css_ident'
+                elif c == ')':
+                    typ = 't_pclose'
+                    state = stack.pop()
+            elif state in ISTRING:
+                rule, close = ISTRING[state]
+                if c == '@':
+                    m = ISTRING_VARIABLE[state].match(data, pos)
+                    if m is None or m.end() == len(data):
+                        fill(pos + 1, VARIABLE_END)
+                        data = self.lexdata
+                        m = ISTRING_VARIABLE[state].match(data, pos)
+                    if m:
+                        typ = 'less_variable'
+                elif c == close:
+                    typ = 't_isclose'
+                    state = stack.pop()
+                else:
+                    m = rule.match(data, pos)
+                    if m.end() == len(data):
+                        fill(pos, STRING_END[close])
+                        data = self.lexdata
+                        m = rule.match(data, pos)
+                    typ = 'css_string'
+            elif state in ESCAPE_CLOSE:
+                if c == '@':
+                    m = ESCAPE_VARIABLE[state].match(data, pos)
+                    if m is None or m.end() == len(data):
+                        fill(pos + 1, VARIABLE_END)
+                        data = self.lexdata
+                        m = ESCAPE_VARIABLE[state].match(data, pos)
+                    if m:
+                        typ = 'less_variable'
+                elif c == ESCAPE_CLOSE[state]:
+                    typ = 't_eclose'
+                    state = stack.pop()
+            elif state == 'mediaquery':
+                if c == 'n' or c == 'N':
+                    m = MEDIA_NOT.match(data, pos)
+                    if m:
+                        typ = 't_not'
+                elif c == 'o' or c == 'O':
+                    m = MEDIA_ONLY.match(data, pos)
+                    if m:
+                        typ = 't_only'
+                elif c == 'a' or c == 'A':
+                    m = MEDIA_AND.match(data, pos)
+                    if m:
+                        typ = 't_and'
+                elif c == '(':
+                    typ = 't_popen'
+                if typ is not None:
+                    pass
+                elif c in CLASS_CHARS or c > '\x7f':
+                    m = MEDIA_TYPE.match(data, pos)
+                    if m:
+                        typ = 'css_media_type'
+                    else:
+                        m = MEDIA_FEATURE.match(data, pos)
+                        if m:
+                            typ = 'css_media_feature'
+                elif c == '{':
+                    typ = 't_bopen'
+                    state = stack.pop()
+                elif c == ';':
+                    typ = 't_semicolon'
+                    # Ends an @import statement too, see LessLexer
+                    state = stack.pop()
+                    state = stack.pop()
+            elif state == 'import':
+                if c in CLASS_CHARS or c > '\x7f':
+                    m = MEDIA_TYPE.match(data, pos)
+                    if m:
+                        typ = 'css_media_type'
+                        stack.append(state)
+                        state = 'mediaquery'
+                elif c == ';':
+                    typ = 't_semicolon'
+                    state = stack.pop()
+
+            if typ is not None:
+                pass
+            elif c in WS_CHARS:
+                m = WS.match(data, pos)
+                typ = 't_ws'
+            elif c in IDENT_START:
+                if c in FILTER_START:
+                    data = self.filter_input(pos, c)
+                    m = FILTER.match(data, pos)
+                    if m:
+                        typ = 'css_filter'
+                elif c in MS_FILTER_START:
+                    m = MS_FILTER.match(data, pos)
+                    if m is not None and m.end() == len(data):
+                        fill(pos + 1, MS_FILTER_END)
+                        data = self.lexdata
+                        m = MS_FILTER.match(data, pos)
+                    if m:
+                        typ = 'css_ms_filter'
+                if typ is None:
+                    m = IDENT.match(data, pos)
+                    if m:
+                        typ = IDENT_TOKEN
+            elif c == ':':
+                typ = 't_colon'
+            elif c == ';':
+                typ = 't_semicolon'
+                in_property_decl = False
+            elif c == '\n' or c == '\r':
+                m = NEWLINE.match(data, pos)
+                if m.end() == len(data):
+                    fill(pos, NEWLINE_END)
+                    data = self.lexdata
+                    m = NEWLINE.match(data, pos)
+                lineno += m.group().count('\n')
+                pos = m.end()
+                continue
+            elif c == '{':
+                typ = 't_bopen'
+                in_property_decl = False
+            elif c == '}':
+                typ = 't_bclose'
+            elif c == '@':
+                m = VARIABLE.match(data, pos)
+                if m is None or m.end() == len(data):
+                    fill(pos + 1, VARIABLE_END)
+                    data = self.lexdata
+                    m = VARIABLE.match(data, pos)
+                if m:
+                    typ = reserved.tokens.get(m.group().lower(),
+                                              'less_variable')
+                    if typ == 'css_media':
+                        stack.append(state)
+                        state = 'mediaquery'
+                    elif typ == 'css_import':
+                        stack.append(state)
+                        state = 'import'
+            elif c == '(':
+                typ = 't_popen'
+                stack.append(state)
+                state = 'parn'
+            elif c == ')':
+                typ = 't_pclose'
+            elif c == ',':
+                typ = 't_comma'
+                in_property_decl = False
+            elif c in DIGITS or c == '-' or c == '.' or c > '\x7f':
+                m = NUMBER.match(data, pos)
+                if m:
+                    typ = 'css_number'
+                else:
+                    m = IDENT.match(data, pos)
+                    if m:
+                        typ = IDENT_TOKEN
+            elif c == '#':
+                m = IDENT.match(data, pos)
+                if m:
+                    typ = IDENT_TOKEN
+                else:
+                    m = COLOR.match(data, pos)
+                    if m:
+                        typ = 'css_color'
+            elif c == '[':
+                data = self.filter_input(pos, c)
+                m = FILTER.match(data, pos)
+                if m:
+                    typ = 'css_filter'
+            elif c == '/':
+                if data[pos + 1:pos + 2] == '*':
+                    npos = fill(pos + 2, COMMENT_END)
+                    data = self.lexdata
+                    if npos >= 0:
+                        lineno += data.count('\n', pos, npos)
+                        pos = npos + 2
+                        continue
+                m = LESS_COMMENT.match(data, pos)
+                if m:
+                    pos = m.end()
+                    continue
+            elif c == '"' or c == "'":
+                m = STRING.match(data, pos)
+                if m is None or m.end() == len(data):
+                    fill(pos + 1, STRING_END[c])
+                    data = self.lexdata
+                    m = STRING.match(data, pos)
+                if m:
+                    typ = 'css_string'
+                else:
+                    typ = 't_isopen'
+                    stack.append(state)
+                    state = ('istringquotes' if c == '"'
+                             else 'istringapostrophe')
+            elif c == '~':
+                value = data[pos:pos + 2]
+                if value == '~"' or value == "~'":
+                    typ = 't_eopen'
+                    stack.append(state)
+                    state = ('escapequotes' if value == '~"'
+                             else 'escapeapostrophe')
+                else:
+                    typ = 't_tilde'
+                    value = c
+            elif c == '!':
+                m = IMPORTANT.match(data, pos)
+                if m is None:
+                    npos = fill(pos + 1, IMPORTANT_END)
+                    if npos >= 0:
+                        fill(npos, LINE_END)
+                    data = self.lexdata
+                    m = IMPORTANT.match(data, pos)
+                if m:
+                    typ = 'css_important'
+                    value = '!important'
+            elif c == '%':
+                if data[pos + 1:pos + 2] == '(':
+                    typ = 'less_open_format'
+                    value = '%('
+                    stack.append(state)
+                    state = 'parn'
+
+            if typ is None:
+                if c not in LITERALS:
+                    raise SyntaxError("Illegal character '%s' line %d" %
+                                      (c, lineno))
+                tok = lex.LexToken()
+                tok.type = tok.value = c
+                npos = pos + 1
+            else:
+                if m is not None:
+                    npos = m.end()
+                    if value is None:
+                        value = m.group()
+                elif value is None:
+                    value = c
+                    npos = pos + 1
+                else:
+                    npos = pos + len(value)
+                if typ == 't_ws':
+                    if pretok or (last is not None
+                                  and last not in significant_ws):
+                        pos = npos
+                        continue
+                    value = ' '
+                elif typ == IDENT_TOKEN:
+                    value = value.strip()
+                    typ, in_property_decl = ident_type(value,
+                                                       in_property_decl)
+                    if typ == 'css_class' and state != 'iselector':
+                        stack.append(state)
+                        state = 'iselector'
+                tok = lex.LexToken()
+                tok.type = typ
+                tok.value = value
+                tok.lexer = self
+            tok.lineno = lineno
+            tok.lexpos = base + pos
+            if typ == 'css_string':
+                lineno += value.count('\n')
+            pos = npos
+            pretok = False
+            self.lineno = lineno
+            self.lexstate = state
+            if typ == 't_bclose' and last is not None \
+                    and last not in ('t_bopen', 't_bclose', 't_semicolon') \
+                    and state not in ESCAPE_CLOSE:
+                semicolon = lex.LexToken()
+                semicolon.type = 't_semicolon'
+                semicolon.value = ';'
+                semicolon.lineno = lineno
+                semicolon.lexpos = tok.lexpos
+                last = 't_semicolon'
+                in_property_decl = False
+                yield semicolon
+                yield tok
+                continue
+            last = tok.type
+            yield tok
+        self.lineno = lineno
+        self.lexdata = ''
+        self.source = None
+        self.seen = {}
+        if opened:
+            source.close()
+
+    def filter_input(self, pos, c):
+        """ Read the input a filter starting at pos may match
+        args:
+            pos (int): Position in the buffer
+            c (str): Character at pos
+        returns:
+            str (buffer)
+        """
+        if c == '[':
+            self.fill(pos + 1, BRACKET_END)
+        elif self.lexdata[pos:pos + 3].lower() == 'and':
+            # and(...) ends before the first of these
+            self.fill(pos + 1, AND_END)
+        return self.lexdata
@@ -9,12 +9,71 @@
 """
 import six
 
+from . import stats
 from . import utility
 
 
+class Watch(object):
+
+    """ Records lookups that reach below a scope level. Used to
+    tell whether parsing a file depended on the importing context.
+    Lookups that found nothing, or found a variable with a plain
+    value, are kept as dependencies that can be checked later.
+    Anything else marks the watch external.
+    """
+
+    def __init__(self, level):
+        """Watch
+        Args:
+            level (int): Lowest watched scope level
+        """
+        self.level = level
+        self.external = False
+        self.depends = []
+        self.mixins = []
+
+    def lookup(self, kind, name, level, found):
+        """Record lookup
+        Args:
+            kind (str): Scope method name
+            name (str): Search term
+            level (int): Level where name was found, -1 if not found
+            found (mixed): Lookup result
+        """
+        if level < 0:
+            self.depends.append((kind, name, None))
+        elif level < self.level:
+            value = fingerprint(found)
+            if value is None:
+                self.external = True
+            else:
+                self.depends.append((kind, name, value))
+
+
+def fingerprint(found):
+    """ Comparable form of a variable found by lookup
+    Args:
+        found (mixed): Lookup result
+    Returns:
+        str OR None if there is none
+    """
+    def plain(value):
+        if isinstance(value, (list, tuple)):
+            return all(plain(v) for v in value)
+        return value is None or isinstance(
+            value, six.string_types + six.integer_types + (float,))
+    value = getattr(found, 'value', None)
+    if value is not None and plain(value):
+        return repr(value)
+    return None
+
+
 class Scope(list):
 
     """ Scope class. A stack implementation.
+    Variables are indexed by name: every name maps to a stack
+    of (level, Variable) bindings, innermost last, so a lookup
+    does not walk the levels.
     """
 
     def __init__(self, init=False):
@@ -24,10 +83,17 @@ class Scope(list):
         """
         super(Scope, self).__init__()
         self._mixins = {}
+        self._variables = {}
+        self._added = 0
         if init:
             self.push()
         self.deferred = False
         self.real = []
+        self.watches = []
+        # CallCache for mixin output, see Mixin.call()
+        self.calls = None
+        # Mixin calls one deferred call may expand, see Deferred.parse()
+        self.budget = 10000
 
     def push(self):
         """Push level on scope
@@ -35,10 +101,23 @@ class Scope(list):
         self.append({
             '__variables__': {},
             '__blocks__': [],
-            '__names__': [],
+            '__names__': {},
             '__current__': None
         })
 
+    def pop(self):
+        """Pop level from scope
+        Returns:
+            dict
+        """
+        level = super(Scope, self).pop()
+        for name in level['__variables__']:
+            bindings = self._variables[name]
+            bindings.pop()
+            if not bindings:
+                del self._variables[name]
+        return level
+
     @property
     def current(self):
         return self[-1]['__current__']
@@ -57,21 +136,36 @@ class Scope(list):
                 for r in self
                 if r['__current__']]
 
-    def add_block(self, block):
+    def add_block(self, block, index=-1):
         """Add block element to scope
         Args:
             block (Block): Block object
+        Kwargs:
+            index (int): Level
         """
-        self[-1]['__blocks__'].append(block)
-        self[-1]['__names__'].append(block.raw())
+        self[index]['__blocks__'].append(block)
+        # Blocks by raw name, with a sequence number to keep
+        # the order of blocks found through different names.
+        self._added += 1
+        self[index]['__names__'].setdefault(block.raw(), []).append(
+            (self._added, block))
 
-    def remove_block(self, block, index="-1"):
+    def remove_block(self, block, index=-1):
         """Remove block element from scope
         Args:
             block (Block): Block object
+        Kwargs:
+            index (int): Level
         """
         self[index]["__blocks__"].remove(block)
-        self[index]["__names__"].remove(block.raw())
+        names = self[index]["__names__"]
+        for raw, blocks in names.items():
+            for i, (_, b) in enumerate(blocks):
+                if b is block:
+                    del blocks[i]
+                    if not blocks:
+                        del names[raw]
+                    return
 
     def add_mixin(self, mixin):
         """Add mixin to scope
@@ -83,14 +177,58 @@ class Scope(list):
             self._mixins[raw].append(mixin)
         else:
             self._mixins[raw] = [mixin]
+        for watch in self.watches:
+            watch.mixins.append(
+                (mixin, sum(len(s['__variables__'])
+                            for s in self[:watch.level])))
 
     def add_variable(self, variable):
         """Add variable to scope
         Args:
             variable (Variable): Variable object
         """
+        self._bind(variable.name, len(self) - 1, variable)
         self[-1]['__variables__'][variable.name] = variable
 
+    def add_variables(self, variables):
+        """Add variables to scope, in order. Variables that already
+        are what their name resolves to are skipped, adding them would
+        not change any lookup.
+        Args:
+            variables (list): Variable objects
+        """
+        index = self._variables
+        level = len(self) - 1
+        top = self[-1]['__variables__']
+        for variable in variables:
+            name = variable.name
+            bindings = index.get(name)
+            if bindings and bindings[-1][1] is variable:
+                continue
+            self._bind(name, level, variable)
+            top[name] = variable
+
+    def _bind(self, name, level, variable):
+        """Index variable by name
+        Args:
+            name (str): Variable name
+            level (int): Level
+            variable (Variable): Variable object
+        """
+        bindings = self._variables.get(name)
+        if bindings is None:
+            self._variables[name] = [(level, variable)]
+        elif bindings[-1][0] < level:
+            bindings.append((level, variable))
+        else:
+            for i, (at, _) in enumerate(bindings):
+                if at == level:
+                    bindings[i] = (level, variable)
+                    break
+                if at > level:
+                    bindings.insert(i, (level, variable))
+                    break
+
     def variables(self, name):
         """Search for variable by name. Searches scope top down
         Args:
@@ -98,16 +236,23 @@ class Scope(list):
         Returns:
             Variable object OR False
         """
-        if isinstance(name, tuple):
-            name = name[0]
-        if name.startswith('@{'):
-            name = '@' + name[2:-1]
-        i = len(self)
-        while i >= 0:
-            i -= 1
-            if name in self[i]['__variables__']:
-                return self[i]['__variables__'][name]
-        return False
+        if stats.local.active:
+            stats.local.active.count('variable_lookup')
+        bindings = self._variables.get(name)
+        if bindings is None:
+            if isinstance(name, tuple):
+                name = name[0]
+            if name.startswith('@{'):
+                name = '@' + name[2:-1]
+            bindings = self._variables.get(name)
+        if bindings is None:
+            if self.watches:
+                self._watched('variables', name, -1, False)
+            return False
+        level, variable = bindings[-1]
+        if self.watches:
+            self._watched('variables', name, level, variable)
+        return variable
 
     def mixins(self, name):
         """ Search mixins for name.
@@ -117,6 +262,8 @@ class Scope(list):
         Returns:
             Mixin object list OR False
         """
+        if stats.local.active:
+            stats.local.active.count('mixin_lookup')
         m = self._smixins(name)
         if m:
             return m
@@ -138,30 +285,70 @@ class Scope(list):
         Returns:
             Block object OR False
         """
-        b = self._blocks(name)
-        if b:
-            return b
-        return self._blocks(name.replace('?>?', ' '))
+        if stats.local.active:
+            stats.local.active.count('block_lookup')
+        i, b = self._blocks(name)
+        if not b:
+            spaced = name.replace('?>?', ' ')
+            if spaced != name:
+                i, b = self._blocks(spaced)
+        if self.watches:
+            self._watched('blocks', name, i, b)
+        return b
 
     def _blocks(self, name):
-        """Inner wrapper to search for blocks by name.
+        """Inner wrapper to search for blocks by name. Blocks are
+        looked up by name in every level, then blocks whose name is
+        a prefix of name are searched for an inner block.
+        Returns:
+            tuple (level, Block object) OR (-1, False)
         """
         i = len(self)
-        while i >= 0:
+        while i > 0:
             i -= 1
-            if name in self[i]['__names__']:
-                for b in self[i]['__blocks__']:
+            names = self[i]['__names__']
+            if not names:
+                continue
+            if name in names:
+                for _, b in names[name]:
                     r = b.raw()
                     if r and r == name:
-                        return b
+                        return i, b
             else:
-                for b in self[i]['__blocks__']:
+                found = []
+                for k in range(1, len(name)):
+                    if name[:k] in names:
+                        found.extend(names[name[:k]])
+                for _, b in sorted(found, key=lambda f: f[0]):
                     r = b.raw()
                     if r and name.startswith(r):
                         b = utility.blocksearch(b, name)
                         if b:
-                            return b
-        return False
+                            return i, b
+        return -1, False
+
+    def watch(self):
+        """Start recording lookups that reach below the next
+        scope level.
+        Returns:
+            Watch object
+        """
+        watch = Watch(len(self))
+        self.watches.append(watch)
+        return watch
+
+    def unwatch(self, watch):
+        """Stop recording lookups for watch
+        Args:
+            watch (Watch): Watch object
+        """
+        self.watches.remove(watch)
+
+    def _watched(self, kind, name, level, found):
+        """Report lookup to all watches
+        """
+        for watch in self.watches:
+            watch.lookup(kind, name, level, found)
 
     def update(self, scope, at=0):
         """Update scope. Add another scope to this one.
@@ -172,9 +359,11 @@ class Scope(list):
         """
         if hasattr(scope, '_mixins') and not at:
             self._mixins.update(scope._mixins)
+        for name, variable in scope[at]['__variables__'].items():
+            self._bind(name, at, variable)
         self[at]['__variables__'].update(scope[at]['__variables__'])
-        self[at]['__blocks__'].extend(scope[at]['__blocks__'])
-        self[at]['__names__'].extend(scope[at]['__names__'])
+        for block in scope[at]['__blocks__']:
+            self.add_block(block, at)
 
     def swap(self, name):
         """ Swap variable name for variable value
@@ -0,0 +1,135 @@
+# -*- coding: utf8 -*-
+"""
+.. module:: lesscpy.lessc.stats
+    :synopsis: Compilation statistics.
+
+    Copyright (c)
+    See LICENSE for details.
+"""
+import threading
+import time
+
+timer = getattr(time, 'perf_counter', time.time)
+
+
+class _Local(threading.local):
+    # Stats being recorded in this thread, see Stats.__enter__().
+    # Nodes and the scope count events into it, parsers in other
+    # threads record into their own.
+    active = None
+
+
+local = _Local()
+
+
+class Stats(object):
+
+    """ Wall time per compilation phase and event counts.
+    Phase times are exclusive: time spent in a phase started
+    inside another phase (the lexer during the parse, mixin
+    calls during the post parse cycle) only counts for the
+    inner one.
+    """
+
+    def __init__(self):
+        self.times = {}
+        self.counts = {}
+        self._stack = []
+        self._previous = []
+
+    def __enter__(self):
+        """ Record events of nodes and scopes
+        """
+        self._previous.append(local.active)
+        local.active = self
+        return self
+
+    def __exit__(self, *exc):
+        local.active = self._previous.pop()
+
+    def clear(self):
+        """ Forget recorded times and counts
+        """
+        self.times = {}
+        self.counts = {}
+
+    def count(self, event, n=1):
+        """ Count event
+        args:
+            event (str): Event name
+        kwargs:
+            n (int): Number of events
+        """
+        self.counts[event] = self.counts.get(event, 0) + n
+
+    def start(self, phase):
+        """ Start phase, the current phase is paused
+        args:
+            phase (str): Phase name
+        """
+        now = timer()
+        if self._stack:
+            self._add(self._stack[-1], now)
+        self._stack.append([phase, now])
+
+    def stop(self):
+        """ Stop current phase, the phase it was started in resumes
+        """
+        now = timer()
+        self._add(self._stack.pop(), now)
+        if self._stack:
+            self._stack[-1][1] = now
+
+    def _add(self, entry, now):
+        phase, start = entry
+        self.times[phase] = self.times.get(phase, 0.0) + now - start
+
+    def table(self):
+        """ Summary table
+        returns:
+            str
+        """
+        total = sum(self.times.values())
+        rows = ['%-16s %12s %7s' % ('phase', 'time', '%')]
+        for phase, t in sorted(self.times.items(), key=lambda i: -i[1]):
+            rows.append('%-16s %10.1fms %6.1f%%' % (
+                phase, t * 1000, t * 100 / total if total else 0))
+        rows.append('%-16s %10.1fms' % ('total', total * 1000))
+        rows.append('')
+        rows.append('%-16s %12s' % ('event', 'count'))
+        for event, n in sorted(self.counts.items()):
+            rows.append('%-16s %12d' % (event, n))
+        return '\n'.join(rows)
+
+
+class TimedLexer(object):
+
+    """ Lexer wrapper recording time spent in the lexer
+    as the 'lex' phase.
+    """
+
+    def __init__(self, lexer, stats):
+        """
+        args:
+            lexer (LessLexer): Lexer
+            stats (Stats): Stats
+        """
+        self.lexer = lexer
+        self.stats = stats
+
+    def input(self, file):
+        self.stats.start('lex')
+        try:
+            self.lexer.input(file)
+        finally:
+            self.stats.stop()
+
+    def token(self):
+        self.stats.start('lex')
+        try:
+            return self.lexer.token()
+        finally:
+            self.stats.stop()
+
+    def __getattr__(self, name):
+        return getattr(self.lexer, name)
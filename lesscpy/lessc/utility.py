@@ -10,26 +10,50 @@
 
 from __future__ import print_function
 
-import collections
 import itertools
 import math
 import re
 import sys
 from six import string_types
 
+try:
+    from collections.abc import Iterable
+except ImportError:  # Python 2
+    from collections import Iterable
+
+
 def flatten(lst):
-    """Flatten list.
+    """Flatten list. Iterative, nested lists are walked
+    with a stack of iterators instead of nested generators.
     Args:
         lst (list): List to flatten
     Returns:
         generator
     """
-    for elm in lst:
-        if isinstance(elm, collections.Iterable) and not isinstance(elm, string_types):
-            for sub in flatten(elm):
-                yield sub
-        else:
+    stack = []
+    it = iter(lst)
+    while True:
+        for elm in it:
+            if not isinstance(elm, string_types) \
+                    and isinstance(elm, Iterable):
+                stack.append(it)
+                it = iter(elm)
+                break
             yield elm
+        else:
+            if not stack:
+                return
+            it = stack.pop()
+
+
+def is_iterable(elm):
+    """Check if element is a list of tokens rather than a token.
+    Args:
+        elm (mixed): Element
+    Returns:
+        bool
+    """
+    return not isinstance(elm, string_types) and isinstance(elm, Iterable)
 
 
 def pairwise(lst):
@@ -0,0 +1,259 @@
+
+# yacctab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "tunitleft+-left*/css_charset css_class css_color css_dom css_filter css_font_face css_id css_ident css_import css_important css_keyframe_selector css_keyframes css_media css_media_feature css_media_type css_ms_filter css_namespace css_number css_page css_property css_string css_uri css_vendor_property css_viewport less_and less_arguments less_not less_open_format less_variable less_when t_and t_bclose t_bopen t_colon t_comma t_eclose t_eopen t_isclose t_isopen t_not t_only t_pclose t_popen t_semicolon t_tilde t_ws tunit                    : unit_list\n         unit_list                : unit_list unit\n                                     | unit\n         unit                     : statement\n                                     | variable_decl\n                                     | block_decl\n                                     | mixin_decl\n                                     | call_mixin\n                                     | import_statement\n         statement            : css_charset t_ws css_string t_semicolon\n                                 | css_namespace t_ws css_string t_semicolon\n         statement            : css_namespace t_ws word css_string t_semicolon\n         import_statement     : css_import t_ws string t_semicolon\n                                 | css_import t_ws css_string t_semicolon\n                                 | css_import t_ws css_string media_query_list t_semicolon\n                                 | css_import t_ws fcall t_semicolon\n                                 | css_import t_ws fcall media_query_list t_semicolon\n         block_decl               : block_open declaration_list brace_close\n         block_decl               : identifier t_semicolon\n         block_open                : identifier brace_open\n         block_open                : media_query_decl brace_open\n         block_open                : css_font_face t_ws brace_open\n        block_open                 : css_keyframe_selector brace_open\n                                      | number brace_open\n         mixin_decl                : open_mixin declaration_list brace_close\n         open_mixin                : identifier t_popen mixin_args_list t_pclose brace_open\n                                      | identifier t_popen mixin_args_list t_pclose mixin_guard brace_open\n         mixin_guard               : less_when mixin_guard_cond_list\n         mixin_guard_cond_list    : mixin_guard_cond_list t_comma mixin_guard_cond\n                                     | mixin_guard_cond_list less_and mixin_guard_cond\n         mixin_guard_cond_list     : mixin_guard_cond\n         mixin_guard_cond          : less_not t_popen argument mixin_guard_cmp argument t_pclose\n                                      | less_not t_popen argument t_pclose\n         mixin_guard_cond          : t_popen argument mixin_guard_cmp argument t_pclose\n                                      | t_popen argument t_pclose\n         mixin_guard_cmp           : '>'\n                                      | '<'\n                                      | '='\n                                      | '>' '='\n                                      | '=' '<'\n         call_mixin                : identifier t_popen mixin_args_list t_pclose t_semicolon\n         mixin_args_list          : less_arguments\n         mixin_args_list          : mixin_args_list t_comma mixin_args\n                                     | mixin_args_list t_semicolon mixin_args\n         mixin_args_list          : mixin_args\n         mixin_args                : mixin_args argument\n         mixin_args                : argument\n                                      | mixin_kwarg\n         mixin_args                : empty\n         mixin_kwarg                : variable t_colon mixin_kwarg_arg_list\n         mixin_kwarg_arg_list       : mixin_kwarg_arg_list argument\n         mixin_kwarg_arg_list      : argument\n         declaration_list           : declaration_list declaration\n                                       | declaration\n                                       | empty\n         declaration                : variable_decl\n                                       | property_decl\n                                       | block_decl\n                                       | mixin_decl\n                                       | call_mixin\n                                       | import_statement\n         variable_decl            : variable t_colon style_list t_semicolon\n         property_decl           : prop_open style_list t_semicolon\n                                    | prop_open style_list css_important t_semicolon\n                                    | prop_open empty t_semicolon\n         property_decl           : prop_open less_arguments t_semicolon\n         prop_open               : '*' prop_open\n         prop_open               : property t_colon\n                                    | vendor_property t_colon\n                                    | word t_colon\n         style_list              : style_list style\n                                    | style_list t_comma style\n                                    | style_list t_ws style\n         style_list              : style\n         style                   : expression\n                                    | string\n                                    | word\n                                    | property\n                                    | vendor_property\n                                    | estring\n         identifier                : identifier_list\n                                      | page\n                                      | page filter\n         identifier                : t_popen estring t_pclose\n         identifier_list           : identifier_list t_comma identifier_group\n         identifier_list           : identifier_group\n         identifier_list           : css_keyframes t_ws css_ident\n                                      | css_keyframes t_ws css_ident t_ws\n         identifier_list           : css_viewport\n                                      | css_viewport t_ws\n         identifier_group          : identifier_group child_selector ident_parts\n                                      | identifier_group '+' ident_parts\n                                      | identifier_group general_sibling_selector ident_parts\n                                      | identifier_group '*'\n         identifier_group          : ident_parts\n         ident_parts               : ident_parts ident_part\n                                      | ident_parts filter_group\n         ident_parts               : ident_part\n                                      | selector\n                                      | filter_group\n         media_query_decl            : css_media t_ws\n                                        | css_media t_ws media_query_list\n         media_query_list            : media_query_list t_comma media_query\n         media_query_list            : media_query\n         media_query                 : media_type\n                                        | media_type media_query_expression_list\n                                        | not media_type\n                                        | not media_type media_query_expression_list\n                                        | only media_type\n                                        | only media_type media_query_expression_list\n         media_query                 : media_query_expression media_query_expression_list\n                                        | media_query_expression\n         media_query_expression_list : media_query_expression_list and media_query_expression\n                                        | and media_query_expression\n         media_query_expression      : t_popen css_media_feature t_pclose\n                                        | t_popen css_media_feature t_colon media_query_value t_pclose\n         media_query_value           : number\n                                        | variable\n                                        | word\n                                        | color\n                                        | expression\n         selector                  : '*'\n                                      | '+'\n                                      | child_selector\n                                      | general_sibling_selector\n         ident_part                : iclass\n                                      | id\n                                      | dom\n                                      | combinator\n                                      | color\n         ident_part                : combinator vendor_property\n         filter_group              : filter_group filter\n         filter_group              : filter\n         filter                    : css_filter\n                                      | css_filter t_ws\n                                      | t_colon word\n                                      | t_colon vendor_property\n                                      | t_colon vendor_property t_ws\n                                      | t_colon css_property\n                                      | t_colon css_property t_ws\n                                      | t_colon css_filter\n                                      | t_colon css_filter t_ws\n                                      | t_colon t_colon word\n                                      | t_colon t_colon vendor_property\n         ms_filter       : css_ms_filter\n                            | css_ms_filter t_ws\n         fcall           : word t_popen argument_list t_pclose\n                            | property t_popen argument_list t_pclose\n                            | vendor_property t_popen argument_list t_pclose\n                            | less_open_format argument_list t_pclose\n                            | ms_filter t_popen argument_list t_pclose\n         argument_list       : empty\n         argument_list       : argument_list argument\n                                | argument_list t_comma argument\n         argument_list       : argument\n         argument        : expression\n                            | string\n                            | estring\n                            | word\n                            | id\n                            | css_uri\n                            | '='\n                            | fcall\n         expression             : expression '+' expression\n                                   | expression '-' expression\n                                   | expression '/' expression\n                                   | expression '*' expression\n                                   | word '/' expression\n         expression             : '-' t_popen expression t_pclose\n         expression             : t_popen expression t_pclose\n         expression              : factor\n         factor                  : color\n                                    | number\n                                    | variable\n                                    | css_dom\n                                    | fcall\n         estring                 : t_eopen style_list t_eclose\n                                    | t_eopen identifier_list t_eclose\n         string_part             : variable\n                                    | css_string\n         string_part_list        : string_part_list string_part\n         string_part_list        : string_part\n         string                  : t_isopen string_part_list t_isclose\n         string                  : css_string\n         variable                : '-' variable\n         variable                : t_popen variable t_pclose\n         variable                : less_variable\n                                    | less_variable t_ws\n         color                   : css_color\n                                    | css_color t_ws\n         number                    : css_number\n                                      | css_number t_ws\n         dom                       : css_dom\n                                      | css_dom t_ws\n         word                      : css_ident\n                                      | css_ident t_ws\n         class                     : css_class\n                                      | css_class t_ws\n         iclass_part               : less_variable\n                                      | less_variable t_ws\n                                      | class\n         iclass_part_list          : iclass_part_list iclass_part\n         iclass_part_list          : iclass_part\n         iclass                    : iclass_part_list\n         id                        : css_id\n                                      | css_id t_ws\n         property                  : css_property\n                                      | css_property t_ws\n         page                      : css_page\n                                      | css_page t_ws\n         vendor_property           : css_vendor_property\n                                      | css_vendor_property t_ws\n         media_type                : css_media_type\n                                      | css_media_type t_ws\n         combinator                : '&' t_ws\n                                      | '&'\n         child_selector            : '>' t_ws\n                                      | '>'\n         general_sibling_selector  : t_tilde t_ws\n                                      | t_tilde\n         brace_open                : t_bopen\n         brace_close               : t_bclose\n         and                       : t_and t_ws\n                                      | t_and\n         not                       : t_not t_ws\n                                      | t_not\n         only                      : t_only t_ws\n                                      | t_only\n        empty                        :"
+    
+_lr_action_items = {'css_charset':([0,2,3,4,5,6,7,8,9,58,84,157,159,186,215,216,218,254,255,257,271,291,299,300,],[10,10,-3,-4,-5,-6,-7,-8,-9,-2,-19,-18,-222,-25,-10,-11,-62,-13,-14,-16,-12,-41,-15,-17,]),'css_namespace':([0,2,3,4,5,6,7,8,9,58,84,157,159,186,215,216,218,254,255,257,271,291,299,300,],[11,11,-3,-4,-5,-6,-7,-8,-9,-2,-19,-18,-222,-25,-10,-11,-62,-13,-14,-16,-12,-41,-15,-17,]),'css_import':([0,2,3,4,5,6,7,8,9,14,16,58,69,70,71,72,73,74,75,76,77,84,86,87,88,97,99,100,157,158,159,186,198,215,216,218,243,245,246,254,255,257,271,290,291,292,299,300,315,],[18,18,-3,-4,-5,-6,-7,-8,-9,18,18,-2,18,-54,-55,-56,-57,-58,-59,-60,-61,-19,-20,-221,18,-21,-23,-24,-18,-53,-222,-25,-22,-10,-11,-62,-63,-65,-66,-13,-14,-16,-12,-64,-41,-26,-15,-17,-27,]),'-':([0,2,3,4,5,6,7,8,9,14,16,17,19,20,29,48,51,58,61,67,68,69,70,71,72,73,74,75,76,77,78,83,84,85,86,87,88,89,92,93,95,96,97,99,100,104,118,121,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,155,156,157,158,159,160,164,165,166,167,168,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,189,190,192,193,198,215,216,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,234,235,236,237,238,239,240,241,243,245,246,248,249,250,251,252,253,254,255,257,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,308,309,310,311,312,313,314,315,319,320,322,324,325,327,328,329,332,338,340,341,342,343,346,347,],[19,19,-3,-4,-5,-6,-7,-8,-9,19,19,19,19,-187,-191,-205,-189,-2,138,-195,-211,19,-54,-55,-56,-57,-58,-59,-60,-61,138,-207,-19,138,-20,-221,19,19,-187,138,-185,-188,-21,-23,-24,-192,-206,-190,-174,138,-74,223,-76,-77,-78,-79,-80,19,138,-171,19,-184,-172,-173,-175,-176,138,-196,-212,-18,-53,-222,138,-67,-68,-69,-70,-208,138,-47,-48,-49,223,-157,-158,-159,-160,-161,-162,-163,-174,-25,-186,-188,138,-172,-175,-22,-10,-11,-62,-71,138,138,138,138,138,138,138,138,138,138,138,223,-174,19,-182,-179,-180,138,-152,-155,138,-63,-65,-66,138,138,-46,138,-177,-178,-13,-14,-16,-12,-72,-73,-164,-165,-166,-167,-168,138,138,138,223,-170,-183,-181,-150,-153,138,138,-64,-41,-26,138,138,138,-52,-15,-17,329,-147,-148,-149,-169,-154,-151,-27,138,-51,329,-173,-174,-172,223,19,138,138,-36,-37,-38,138,-39,-40,]),'t_popen':([0,2,3,4,5,6,7,8,9,14,15,16,17,19,20,25,26,27,29,30,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,83,84,85,86,87,88,89,92,93,95,96,97,99,100,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,164,165,166,167,168,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,192,193,195,196,197,198,199,210,211,212,213,214,215,216,218,219,220,221,222,223,224,225,226,227,228,229,230,233,234,235,236,237,238,239,240,241,242,243,245,246,248,249,250,251,252,253,254,255,257,259,261,262,270,271,272,273,274,275,276,277,278,279,280,281,283,284,285,286,287,288,289,290,291,292,294,295,296,297,298,299,300,302,304,308,309,310,311,312,313,314,315,318,319,320,322,326,329,330,331,332,338,340,341,342,343,346,347,],[17,17,-3,-4,-5,-6,-7,-8,-9,17,85,17,89,89,-187,-81,-82,-133,-191,-86,-89,-209,-124,-95,-123,-125,-122,-98,-100,-99,-126,-127,-128,-129,-130,-204,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-2,139,-136,-137,-139,-141,-195,-211,17,-54,-55,-56,-57,-58,-59,-60,-61,139,-122,-207,-19,139,-20,-221,17,89,-187,139,-185,-188,-21,-23,-24,-83,209,-192,-94,-90,-210,-96,-97,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,-174,139,-74,-75,-76,227,228,229,-80,230,139,-171,89,-184,-172,-173,-175,-176,139,241,-145,-143,-144,-138,-140,-142,-196,-212,-18,-53,-222,139,-67,-68,-69,-70,-208,139,-47,-48,-49,-156,-157,-158,227,-160,-161,-162,-163,-174,228,229,-25,-186,-84,-188,139,-172,-175,209,209,227,-22,-85,-91,-92,-93,-87,-200,-10,-11,-62,-71,139,139,139,139,139,139,139,139,139,139,139,227,89,-182,-179,-180,139,-152,-155,139,-146,-63,-65,-66,139,139,-46,139,-177,-178,-13,-14,-16,209,209,-224,-88,-12,-72,-73,-164,-165,-166,-167,-168,139,139,139,-170,-183,-181,-150,-153,139,139,-64,-41,-26,319,139,139,139,-52,-15,-17,209,-223,322,-147,-148,-149,-169,-154,-151,-27,332,139,-51,322,227,230,319,319,139,139,-36,-37,-38,139,-39,-40,]),'less_variable':([0,2,3,4,5,6,7,8,9,14,16,17,19,20,27,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,83,84,85,86,87,88,89,92,93,95,96,97,99,100,101,104,105,106,107,112,113,114,115,116,117,118,119,120,121,122,123,124,125,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,150,151,152,153,154,155,156,157,158,159,160,164,165,166,167,168,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,189,190,192,193,198,210,211,212,214,215,216,218,219,220,221,222,223,224,225,226,227,228,229,230,234,235,236,237,238,239,240,241,243,245,246,248,249,250,251,252,253,254,255,257,271,272,273,274,275,276,277,278,279,280,281,283,284,285,286,287,288,289,290,291,292,295,296,297,298,299,300,308,309,310,311,312,313,314,315,319,320,322,329,332,338,340,341,342,343,346,347,],[20,20,-3,-4,-5,-6,-7,-8,-9,20,20,92,92,-187,-133,-191,-124,114,-123,-125,-122,-98,-100,-99,-126,-127,-128,-129,-130,114,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-2,92,-136,-137,-139,-141,-195,-211,20,-54,-55,-56,-57,-58,-59,-60,-61,92,-122,-207,-19,92,-20,-221,20,92,-187,20,-185,-188,-21,-23,-24,114,-192,114,114,114,-96,-97,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,-174,92,-74,-75,-76,-77,-78,-79,-80,92,92,-171,92,-184,-172,-173,-175,-176,92,-143,-144,-138,-140,-142,-196,-212,-18,-53,-222,92,-67,-68,-69,-70,-208,92,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-25,-186,-188,92,-130,-175,-22,114,114,114,-200,-10,-11,-62,-71,92,92,92,92,92,92,92,92,92,92,92,92,-182,-179,-180,92,-152,-155,92,-63,-65,-66,92,92,-46,92,-177,-178,-13,-14,-16,-12,-72,-73,-164,-165,-166,-167,-168,92,92,92,-170,-183,-181,-150,-153,92,92,-64,-41,-26,92,92,92,-52,-15,-17,92,-147,-148,-149,-169,-154,-151,-27,92,-51,92,92,92,92,-36,-37,-38,92,-39,-40,]),'css_font_face':([0,2,3,4,5,6,7,8,9,14,16,58,69,70,71,72,73,74,75,76,77,84,86,87,88,97,99,100,157,158,159,186,198,215,216,218,243,245,246,254,255,257,271,290,291,292,299,300,315,],[22,22,-3,-4,-5,-6,-7,-8,-9,22,22,-2,22,-54,-55,-56,-57,-58,-59,-60,-61,-19,-20,-221,22,-21,-23,-24,-18,-53,-222,-25,-22,-10,-11,-62,-63,-65,-66,-13,-14,-16,-12,-64,-41,-26,-15,-17,-27,]),'css_keyframe_selector':([0,2,3,4,5,6,7,8,9,14,16,58,69,70,71,72,73,74,75,76,77,84,86,87,88,97,99,100,157,158,159,186,198,215,216,218,243,245,246,254,255,257,271,290,291,292,299,300,315,],[23,23,-3,-4,-5,-6,-7,-8,-9,23,23,-2,23,-54,-55,-56,-57,-58,-59,-60,-61,-19,-20,-221,23,-21,-23,-24,-18,-53,-222,-25,-22,-10,-11,-62,-63,-65,-66,-13,-14,-16,-12,-64,-41,-26,-15,-17,-27,]),'css_media':([0,2,3,4,5,6,7,8,9,14,16,58,69,70,71,72,73,74,75,76,77,84,86,87,88,97,99,100,157,158,159,186,198,215,216,218,243,245,246,254,255,257,271,290,291,292,299,300,315,],[28,28,-3,-4,-5,-6,-7,-8,-9,28,28,-2,28,-54,-55,-56,-57,-58,-59,-60,-61,-19,-20,-221,28,-21,-23,-24,-18,-53,-222,-25,-22,-10,-11,-62,-63,-65,-66,-13,-14,-16,-12,-64,-41,-26,-15,-17,-27,]),'css_number':([0,2,3,4,5,6,7,8,9,14,16,20,29,48,51,58,61,67,68,69,70,71,72,73,74,75,76,77,78,83,84,85,86,87,88,92,93,95,96,97,99,100,104,118,121,129,130,131,132,133,134,135,136,137,139,140,142,143,144,145,146,147,155,156,157,158,159,160,164,165,166,167,168,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,189,190,192,193,198,215,216,218,219,220,221,222,223,224,225,226,227,228,229,230,238,239,240,241,243,245,246,248,249,250,251,252,253,254,255,257,271,272,273,274,275,276,277,278,279,280,281,283,284,286,287,288,289,290,291,292,295,296,297,298,299,300,308,309,310,311,312,313,314,315,319,320,322,332,338,340,341,342,343,346,347,],[29,29,-3,-4,-5,-6,-7,-8,-9,29,29,-187,-191,-205,-189,-2,29,-195,-211,29,-54,-55,-56,-57,-58,-59,-60,-61,29,-207,-19,29,-20,-221,29,-187,29,-185,-188,-21,-23,-24,-192,-206,-190,-174,29,-74,-75,-76,-77,-78,-79,-80,29,-171,-184,-172,-173,-175,-176,29,-196,-212,-18,-53,-222,29,-67,-68,-69,-70,-208,29,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-25,-186,-188,29,-172,-175,-22,-10,-11,-62,-71,29,29,29,29,29,29,29,29,29,29,29,29,-152,-155,29,-63,-65,-66,29,29,-46,29,-177,-178,-13,-14,-16,-12,-72,-73,-164,-165,-166,-167,-168,29,29,29,-170,-183,-150,-153,29,29,-64,-41,-26,29,29,29,-52,-15,-17,29,-147,-148,-149,-169,-154,-151,-27,29,-51,29,29,29,-36,-37,-38,29,-39,-40,]),'css_keyframes':([0,2,3,4,5,6,7,8,9,14,16,58,69,70,71,72,73,74,75,76,77,84,86,87,88,93,97,99,100,157,158,159,186,198,215,216,218,243,245,246,254,255,257,271,290,291,292,299,300,315,],[31,31,-3,-4,-5,-6,-7,-8,-9,31,31,-2,31,-54,-55,-56,-57,-58,-59,-60,-61,-19,-20,-221,31,31,-21,-23,-24,-18,-53,-222,-25,-22,-10,-11,-62,-63,-65,-66,-13,-14,-16,-12,-64,-41,-26,-15,-17,-27,]),'css_viewport':([0,2,3,4,5,6,7,8,9,14,16,58,69,70,71,72,73,74,75,76,77,84,86,87,88,93,97,99,100,157,158,159,186,198,215,216,218,243,245,246,254,255,257,271,290,291,292,299,300,315,],[32,32,-3,-4,-5,-6,-7,-8,-9,32,32,-2,32,-54,-55,-56,-57,-58,-59,-60,-61,-19,-20,-221,32,32,-21,-23,-24,-18,-53,-222,-25,-22,-10,-11,-62,-63,-65,-66,-13,-14,-16,-12,-64,-41,-26,-15,-17,-27,]),'css_page':([0,2,3,4,5,6,7,8,9,14,16,58,69,70,71,72,73,74,75,76,77,84,86,87,88,97,99,100,157,158,159,186,198,215,216,218,243,245,246,254,255,257,271,290,291,292,299,300,315,],[33,33,-3,-4,-5,-6,-7,-8,-9,33,33,-2,33,-54,-55,-56,-57,-58,-59,-60,-61,-19,-20,-221,33,-21,-23,-24,-18,-53,-222,-25,-22,-10,-11,-62,-63,-65,-66,-13,-14,-16,-12,-64,-41,-26,-15,-17,-27,]),'*':([0,2,3,4,5,6,7,8,9,14,16,20,27,29,30,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,79,84,86,87,88,92,93,95,96,97,99,100,101,104,105,106,107,108,112,113,114,115,116,117,118,119,120,121,122,123,124,125,129,132,140,143,144,145,146,150,151,152,153,154,155,156,157,158,159,163,175,182,183,186,187,189,192,193,198,199,210,211,212,214,215,216,218,231,232,243,245,246,254,255,257,271,274,275,276,277,278,282,283,286,290,291,292,299,300,309,310,311,312,314,315,324,325,327,328,],[38,38,-3,-4,-5,-6,-7,-8,-9,79,79,-187,-133,-191,108,-124,-95,-123,-125,-122,-98,-100,-99,-126,-127,-128,-129,-130,-204,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-2,-136,-137,-139,-141,-195,-211,79,-54,-55,-56,-57,-58,-59,-60,-61,-122,-19,-20,-221,79,-187,38,-185,-188,-21,-23,-24,38,-192,38,38,38,-94,-96,-97,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,-174,225,-171,-172,-173,-175,-176,-143,-144,-138,-140,-142,-196,-212,-18,-53,-222,163,225,-176,-174,-25,-186,-188,-130,-175,-22,108,-91,-92,-93,-200,-10,-11,-62,225,-174,-63,-65,-66,-13,-14,-16,-12,225,225,-166,-167,-168,225,-170,-150,-64,-41,-26,-15,-17,-147,-148,-149,-169,-151,-27,-173,-174,-172,225,]),'+':([0,2,3,4,5,6,7,8,9,14,16,20,27,29,30,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,79,84,86,87,88,92,93,95,96,97,99,100,101,104,105,106,107,108,112,113,114,115,116,117,118,119,120,121,122,123,124,125,129,132,140,143,144,145,146,150,151,152,153,154,155,156,157,158,159,175,182,183,186,187,189,192,193,198,199,210,211,212,214,215,216,218,231,232,243,245,246,254,255,257,271,274,275,276,277,278,282,283,286,290,291,292,299,300,309,310,311,312,314,315,324,325,327,328,],[36,36,-3,-4,-5,-6,-7,-8,-9,36,36,-187,-133,-191,106,-124,-95,-123,-125,-122,-98,-100,-99,-126,-127,-128,-129,-130,-204,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-2,-136,-137,-139,-141,-195,-211,36,-54,-55,-56,-57,-58,-59,-60,-61,-122,-19,-20,-221,36,-187,36,-185,-188,-21,-23,-24,36,-192,36,36,36,-94,-96,-97,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,-174,222,-171,-172,-173,-175,-176,-143,-144,-138,-140,-142,-196,-212,-18,-53,-222,222,-176,-174,-25,-186,-188,-130,-175,-22,106,-91,-92,-93,-200,-10,-11,-62,222,-174,-63,-65,-66,-13,-14,-16,-12,-164,-165,-166,-167,-168,222,-170,-150,-64,-41,-26,-15,-17,-147,-148,-149,-169,-151,-27,-173,-174,-172,222,]),'css_id':([0,2,3,4,5,6,7,8,9,14,16,20,27,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,79,84,85,86,87,88,92,93,95,96,97,99,100,101,104,105,106,107,112,113,114,115,116,117,118,119,120,121,122,123,124,125,129,140,142,143,144,145,146,147,150,151,152,153,154,155,156,157,158,159,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,189,192,193,198,210,211,212,214,215,216,218,227,228,229,238,239,240,241,243,245,246,248,249,250,251,252,253,254,255,257,271,274,275,276,277,278,279,280,281,283,284,286,287,288,289,290,291,292,295,296,297,298,299,300,309,310,311,312,313,314,315,319,320,332,338,340,341,342,343,346,347,],[48,48,-3,-4,-5,-6,-7,-8,-9,48,48,-199,-133,-191,-124,48,-123,-125,-122,-98,-100,-99,-126,-127,-128,-129,-130,-204,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-2,-136,-137,-139,-141,-195,-211,48,-54,-55,-56,-57,-58,-59,-60,-61,-122,-19,48,-20,-221,48,-187,48,-185,-200,-21,-23,-24,48,-192,48,48,48,-96,-97,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,-174,-171,-184,-172,-173,-175,-176,48,-143,-144,-138,-140,-142,-196,-212,-18,-53,-222,48,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-25,-186,-188,-130,-193,-22,48,48,48,-200,-10,-11,-62,48,48,48,48,-152,-155,48,-63,-65,-66,48,48,-46,48,-177,-178,-13,-14,-16,-12,-164,-165,-166,-167,-168,48,48,48,-170,-183,-150,-153,48,48,-64,-41,-26,48,48,48,-52,-15,-17,-147,-148,-149,-169,-154,-151,-27,48,-51,48,48,-36,-37,-38,48,-39,-40,]),'css_dom':([0,2,3,4,5,6,7,8,9,14,16,20,27,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,83,84,85,86,87,88,92,93,95,96,97,99,100,101,104,105,106,107,112,113,114,115,116,117,118,119,120,121,122,123,124,125,129,130,131,132,133,134,135,136,137,139,140,142,143,144,145,146,147,150,151,152,153,154,155,156,157,158,159,160,164,165,166,167,168,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,189,190,192,193,198,210,211,212,214,215,216,218,219,220,221,222,223,224,225,226,227,228,229,230,238,239,240,241,243,245,246,248,249,250,251,252,253,254,255,257,271,272,273,274,275,276,277,278,279,280,281,283,284,286,287,288,289,290,291,292,295,296,297,298,299,300,308,309,310,311,312,313,314,315,319,320,322,332,338,340,341,342,343,346,347,],[49,49,-3,-4,-5,-6,-7,-8,-9,49,49,-187,-133,-191,-124,49,-123,-125,-122,-98,-100,-99,-126,-127,-128,-129,-130,-204,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-2,145,-136,-137,-139,-141,-195,-211,49,-54,-55,-56,-57,-58,-59,-60,-61,145,-122,-207,-19,145,-20,-221,49,-187,193,-185,-188,-21,-23,-24,49,-192,49,49,49,-96,-97,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,-174,145,-74,-75,-76,-77,-78,-79,-80,145,-171,-184,-172,-173,-175,-176,145,-143,-144,-138,-140,-142,-196,-212,-18,-53,-222,145,-67,-68,-69,-70,-208,145,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-25,-186,-188,145,-130,-175,-22,49,49,49,-200,-10,-11,-62,-71,145,145,145,145,145,145,145,145,145,145,145,145,-152,-155,145,-63,-65,-66,145,145,-46,145,-177,-178,-13,-14,-16,-12,-72,-73,-164,-165,-166,-167,-168,145,145,145,-170,-183,-150,-153,145,145,-64,-41,-26,145,145,145,-52,-15,-17,145,-147,-148,-149,-169,-154,-151,-27,145,-51,145,145,145,-36,-37,-38,145,-39,-40,]),'&':([0,2,3,4,5,6,7,8,9,14,16,20,27,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,79,84,86,87,88,93,96,97,99,100,101,105,106,107,112,113,114,115,116,117,118,119,120,121,122,123,124,125,150,151,152,153,154,155,156,157,158,159,186,192,193,198,210,211,212,214,215,216,218,243,245,246,254,255,257,271,290,291,292,299,300,315,],[50,50,-3,-4,-5,-6,-7,-8,-9,50,50,-199,-133,-124,50,-123,-125,-122,-98,-100,-99,-126,-127,-128,-129,-130,-204,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-2,-136,-137,-139,-141,-195,-211,50,-54,-55,-56,-57,-58,-59,-60,-61,-122,-19,-20,-221,50,50,-200,-21,-23,-24,50,50,50,50,-96,-97,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,-143,-144,-138,-140,-142,-196,-212,-18,-53,-222,-25,-130,-193,-22,50,50,50,-200,-10,-11,-62,-63,-65,-66,-13,-14,-16,-12,-64,-41,-26,-15,-17,-27,]),'css_color':([0,2,3,4,5,6,7,8,9,14,16,20,27,29,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,83,84,85,86,87,88,92,93,95,96,97,99,100,101,104,105,106,107,112,113,114,115,116,117,118,119,120,121,122,123,124,125,129,130,131,132,133,134,135,136,137,139,140,142,143,144,145,146,147,150,151,152,153,154,155,156,157,158,159,160,164,165,166,167,168,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,189,190,192,193,198,210,211,212,214,215,216,218,219,220,221,222,223,224,225,226,227,228,229,230,238,239,240,241,243,245,246,248,249,250,251,252,253,254,255,257,271,272,273,274,275,276,277,278,279,280,281,283,284,286,287,288,289,290,291,292,295,296,297,298,299,300,308,309,310,311,312,313,314,315,319,320,322,332,338,340,341,342,343,346,347,],[51,51,-3,-4,-5,-6,-7,-8,-9,51,51,-187,-133,-191,-124,51,-123,-125,-122,-98,-100,-99,-126,-127,-128,-129,-130,-204,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-2,51,-136,-137,-139,-141,-195,-211,51,-54,-55,-56,-57,-58,-59,-60,-61,51,-122,-207,-19,51,-20,-221,51,-187,51,-185,-188,-21,-23,-24,51,-192,51,51,51,-96,-97,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,-174,51,-74,-75,-76,-77,-78,-79,-80,51,-171,-184,-172,-173,-175,-176,51,-143,-144,-138,-140,-142,-196,-212,-18,-53,-222,51,-67,-68,-69,-70,-208,51,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-25,-186,-188,51,-130,-175,-22,51,51,51,-200,-10,-11,-62,-71,51,51,51,51,51,51,51,51,51,51,51,51,-152,-155,51,-63,-65,-66,51,51,-46,51,-177,-178,-13,-14,-16,-12,-72,-73,-164,-165,-166,-167,-168,51,51,51,-170,-183,-150,-153,51,51,-64,-41,-26,51,51,51,-52,-15,-17,51,-147,-148,-149,-169,-154,-151,-27,51,-51,51,51,51,-36,-37,-38,51,-39,-40,]),'>':([0,2,3,4,5,6,7,8,9,14,16,20,27,29,30,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,79,84,86,87,88,92,93,95,96,97,99,100,101,104,105,106,107,108,112,113,114,115,116,117,118,119,120,121,122,123,124,125,129,140,142,143,144,145,146,150,151,152,153,154,155,156,157,158,159,175,176,177,178,179,180,181,182,186,187,189,192,193,198,199,210,211,212,214,215,216,218,243,245,246,252,253,254,255,257,271,274,275,276,277,278,283,284,286,290,291,292,299,300,309,310,311,312,314,315,333,337,],[52,52,-3,-4,-5,-6,-7,-8,-9,52,52,-199,-133,-191,52,-124,-95,-123,-125,-122,-98,-100,-99,-126,-127,-128,-129,-130,-204,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-2,-136,-137,-139,-141,-195,-211,52,-54,-55,-56,-57,-58,-59,-60,-61,-122,-19,-20,-221,52,-187,52,-185,-200,-21,-23,-24,52,-192,52,52,52,-94,-96,-97,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,-174,-171,-184,-172,-173,-175,-176,-143,-144,-138,-140,-142,-196,-212,-18,-53,-222,-156,-157,-158,-159,-160,-161,-162,-163,-25,-186,-188,-130,-193,-22,52,-91,-92,-93,-200,-10,-11,-62,-63,-65,-66,-177,-178,-13,-14,-16,-12,-164,-165,-166,-167,-168,-170,-183,-150,-64,-41,-26,-15,-17,-147,-148,-149,-169,-151,-27,340,340,]),'t_tilde':([0,2,3,4,5,6,7,8,9,14,16,20,27,30,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,79,84,86,87,88,93,96,97,99,100,101,105,106,107,108,112,113,114,115,116,117,118,119,120,121,122,123,124,125,150,151,152,153,154,155,156,157,158,159,186,192,193,198,199,210,211,212,214,215,216,218,243,245,246,254,255,257,271,290,291,292,299,300,315,],[53,53,-3,-4,-5,-6,-7,-8,-9,53,53,-199,-133,53,-124,-95,-123,-125,-122,-98,-100,-99,-126,-127,-128,-129,-130,-204,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-2,-136,-137,-139,-141,-195,-211,53,-54,-55,-56,-57,-58,-59,-60,-61,-122,-19,-20,-221,53,53,-200,-21,-23,-24,53,53,53,53,-94,-96,-97,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,-143,-144,-138,-140,-142,-196,-212,-18,-53,-222,-25,-130,-193,-22,53,-91,-92,-93,-200,-10,-11,-62,-63,-65,-66,-13,-14,-16,-12,-64,-41,-26,-15,-17,-27,]),'css_filter':([0,2,3,4,5,6,7,8,9,13,14,16,20,26,27,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,79,84,86,87,88,93,96,97,99,100,101,105,106,107,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,150,151,152,153,154,155,156,157,158,159,186,192,193,198,210,211,212,214,215,216,218,243,245,246,254,255,257,271,290,291,292,299,300,315,],[54,54,-3,-4,-5,-6,-7,-8,-9,66,54,54,-199,54,-133,-209,-124,54,-123,-125,-122,-98,54,-99,-126,-127,-128,-129,-130,-204,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-2,-136,-137,-139,-141,-195,-211,54,-54,-55,-56,-57,-58,-59,-60,-61,-122,-19,-20,-221,54,54,-200,-21,-23,-24,54,54,54,54,-210,-96,54,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,-143,-144,-138,-140,-142,-196,-212,-18,-53,-222,-25,-130,-193,-22,54,54,54,-200,-10,-11,-62,-63,-65,-66,-13,-14,-16,-12,-64,-41,-26,-15,-17,-27,]),'t_colon':([0,2,3,4,5,6,7,8,9,12,13,14,16,20,26,27,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,79,80,81,82,83,84,86,87,88,92,93,95,96,97,99,100,101,105,106,107,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,150,151,152,153,154,155,156,157,158,159,168,183,186,187,189,192,193,198,210,211,212,214,215,216,218,243,245,246,254,255,257,269,271,290,291,292,299,300,315,],[13,13,-3,-4,-5,-6,-7,-8,-9,61,62,13,13,-187,13,-133,-209,-124,13,-123,-125,-122,-98,13,-99,-126,-127,-128,-129,-130,-204,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-2,-136,-137,-139,-141,-195,-211,13,-54,-55,-56,-57,-58,-59,-60,-61,-122,165,166,167,-207,-19,-20,-221,13,-187,13,-185,-188,-21,-23,-24,13,13,13,13,-210,-96,13,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,-143,-144,-138,-140,-142,-196,-212,-18,-53,-222,-208,251,-25,-186,-188,-130,-193,-22,13,13,13,-200,-10,-11,-62,-63,-65,-66,-13,-14,-16,308,-12,-64,-41,-26,-15,-17,-27,]),'css_class':([0,2,3,4,5,6,7,8,9,14,16,20,27,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,79,84,86,87,88,93,96,97,99,100,101,105,106,107,112,113,114,115,116,117,118,119,120,121,122,123,124,125,150,151,152,153,154,155,156,157,158,159,186,192,193,198,210,211,212,214,215,216,218,243,245,246,254,255,257,271,290,291,292,299,300,315,],[57,57,-3,-4,-5,-6,-7,-8,-9,57,57,-199,-133,-124,57,-123,-125,-122,-98,-100,-99,-126,-127,-128,-129,-130,57,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-2,-136,-137,-139,-141,-195,-211,57,-54,-55,-56,-57,-58,-59,-60,-61,-122,-19,-20,-221,57,57,-200,-21,-23,-24,57,57,57,57,-96,-97,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,-143,-144,-138,-140,-142,-196,-212,-18,-53,-222,-25,-130,-193,-22,57,57,57,-200,-10,-11,-62,-63,-65,-66,-13,-14,-16,-12,-64,-41,-26,-15,-17,-27,]),'$end':([1,2,3,4,5,6,7,8,9,58,84,157,159,186,215,216,218,254,255,257,271,291,299,300,],[0,-1,-3,-4,-5,-6,-7,-8,-9,-2,-19,-18,-222,-25,-10,-11,-62,-13,-14,-16,-12,-41,-15,-17,]),'t_ws':([10,11,18,20,22,28,29,31,32,33,48,49,50,51,52,53,54,57,64,65,66,67,68,83,92,95,96,104,114,121,129,130,131,132,133,134,135,136,137,140,142,143,144,145,146,149,155,156,160,168,187,189,190,192,193,206,207,208,213,219,252,253,262,272,273,274,275,276,277,278,283,284,286,309,310,311,312,314,],[59,60,94,96,98,103,104,109,110,111,118,119,120,121,122,123,124,125,152,153,154,155,156,168,189,-185,-188,-192,214,-190,-174,221,-74,-75,-76,-77,-78,-79,-80,-171,-184,-172,-173,-175,-176,242,-196,-212,221,-208,-186,-188,221,-172,119,266,267,268,270,-71,-177,-178,304,-72,-73,-164,-165,-166,-167,-168,-170,-183,-150,-147,-148,-149,-169,-151,]),'css_property':([13,14,16,20,29,48,51,61,67,68,69,70,71,72,73,74,75,76,77,78,79,83,84,85,86,87,88,92,93,94,95,96,97,99,100,104,118,121,129,130,131,132,133,134,135,136,137,139,140,142,143,144,145,146,147,155,156,157,158,159,160,163,164,165,166,167,168,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,189,190,192,193,198,218,219,220,221,222,223,224,225,226,227,228,229,230,238,239,240,241,243,245,246,248,249,250,251,252,253,254,255,257,272,273,274,275,276,277,278,279,280,281,283,284,286,287,288,289,290,291,292,295,296,297,298,299,300,308,309,310,311,312,313,314,315,319,320,322,332,338,340,341,342,343,346,347,],[65,83,83,-187,-191,-205,-189,83,-195,-211,83,-54,-55,-56,-57,-58,-59,-60,-61,83,83,-207,-19,83,-20,-221,83,-187,83,83,-185,-188,-21,-23,-24,-192,-206,-190,-174,83,-74,-75,-76,-77,-78,-79,-80,83,-171,-184,-172,-173,-175,-176,83,-196,-212,-18,-53,-222,83,83,-67,-68,-69,-70,-208,83,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-25,-186,-188,83,-172,-175,-22,-62,-71,83,83,83,83,83,83,83,83,83,83,83,83,-152,-155,83,-63,-65,-66,83,83,-46,83,-177,-178,-13,-14,-16,-72,-73,-164,-165,-166,-167,-168,83,83,83,-170,-183,-150,-153,83,83,-64,-41,-26,83,83,83,-52,-15,-17,83,-147,-148,-149,-169,-154,-151,-27,83,-51,83,83,83,-36,-37,-38,83,-39,-40,]),'css_ident':([13,14,16,20,29,48,51,60,61,62,67,68,69,70,71,72,73,74,75,76,77,78,79,83,84,85,86,87,88,92,93,94,95,96,97,99,100,104,109,118,121,129,130,131,132,133,134,135,136,137,139,140,142,143,144,145,146,147,155,156,157,158,159,160,163,164,165,166,167,168,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,189,190,192,193,198,218,219,220,221,222,223,224,225,226,227,228,229,230,238,239,240,241,243,245,246,248,249,250,251,252,253,254,255,257,272,273,274,275,276,277,278,279,280,281,283,284,286,287,288,289,290,291,292,295,296,297,298,299,300,308,309,310,311,312,313,314,315,319,320,322,332,338,340,341,342,343,346,347,],[67,67,67,-187,-191,-205,-189,67,67,67,-195,-211,67,-54,-55,-56,-57,-58,-59,-60,-61,67,67,-207,-19,67,-20,-221,67,-187,67,67,-185,-188,-21,-23,-24,-192,213,-206,-190,-174,67,-74,-75,-76,-77,-78,-79,-80,67,-171,-184,-172,-173,-175,-176,67,-196,-212,-18,-53,-222,67,67,-67,-68,-69,-70,-208,67,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-25,-186,-188,67,-172,-175,-22,-62,-71,67,67,67,67,67,67,67,67,67,67,67,67,-152,-155,67,-63,-65,-66,67,67,-46,67,-177,-178,-13,-14,-16,-72,-73,-164,-165,-166,-167,-168,67,67,67,-170,-183,-150,-153,67,67,-64,-41,-26,67,67,67,-52,-15,-17,67,-147,-148,-149,-169,-154,-151,-27,67,-51,67,67,67,-36,-37,-38,67,-39,-40,]),'css_vendor_property':([13,14,16,20,29,45,48,50,51,61,62,67,68,69,70,71,72,73,74,75,76,77,78,79,83,84,85,86,87,88,92,93,94,95,96,97,99,100,104,118,120,121,129,130,131,132,133,134,135,136,137,139,140,142,143,144,145,146,147,155,156,157,158,159,160,163,164,165,166,167,168,171,172,173,174,175,176,177,178,179,180,181,182,183,186,187,189,190,192,193,198,218,219,220,221,222,223,224,225,226,227,228,229,230,238,239,240,241,243,245,246,248,249,250,251,252,253,254,255,257,272,273,274,275,276,277,278,279,280,281,283,284,286,287,288,289,290,291,292,295,296,297,298,299,300,308,309,310,311,312,313,314,315,319,320,322,332,338,340,341,342,343,346,347,],[68,68,68,-187,-191,68,-205,-216,-189,68,68,-195,-211,68,-54,-55,-56,-57,-58,-59,-60,-61,68,68,-207,-19,68,-20,-221,68,-187,68,68,-185,-188,-21,-23,-24,-192,-206,-215,-190,-174,68,-74,-75,-76,-77,-78,-79,-80,68,-171,-184,-172,-173,-175,-176,68,-196,-212,-18,-53,-222,68,68,-67,-68,-69,-70,-208,68,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-25,-186,-188,68,-172,-175,-22,-62,-71,68,68,68,68,68,68,68,68,68,68,68,68,-152,-155,68,-63,-65,-66,68,68,-46,68,-177,-178,-13,-14,-16,-72,-73,-164,-165,-166,-167,-168,68,68,68,-170,-183,-150,-153,68,68,-64,-41,-26,68,68,68,-52,-15,-17,68,-147,-148,-149,-169,-154,-151,-27,68,-51,68,68,68,-36,-37,-38,68,-39,-40,]),'t_bclose':([14,16,69,70,71,72,73,74,75,76,77,84,86,87,88,97,99,100,157,158,159,186,198,218,243,245,246,254,255,257,290,291,292,299,300,315,],[-229,-229,159,-54,-55,-56,-57,-58,-59,-60,-61,-19,-20,-221,159,-21,-23,-24,-18,-53,-222,-25,-22,-62,-63,-65,-66,-13,-14,-16,-64,-41,-26,-15,-17,-27,]),'t_semicolon':([15,20,25,26,27,29,30,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,63,64,65,66,67,68,78,79,83,85,92,95,96,102,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,129,130,131,132,133,134,135,136,137,140,142,143,144,145,146,150,151,152,153,154,155,156,160,161,162,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,187,188,189,194,195,196,199,201,202,205,206,210,211,212,213,214,217,219,244,247,248,249,250,252,253,256,258,260,263,264,265,266,270,272,273,274,275,276,277,278,283,284,286,295,296,297,298,301,303,305,306,307,309,310,311,312,314,320,321,334,],[84,-199,-81,-82,-133,-191,-86,-89,-209,-124,-95,-123,-125,-122,-98,-100,-99,-126,-127,-128,-129,-130,-204,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-136,-137,-139,-141,-195,-211,-229,-122,-207,-229,-187,-185,-200,-83,-192,-94,-90,-210,-96,-97,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,215,216,-174,218,-74,-75,-76,-77,-78,-79,-80,-171,-184,-172,-173,-175,-176,-143,-144,-138,-140,-142,-196,-212,243,245,246,-67,-68,-69,-70,-208,248,-42,-45,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-186,-84,-188,254,255,257,-85,-104,-105,-112,-213,-91,-92,-93,-87,-200,271,-71,290,291,-229,-229,-46,-177,-178,299,300,-106,-107,-109,-111,-214,-88,-72,-73,-164,-165,-166,-167,-168,-170,-183,-150,-44,-43,-50,-52,-103,-114,-108,-110,-115,-147,-148,-149,-169,-151,-51,-113,-116,]),'t_bopen':([15,20,21,23,24,25,26,27,29,30,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,63,64,65,66,67,68,79,96,98,102,103,104,108,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,150,151,152,153,154,155,156,188,199,200,201,202,205,206,210,211,212,213,214,247,260,263,264,265,266,270,293,301,303,305,306,307,316,317,321,334,335,336,339,344,349,350,],[87,-199,87,87,87,-81,-82,-133,-191,-86,-89,-209,-124,-95,-123,-125,-122,-98,-100,-99,-126,-127,-128,-129,-130,-204,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-136,-137,-139,-141,-195,-211,-122,-200,87,-83,-101,-192,-94,-90,-210,-96,-97,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,-143,-144,-138,-140,-142,-196,-212,-84,-85,-102,-104,-105,-112,-213,-91,-92,-93,-87,-200,87,-106,-107,-109,-111,-214,-88,87,-103,-114,-108,-110,-115,-28,-31,-113,-116,-29,-30,-35,-33,-34,-32,]),'t_eopen':([17,20,29,48,51,61,67,68,78,83,85,92,93,95,96,104,118,121,129,130,131,132,133,134,135,136,137,140,142,143,144,145,146,147,155,156,160,164,165,166,167,168,171,172,173,174,175,176,177,178,179,180,181,182,183,187,189,190,192,193,219,220,221,227,228,229,238,239,240,241,248,249,250,251,252,253,272,273,274,275,276,277,278,279,280,281,283,284,286,287,288,289,295,296,297,298,309,310,311,312,313,314,319,320,332,338,340,341,342,343,346,347,],[93,-187,-191,-205,-189,93,-195,-211,93,-207,93,-187,93,-185,-188,-192,-206,-190,-174,93,-74,-75,-76,-77,-78,-79,-80,-171,-184,-172,-173,-175,-176,93,-196,-212,93,-67,-68,-69,-70,-208,93,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-186,-188,93,-172,-175,-71,93,93,93,93,93,93,-152,-155,93,93,93,-46,93,-177,-178,-72,-73,-164,-165,-166,-167,-168,93,93,93,-170,-183,-150,-153,93,93,93,93,93,-52,-147,-148,-149,-169,-154,-151,93,-51,93,93,-36,-37,-38,93,-39,-40,]),'/':([20,29,51,67,92,95,96,104,121,129,132,134,140,143,144,145,146,155,175,178,182,183,187,189,192,193,231,232,233,274,275,276,277,278,282,283,286,309,310,311,312,314,324,325,326,327,328,],[-187,-191,-189,-195,-187,-185,-188,-192,-190,-174,224,226,-171,-172,-173,-175,-176,-196,224,226,-176,-174,-186,-188,-172,-175,224,-174,226,224,224,-166,-167,-168,224,-170,-150,-147,-148,-149,-169,-151,-173,-174,226,-172,224,]),'t_eclose':([20,27,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,63,64,65,66,67,68,83,92,95,96,104,108,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,129,131,132,133,134,135,136,137,140,142,143,144,145,146,150,151,152,153,154,155,156,168,187,189,190,191,192,193,199,210,211,212,213,214,219,252,253,270,272,273,274,275,276,277,278,283,284,286,309,310,311,312,314,],[-187,-133,-191,-86,-89,-124,-95,-123,-125,-122,-98,-100,-99,-126,-127,-128,-129,-130,-204,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-136,-137,-139,-141,-195,-211,-207,-187,-185,-188,-192,-94,-90,-96,-97,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,-174,-74,-75,-76,-77,-78,-79,-80,-171,-184,-172,-173,-175,-176,-143,-144,-138,-140,-142,-196,-212,-208,-186,-188,252,253,-130,-175,-85,-91,-92,-93,-87,-200,-71,-177,-178,-88,-72,-73,-164,-165,-166,-167,-168,-170,-183,-150,-147,-148,-149,-169,-151,]),'t_comma':([20,25,27,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,63,64,65,66,67,68,79,83,85,92,95,96,104,108,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,129,130,131,132,133,134,135,136,137,140,142,143,144,145,146,147,150,151,152,153,154,155,156,160,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,187,189,190,191,192,193,199,200,201,202,205,206,210,211,212,213,214,219,227,228,229,238,239,240,241,248,249,250,252,253,256,258,260,263,264,265,266,270,272,273,274,275,276,277,278,279,280,281,283,284,286,287,289,295,296,297,298,301,303,305,306,307,309,310,311,312,313,314,316,317,320,321,334,335,336,339,344,349,350,],[-187,101,-133,-191,-86,-89,-124,-95,-123,-125,-122,-98,-100,-99,-126,-127,-128,-129,-130,-204,-205,-193,-216,-189,-218,-220,-134,-203,-201,-197,-136,-137,-139,-141,-195,-211,-122,-207,-229,-187,-185,-188,-192,-94,-90,-96,-97,-199,-132,-131,-202,-206,-194,-215,-190,-217,-219,-135,-198,-174,220,-74,-75,-76,-77,-78,-79,-80,-171,-184,-172,-173,-175,-176,-229,-143,-144,-138,-140,-142,-196,-212,220,-208,249,-42,-45,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-186,-188,220,101,-130,-175,-85,259,-104,-105,-112,-213,-91,-92,-93,-87,-200,-71,-229,-229,-229,288,-152,-155,-229,-229,-229,-46,-177,-178,259,259,-106,-107,-109,-111,-214,-88,-72,-73,-164,-165,-166,-167,-168,288,288,288,-170,-183,-150,-153,288,-44,-43,-50,-52,-103,-114,-108,-110,-115,-147,-148,-149,-169,-154,-151,330,-31,-51,-113,-116,-29,-30,-35,-33,-34,-32,]),'t_isopen':([20,29,48,51,61,67,68,78,83,85,92,93,94,95,96,104,118,121,129,130,131,132,133,134,135,136,137,140,142,143,144,145,146,147,155,156,160,164,165,166,167,168,171,172,173,174,175,176,177,178,179,180,181,182,183,187,189,190,192,193,219,220,221,227,228,229,238,239,240,241,248,249,250,251,252,253,272,273,274,275,276,277,278,279,280,281,283,284,286,287,288,289,295,296,297,298,309,310,311,312,313,314,319,320,332,338,340,341,342,343,346,347,],[-187,-191,-205,-189,141,-195,-211,141,-207,141,-187,141,141,-185,-188,-192,-206,-190,-174,141,-74,-75,-76,-77,-78,-79,-80,-171,-184,-172,-173,-175,-176,141,-196,-212,141,-67,-68,-69,-70,-208,141,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-186,-188,141,-172,-175,-71,141,141,141,141,141,141,-152,-155,141,141,141,-46,141,-177,-178,-72,-73,-164,-165,-166,-167,-168,141,141,141,-170,-183,-150,-153,141,141,141,141,141,-52,-147,-148,-149,-169,-154,-151,141,-51,141,141,-36,-37,-38,141,-39,-40,]),'css_string':([20,29,48,51,59,60,61,67,68,78,83,85,92,93,94,95,96,104,118,121,128,129,130,131,132,133,134,135,136,137,140,141,142,143,144,145,146,147,155,156,160,164,165,166,167,168,171,172,173,174,175,176,177,178,179,180,181,182,183,187,189,190,192,193,219,220,221,227,228,229,234,235,236,237,238,239,240,241,248,249,250,251,252,253,272,273,274,275,276,277,278,279,280,281,283,284,285,286,287,288,289,295,296,297,298,309,310,311,312,313,314,319,320,332,338,340,341,342,343,346,347,],[-187,-191,-205,-189,126,127,142,-195,-211,142,-207,142,-187,142,195,-185,-188,-192,-206,-190,217,-174,142,-74,-75,-76,-77,-78,-79,-80,-171,237,-184,-172,-173,-175,-176,142,-196,-212,142,-67,-68,-69,-70,-208,142,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-186,-188,142,-172,-175,-71,142,142,142,142,142,237,-182,-179,-180,142,-152,-155,142,142,142,-46,142,-177,-178,-72,-73,-164,-165,-166,-167,-168,142,142,142,-170,-183,-181,-150,-153,142,142,142,142,142,-52,-147,-148,-149,-169,-154,-151,142,-51,142,142,-36,-37,-38,142,-39,-40,]),'less_open_format':([20,29,48,51,61,67,68,78,83,85,92,93,94,95,96,104,118,121,129,130,131,132,133,134,135,136,137,139,140,142,143,144,145,146,147,155,156,160,164,165,166,167,168,171,172,173,174,175,176,177,178,179,180,181,182,183,187,189,190,192,193,219,220,221,222,223,224,225,226,227,228,229,230,238,239,240,241,248,249,250,251,252,253,272,273,274,275,276,277,278,279,280,281,283,284,286,287,288,289,295,296,297,298,308,309,310,311,312,313,314,319,320,322,332,338,340,341,342,343,346,347,],[-187,-191,-205,-189,147,-195,-211,147,-207,147,-187,147,147,-185,-188,-192,-206,-190,-174,147,-74,-75,-76,-77,-78,-79,-80,147,-171,-184,-172,-173,-175,-176,147,-196,-212,147,-67,-68,-69,-70,-208,147,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-186,-188,147,-172,-175,-71,147,147,147,147,147,147,147,147,147,147,147,147,-152,-155,147,147,147,-46,147,-177,-178,-72,-73,-164,-165,-166,-167,-168,147,147,147,-170,-183,-150,-153,147,147,147,147,147,-52,147,-147,-148,-149,-169,-154,-151,147,-51,147,147,147,-36,-37,-38,147,-39,-40,]),'css_ms_filter':([20,29,48,51,61,67,68,78,83,85,92,93,94,95,96,104,118,121,129,130,131,132,133,134,135,136,137,139,140,142,143,144,145,146,147,155,156,160,164,165,166,167,168,171,172,173,174,175,176,177,178,179,180,181,182,183,187,189,190,192,193,219,220,221,222,223,224,225,226,227,228,229,230,238,239,240,241,248,249,250,251,252,253,272,273,274,275,276,277,278,279,280,281,283,284,286,287,288,289,295,296,297,298,308,309,310,311,312,313,314,319,320,322,332,338,340,341,342,343,346,347,],[-187,-191,-205,-189,149,-195,-211,149,-207,149,-187,149,149,-185,-188,-192,-206,-190,-174,149,-74,-75,-76,-77,-78,-79,-80,149,-171,-184,-172,-173,-175,-176,149,-196,-212,149,-67,-68,-69,-70,-208,149,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-186,-188,149,-172,-175,-71,149,149,149,149,149,149,149,149,149,149,149,149,-152,-155,149,149,149,-46,149,-177,-178,-72,-73,-164,-165,-166,-167,-168,149,149,149,-170,-183,-150,-153,149,149,149,149,149,-52,149,-147,-148,-149,-169,-154,-151,149,-51,149,149,149,-36,-37,-38,149,-39,-40,]),'css_important':([29,51,67,68,83,92,95,104,121,129,131,132,133,134,135,136,137,140,142,143,144,145,146,155,156,160,168,187,189,219,252,253,272,273,274,275,276,277,278,283,284,286,309,310,311,312,314,],[-191,-189,-195,-211,-207,-187,-185,-192,-190,-174,-74,-75,-76,-77,-78,-79,-80,-171,-184,-172,-173,-175,-176,-196,-212,244,-208,-186,-188,-71,-177,-178,-72,-73,-164,-165,-166,-167,-168,-170,-183,-150,-147,-148,-149,-169,-151,]),'css_uri':([29,48,51,67,85,92,95,104,118,121,129,140,142,143,144,145,146,147,155,171,172,173,174,175,176,177,178,179,180,181,182,183,187,189,227,228,229,238,239,240,241,248,249,250,251,252,253,274,275,276,277,278,279,280,281,283,284,286,287,288,289,295,296,297,298,309,310,311,312,313,314,319,320,332,338,340,341,342,343,346,347,],[-191,-205,-189,-195,180,-187,-185,-192,-206,-190,-174,-171,-184,-172,-173,-175,-176,180,-196,180,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-186,-188,180,180,180,180,-152,-155,180,180,180,-46,180,-177,-178,-164,-165,-166,-167,-168,180,180,180,-170,-183,-150,-153,180,180,180,180,180,-52,-147,-148,-149,-169,-154,-151,180,-51,180,180,-36,-37,-38,180,-39,-40,]),'=':([29,48,51,67,85,92,95,104,118,121,129,140,142,143,144,145,146,147,155,171,172,173,174,175,176,177,178,179,180,181,182,183,187,189,227,228,229,238,239,240,241,248,249,250,251,252,253,274,275,276,277,278,279,280,281,283,284,286,287,288,289,295,296,297,298,309,310,311,312,313,314,319,320,332,333,337,338,340,341,342,343,346,347,],[-191,-205,-189,-195,181,-187,-185,-192,-206,-190,-174,-171,-184,-172,-173,-175,-176,181,-196,181,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-186,-188,181,181,181,181,-152,-155,181,181,181,-46,181,-177,-178,-164,-165,-166,-167,-168,181,181,181,-170,-183,-150,-153,181,181,181,181,181,-52,-147,-148,-149,-169,-154,-151,181,-51,181,342,342,181,346,-37,-38,181,-39,-40,]),'t_pclose':([29,48,51,67,85,90,91,92,95,104,118,121,129,140,142,143,144,145,146,147,155,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,187,189,227,228,229,231,232,238,239,240,241,248,249,250,252,253,269,274,275,276,277,278,279,280,281,282,283,284,286,287,289,295,296,297,298,309,310,311,312,313,314,320,323,324,325,326,327,328,333,337,345,348,],[-191,-205,-189,-195,-229,187,188,-187,-185,-192,-206,-190,-174,-171,-184,-172,-173,-175,-176,-229,-196,247,-42,-45,-47,-48,-49,-156,-157,-158,-159,-160,-161,-162,-163,-174,-186,-188,-229,-229,-229,283,187,286,-152,-155,-229,-229,-229,-46,-177,-178,307,-164,-165,-166,-167,-168,309,310,311,312,-170,-183,-150,-153,314,-44,-43,-50,-52,-147,-148,-149,-169,-154,-151,-51,334,-117,-118,-119,-120,-121,339,344,349,350,]),'<':([29,48,51,67,92,95,104,118,121,129,140,142,143,144,145,146,155,175,176,177,178,179,180,181,182,187,189,252,253,274,275,276,277,278,283,284,286,309,310,311,312,314,333,337,342,],[-191,-205,-189,-195,-187,-185,-192,-206,-190,-174,-171,-184,-172,-173,-175,-176,-196,-156,-157,-158,-159,-160,-161,-162,-163,-186,-188,-177,-178,-164,-165,-166,-167,-168,-170,-183,-150,-147,-148,-149,-169,-151,341,341,347,]),'less_arguments':([78,85,164,165,166,167,],[162,170,-67,-68,-69,-70,]),'t_isclose':([92,95,187,189,234,235,236,237,285,],[-187,-185,-186,-188,284,-182,-179,-180,-181,]),'css_media_type':([103,195,196,203,204,207,208,259,267,268,286,309,310,311,314,],[206,206,206,206,206,-226,-228,206,-225,-227,-150,-147,-148,-149,-151,]),'t_not':([103,195,196,259,286,309,310,311,314,],[207,207,207,207,-150,-147,-148,-149,-151,]),'t_only':([103,195,196,259,286,309,310,311,314,],[208,208,208,208,-150,-147,-148,-149,-151,]),'t_and':([202,205,206,260,263,264,265,266,303,305,306,307,321,334,],[262,262,-213,262,262,262,262,-214,-114,262,262,-115,-113,-116,]),'css_media_feature':([209,],[269,]),'less_when':([247,],[294,]),'less_not':([294,330,331,],[318,318,318,]),'less_and':([316,317,335,336,339,344,349,350,],[331,-31,-29,-30,-35,-33,-34,-32,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'tunit':([0,],[1,]),'unit_list':([0,],[2,]),'unit':([0,2,],[3,58,]),'statement':([0,2,],[4,4,]),'variable_decl':([0,2,14,16,69,88,],[5,5,72,72,72,72,]),'block_decl':([0,2,14,16,69,88,],[6,6,74,74,74,74,]),'mixin_decl':([0,2,14,16,69,88,],[7,7,75,75,75,75,]),'call_mixin':([0,2,14,16,69,88,],[8,8,76,76,76,76,]),'import_statement':([0,2,14,16,69,88,],[9,9,77,77,77,77,]),'variable':([0,2,14,16,17,19,61,69,78,85,88,89,93,130,138,139,141,147,160,171,190,220,221,222,223,224,225,226,227,228,229,230,234,238,241,248,249,251,279,280,281,288,289,295,296,297,308,319,322,329,332,338,343,],[12,12,12,12,90,95,129,12,129,183,12,90,129,129,95,232,236,129,129,129,129,129,129,129,129,129,129,129,129,129,129,232,236,129,129,183,183,129,129,129,129,129,129,129,129,129,325,129,232,95,129,129,129,]),'block_open':([0,2,14,16,69,88,],[14,14,14,14,14,14,]),'identifier':([0,2,14,16,69,88,],[15,15,15,15,15,15,]),'open_mixin':([0,2,14,16,69,88,],[16,16,16,16,16,16,]),'media_query_decl':([0,2,14,16,69,88,],[21,21,21,21,21,21,]),'number':([0,2,14,16,61,69,78,85,88,93,130,139,147,160,171,190,220,221,222,223,224,225,226,227,228,229,230,238,241,248,249,251,279,280,281,288,289,295,296,297,308,319,322,332,338,343,],[24,24,24,24,144,24,144,144,24,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,324,144,144,144,144,144,]),'identifier_list':([0,2,14,16,69,88,93,],[25,25,25,25,25,25,191,]),'page':([0,2,14,16,69,88,],[26,26,26,26,26,26,]),'filter':([0,2,14,16,26,35,40,69,88,93,101,105,106,107,113,210,211,212,],[27,27,27,27,102,27,115,27,27,27,27,27,27,27,115,27,27,27,]),'identifier_group':([0,2,14,16,69,88,93,101,],[30,30,30,30,30,30,30,199,]),'child_selector':([0,2,14,16,30,69,88,93,101,105,106,107,199,],[34,34,34,34,105,34,34,34,34,34,34,34,105,]),'ident_parts':([0,2,14,16,69,88,93,101,105,106,107,],[35,35,35,35,35,35,35,35,210,211,212,]),'general_sibling_selector':([0,2,14,16,30,69,88,93,101,105,106,107,199,],[37,37,37,37,107,37,37,37,37,37,37,37,107,]),'ident_part':([0,2,14,16,35,69,88,93,101,105,106,107,210,211,212,],[39,39,39,39,112,39,39,39,39,39,39,39,112,112,112,]),'filter_group':([0,2,14,16,35,69,88,93,101,105,106,107,210,211,212,],[40,40,40,40,113,40,40,40,40,40,40,40,113,113,113,]),'selector':([0,2,14,16,69,88,93,101,105,106,107,],[41,41,41,41,41,41,41,41,41,41,41,]),'iclass':([0,2,14,16,35,69,88,93,101,105,106,107,210,211,212,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'id':([0,2,14,16,35,69,85,88,93,101,105,106,107,147,171,210,211,212,227,228,229,238,241,248,249,251,279,280,281,288,289,295,296,297,319,332,338,343,],[43,43,43,43,43,43,179,43,43,43,43,43,43,179,179,43,43,43,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,]),'dom':([0,2,14,16,35,69,88,93,101,105,106,107,210,211,212,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'combinator':([0,2,14,16,35,69,88,93,101,105,106,107,210,211,212,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'color':([0,2,14,16,35,61,69,78,85,88,93,101,105,106,107,130,139,147,160,171,190,210,211,212,220,221,222,223,224,225,226,227,228,229,230,238,241,248,249,251,279,280,281,288,289,295,296,297,308,319,322,332,338,343,],[46,46,46,46,46,143,46,143,143,46,192,46,46,46,46,143,143,143,143,143,143,46,46,46,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,327,143,143,143,143,143,]),'iclass_part_list':([0,2,14,16,35,69,88,93,101,105,106,107,210,211,212,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'iclass_part':([0,2,14,16,35,47,69,88,93,101,105,106,107,210,211,212,],[55,55,55,55,55,117,55,55,55,55,55,55,55,55,55,55,]),'class':([0,2,14,16,35,47,69,88,93,101,105,106,107,210,211,212,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'word':([13,14,16,60,61,62,69,78,79,85,88,93,94,130,139,147,160,163,171,190,220,221,222,223,224,225,226,227,228,229,230,238,241,248,249,251,279,280,281,288,289,295,296,297,308,319,322,332,338,343,],[63,82,82,128,134,150,82,134,82,178,82,134,197,134,233,178,134,82,178,134,134,134,233,233,233,233,233,178,178,178,233,178,178,178,178,178,178,178,178,178,178,178,178,178,326,178,233,178,178,178,]),'vendor_property':([13,14,16,45,61,62,69,78,79,85,88,93,94,130,139,147,160,163,171,190,220,221,222,223,224,225,226,227,228,229,230,238,241,248,249,251,279,280,281,288,289,295,296,297,308,319,322,332,338,343,],[64,81,81,116,136,151,81,136,81,185,81,136,185,136,185,185,136,81,185,136,136,136,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,185,]),'declaration_list':([14,16,],[69,88,]),'declaration':([14,16,69,88,],[70,70,158,158,]),'empty':([14,16,78,85,147,227,228,229,241,248,249,],[71,71,161,174,239,239,239,239,239,174,174,]),'property_decl':([14,16,69,88,],[73,73,73,73,]),'prop_open':([14,16,69,79,88,163,],[78,78,78,164,78,164,]),'property':([14,16,61,69,78,79,85,88,93,94,130,139,147,160,163,171,190,220,221,222,223,224,225,226,227,228,229,230,238,241,248,249,251,279,280,281,288,289,295,296,297,308,319,322,332,338,343,],[80,80,135,80,135,80,184,80,135,184,135,184,184,135,80,184,135,135,135,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,184,]),'brace_open':([15,21,23,24,98,247,293,],[86,97,99,100,198,292,315,]),'estring':([17,61,78,85,93,130,147,160,171,190,220,221,227,228,229,238,241,248,249,251,279,280,281,288,289,295,296,297,319,332,338,343,],[91,137,137,177,137,137,177,137,177,137,137,137,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,177,]),'style_list':([61,78,93,],[130,160,190,]),'style':([61,78,93,130,160,190,220,221,],[131,131,131,219,219,219,272,273,]),'expression':([61,78,85,93,130,139,147,160,171,190,220,221,222,223,224,225,226,227,228,229,230,238,241,248,249,251,279,280,281,288,289,295,296,297,308,319,322,332,338,343,],[132,132,175,132,132,231,175,132,175,132,132,132,274,275,276,277,278,175,175,175,282,175,175,175,175,175,175,175,175,175,175,175,175,175,328,175,231,175,175,175,]),'string':([61,78,85,93,94,130,147,160,171,190,220,221,227,228,229,238,241,248,249,251,279,280,281,288,289,295,296,297,319,332,338,343,],[133,133,176,133,194,133,176,133,176,133,133,133,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,176,]),'factor':([61,78,85,93,130,139,147,160,171,190,220,221,222,223,224,225,226,227,228,229,230,238,241,248,249,251,279,280,281,288,289,295,296,297,308,319,322,332,338,343,],[140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,]),'fcall':([61,78,85,93,94,130,139,147,160,171,190,220,221,222,223,224,225,226,227,228,229,230,238,241,248,249,251,279,280,281,288,289,295,296,297,308,319,322,332,338,343,],[146,146,182,146,196,146,146,182,146,182,146,146,146,146,146,146,146,146,182,182,182,146,182,182,182,182,182,182,182,182,182,182,182,182,182,146,182,146,182,182,182,]),'ms_filter':([61,78,85,93,94,130,139,147,160,171,190,220,221,222,223,224,225,226,227,228,229,230,238,241,248,249,251,279,280,281,288,289,295,296,297,308,319,322,332,338,343,],[148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,]),'brace_close':([69,88,],[157,186,]),'mixin_args_list':([85,],[169,]),'mixin_args':([85,248,249,],[171,295,296,]),'argument':([85,147,171,227,228,229,238,241,248,249,251,279,280,281,288,289,295,296,297,319,332,338,343,],[172,240,250,240,240,240,287,240,172,172,298,287,287,287,313,287,250,250,320,333,337,345,348,]),'mixin_kwarg':([85,248,249,],[173,173,173,]),'media_query_list':([103,195,196,],[200,256,258,]),'media_query':([103,195,196,259,],[201,201,201,301,]),'media_type':([103,195,196,203,204,259,],[202,202,202,263,264,202,]),'not':([103,195,196,259,],[203,203,203,203,]),'only':([103,195,196,259,],[204,204,204,204,]),'media_query_expression':([103,195,196,259,261,302,],[205,205,205,205,303,321,]),'string_part_list':([141,],[234,]),'string_part':([141,234,],[235,285,]),'argument_list':([147,227,228,229,241,],[238,279,280,281,289,]),'media_query_expression_list':([202,205,263,264,],[260,265,305,306,]),'and':([202,205,260,263,264,265,305,306,],[261,261,302,261,261,302,302,302,]),'mixin_guard':([247,],[293,]),'mixin_kwarg_arg_list':([251,],[297,]),'mixin_guard_cond_list':([294,],[316,]),'mixin_guard_cond':([294,330,331,],[317,335,336,]),'media_query_value':([308,],[323,]),'mixin_guard_cmp':([333,337,],[338,343,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> tunit","S'",1,None,None,None),
+  ('tunit -> unit_list','tunit',1,'p_tunit','parser.py',369),
+  ('unit_list -> unit_list unit','unit_list',2,'p_unit_list','parser.py',374),
+  ('unit_list -> unit','unit_list',1,'p_unit_list','parser.py',375),
+  ('unit -> statement','unit',1,'p_unit','parser.py',388),
+  ('unit -> variable_decl','unit',1,'p_unit','parser.py',389),
+  ('unit -> block_decl','unit',1,'p_unit','parser.py',390),
+  ('unit -> mixin_decl','unit',1,'p_unit','parser.py',391),
+  ('unit -> call_mixin','unit',1,'p_unit','parser.py',392),
+  ('unit -> import_statement','unit',1,'p_unit','parser.py',393),
+  ('statement -> css_charset t_ws css_string t_semicolon','statement',4,'p_statement_aux','parser.py',402),
+  ('statement -> css_namespace t_ws css_string t_semicolon','statement',4,'p_statement_aux','parser.py',403),
+  ('statement -> css_namespace t_ws word css_string t_semicolon','statement',5,'p_statement_namespace','parser.py',409),
+  ('import_statement -> css_import t_ws string t_semicolon','import_statement',4,'p_statement_import','parser.py',415),
+  ('import_statement -> css_import t_ws css_string t_semicolon','import_statement',4,'p_statement_import','parser.py',416),
+  ('import_statement -> css_import t_ws css_string media_query_list t_semicolon','import_statement',5,'p_statement_import','parser.py',417),
+  ('import_statement -> css_import t_ws fcall t_semicolon','import_statement',4,'p_statement_import','parser.py',418),
+  ('import_statement -> css_import t_ws fcall media_query_list t_semicolon','import_statement',5,'p_statement_import','parser.py',419),
+  ('block_decl -> block_open declaration_list brace_close','block_decl',3,'p_block','parser.py',461),
+  ('block_decl -> identifier t_semicolon','block_decl',2,'p_block_replace','parser.py',468),
+  ('block_open -> identifier brace_open','block_open',2,'p_block_open','parser.py',479),
+  ('block_open -> media_query_decl brace_open','block_open',2,'p_block_open_media_query','parser.py',489),
+  ('block_open -> css_font_face t_ws brace_open','block_open',3,'p_font_face_open','parser.py',494),
+  ('block_open -> css_keyframe_selector brace_open','block_open',2,'p_keyframe_open','parser.py',499),
+  ('block_open -> number brace_open','block_open',2,'p_keyframe_open','parser.py',500),
+  ('mixin_decl -> open_mixin declaration_list brace_close','mixin_decl',3,'p_mixin','parser.py',509),
+  ('open_mixin -> identifier t_popen mixin_args_list t_pclose brace_open','open_mixin',5,'p_open_mixin','parser.py',516),
+  ('open_mixin -> identifier t_popen mixin_args_list t_pclose mixin_guard brace_open','open_mixin',6,'p_open_mixin','parser.py',517),
+  ('mixin_guard -> less_when mixin_guard_cond_list','mixin_guard',2,'p_mixin_guard','parser.py',528),
+  ('mixin_guard_cond_list -> mixin_guard_cond_list t_comma mixin_guard_cond','mixin_guard_cond_list',3,'p_mixin_guard_cond_list_aux','parser.py',533),
+  ('mixin_guard_cond_list -> mixin_guard_cond_list less_and mixin_guard_cond','mixin_guard_cond_list',3,'p_mixin_guard_cond_list_aux','parser.py',534),
+  ('mixin_guard_cond_list -> mixin_guard_cond','mixin_guard_cond_list',1,'p_mixin_guard_cond_list','parser.py',541),
+  ('mixin_guard_cond -> less_not t_popen argument mixin_guard_cmp argument t_pclose','mixin_guard_cond',6,'p_mixin_guard_cond_rev','parser.py',546),
+  ('mixin_guard_cond -> less_not t_popen argument t_pclose','mixin_guard_cond',4,'p_mixin_guard_cond_rev','parser.py',547),
+  ('mixin_guard_cond -> t_popen argument mixin_guard_cmp argument t_pclose','mixin_guard_cond',5,'p_mixin_guard_cond','parser.py',552),
+  ('mixin_guard_cond -> t_popen argument t_pclose','mixin_guard_cond',3,'p_mixin_guard_cond','parser.py',553),
+  ('mixin_guard_cmp -> >','mixin_guard_cmp',1,'p_mixin_guard_cmp','parser.py',558),
+  ('mixin_guard_cmp -> <','mixin_guard_cmp',1,'p_mixin_guard_cmp','parser.py',559),
+  ('mixin_guard_cmp -> =','mixin_guard_cmp',1,'p_mixin_guard_cmp','parser.py',560),
+  ('mixin_guard_cmp -> > =','mixin_guard_cmp',2,'p_mixin_guard_cmp','parser.py',561),
+  ('mixin_guard_cmp -> = <','mixin_guard_cmp',2,'p_mixin_guard_cmp','parser.py',562),
+  ('call_mixin -> identifier t_popen mixin_args_list t_pclose t_semicolon','call_mixin',5,'p_call_mixin','parser.py',567),
+  ('mixin_args_list -> less_arguments','mixin_args_list',1,'p_mixin_args_arguments','parser.py',573),
+  ('mixin_args_list -> mixin_args_list t_comma mixin_args','mixin_args_list',3,'p_mixin_args_list_aux','parser.py',578),
+  ('mixin_args_list -> mixin_args_list t_semicolon mixin_args','mixin_args_list',3,'p_mixin_args_list_aux','parser.py',579),
+  ('mixin_args_list -> mixin_args','mixin_args_list',1,'p_mixin_args_list','parser.py',585),
+  ('mixin_args -> mixin_args argument','mixin_args',2,'p_mixin_args_aux','parser.py',590),
+  ('mixin_args -> argument','mixin_args',1,'p_mixin_args','parser.py',596),
+  ('mixin_args -> mixin_kwarg','mixin_args',1,'p_mixin_args','parser.py',597),
+  ('mixin_args -> empty','mixin_args',1,'p_mixin_args_empty','parser.py',602),
+  ('mixin_kwarg -> variable t_colon mixin_kwarg_arg_list','mixin_kwarg',3,'p_mixin_kwarg','parser.py',607),
+  ('mixin_kwarg_arg_list -> mixin_kwarg_arg_list argument','mixin_kwarg_arg_list',2,'p_margument_list_aux','parser.py',612),
+  ('mixin_kwarg_arg_list -> argument','mixin_kwarg_arg_list',1,'p_margument_list','parser.py',618),
+  ('declaration_list -> declaration_list declaration','declaration_list',2,'p_declaration_list','parser.py',627),
+  ('declaration_list -> declaration','declaration_list',1,'p_declaration_list','parser.py',628),
+  ('declaration_list -> empty','declaration_list',1,'p_declaration_list','parser.py',629),
+  ('declaration -> variable_decl','declaration',1,'p_declaration','parser.py',636),
+  ('declaration -> property_decl','declaration',1,'p_declaration','parser.py',637),
+  ('declaration -> block_decl','declaration',1,'p_declaration','parser.py',638),
+  ('declaration -> mixin_decl','declaration',1,'p_declaration','parser.py',639),
+  ('declaration -> call_mixin','declaration',1,'p_declaration','parser.py',640),
+  ('declaration -> import_statement','declaration',1,'p_declaration','parser.py',641),
+  ('variable_decl -> variable t_colon style_list t_semicolon','variable_decl',4,'p_variable_decl','parser.py',650),
+  ('property_decl -> prop_open style_list t_semicolon','property_decl',3,'p_property_decl','parser.py',660),
+  ('property_decl -> prop_open style_list css_important t_semicolon','property_decl',4,'p_property_decl','parser.py',661),
+  ('property_decl -> prop_open empty t_semicolon','property_decl',3,'p_property_decl','parser.py',662),
+  ('property_decl -> prop_open less_arguments t_semicolon','property_decl',3,'p_property_decl_arguments','parser.py',668),
+  ('prop_open -> * prop_open','prop_open',2,'p_prop_open_ie_hack','parser.py',673),
+  ('prop_open -> property t_colon','prop_open',2,'p_prop_open','parser.py',678),
+  ('prop_open -> vendor_property t_colon','prop_open',2,'p_prop_open','parser.py',679),
+  ('prop_open -> word t_colon','prop_open',2,'p_prop_open','parser.py',680),
+  ('style_list -> style_list style','style_list',2,'p_style_list_aux','parser.py',689),
+  ('style_list -> style_list t_comma style','style_list',3,'p_style_list_aux','parser.py',690),
+  ('style_list -> style_list t_ws style','style_list',3,'p_style_list_aux','parser.py',691),
+  ('style_list -> style','style_list',1,'p_style_list','parser.py',697),
+  ('style -> expression','style',1,'p_style','parser.py',702),
+  ('style -> string','style',1,'p_style','parser.py',703),
+  ('style -> word','style',1,'p_style','parser.py',704),
+  ('style -> property','style',1,'p_style','parser.py',705),
+  ('style -> vendor_property','style',1,'p_style','parser.py',706),
+  ('style -> estring','style',1,'p_style','parser.py',707),
+  ('identifier -> identifier_list','identifier',1,'p_identifier','parser.py',716),
+  ('identifier -> page','identifier',1,'p_identifier','parser.py',717),
+  ('identifier -> page filter','identifier',2,'p_identifier','parser.py',718),
+  ('identifier -> t_popen estring t_pclose','identifier',3,'p_identifier_istr','parser.py',723),
+  ('identifier_list -> identifier_list t_comma identifier_group','identifier_list',3,'p_identifier_list_aux','parser.py',728),
+  ('identifier_list -> identifier_group','identifier_list',1,'p_identifier_list','parser.py',735),
+  ('identifier_list -> css_keyframes t_ws css_ident','identifier_list',3,'p_identifier_list_keyframe','parser.py',740),
+  ('identifier_list -> css_keyframes t_ws css_ident t_ws','identifier_list',4,'p_identifier_list_keyframe','parser.py',741),
+  ('identifier_list -> css_viewport','identifier_list',1,'p_identifier_list_viewport','parser.py',746),
+  ('identifier_list -> css_viewport t_ws','identifier_list',2,'p_identifier_list_viewport','parser.py',747),
+  ('identifier_group -> identifier_group child_selector ident_parts','identifier_group',3,'p_identifier_group_op','parser.py',752),
+  ('identifier_group -> identifier_group + ident_parts','identifier_group',3,'p_identifier_group_op','parser.py',753),
+  ('identifier_group -> identifier_group general_sibling_selector ident_parts','identifier_group',3,'p_identifier_group_op','parser.py',754),
+  ('identifier_group -> identifier_group *','identifier_group',2,'p_identifier_group_op','parser.py',755),
+  ('identifier_group -> ident_parts','identifier_group',1,'p_identifier_group','parser.py',763),
+  ('ident_parts -> ident_parts ident_part','ident_parts',2,'p_ident_parts_aux','parser.py',768),
+  ('ident_parts -> ident_parts filter_group','ident_parts',2,'p_ident_parts_aux','parser.py',769),
+  ('ident_parts -> ident_part','ident_parts',1,'p_ident_parts','parser.py',778),
+  ('ident_parts -> selector','ident_parts',1,'p_ident_parts','parser.py',779),
+  ('ident_parts -> filter_group','ident_parts',1,'p_ident_parts','parser.py',780),
+  ('media_query_decl -> css_media t_ws','media_query_decl',2,'p_media_query_decl','parser.py',791),
+  ('media_query_decl -> css_media t_ws media_query_list','media_query_decl',3,'p_media_query_decl','parser.py',792),
+  ('media_query_list -> media_query_list t_comma media_query','media_query_list',3,'p_media_query_list_aux','parser.py',797),
+  ('media_query_list -> media_query','media_query_list',1,'p_media_query_list','parser.py',802),
+  ('media_query -> media_type','media_query',1,'p_media_query_a','parser.py',807),
+  ('media_query -> media_type media_query_expression_list','media_query',2,'p_media_query_a','parser.py',808),
+  ('media_query -> not media_type','media_query',2,'p_media_query_a','parser.py',809),
+  ('media_query -> not media_type media_query_expression_list','media_query',3,'p_media_query_a','parser.py',810),
+  ('media_query -> only media_type','media_query',2,'p_media_query_a','parser.py',811),
+  ('media_query -> only media_type media_query_expression_list','media_query',3,'p_media_query_a','parser.py',812),
+  ('media_query -> media_query_expression media_query_expression_list','media_query',2,'p_media_query_b','parser.py',817),
+  ('media_query -> media_query_expression','media_query',1,'p_media_query_b','parser.py',818),
+  ('media_query_expression_list -> media_query_expression_list and media_query_expression','media_query_expression_list',3,'p_media_query_expression_list_aux','parser.py',823),
+  ('media_query_expression_list -> and media_query_expression','media_query_expression_list',2,'p_media_query_expression_list_aux','parser.py',824),
+  ('media_query_expression -> t_popen css_media_feature t_pclose','media_query_expression',3,'p_media_query_expression','parser.py',829),
+  ('media_query_expression -> t_popen css_media_feature t_colon media_query_value t_pclose','media_query_expression',5,'p_media_query_expression','parser.py',830),
+  ('media_query_value -> number','media_query_value',1,'p_media_query_value','parser.py',835),
+  ('media_query_value -> variable','media_query_value',1,'p_media_query_value','parser.py',836),
+  ('media_query_value -> word','media_query_value',1,'p_media_query_value','parser.py',837),
+  ('media_query_value -> color','media_query_value',1,'p_media_query_value','parser.py',838),
+  ('media_query_value -> expression','media_query_value',1,'p_media_query_value','parser.py',839),
+  ('selector -> *','selector',1,'p_selector','parser.py',859),
+  ('selector -> +','selector',1,'p_selector','parser.py',860),
+  ('selector -> child_selector','selector',1,'p_selector','parser.py',861),
+  ('selector -> general_sibling_selector','selector',1,'p_selector','parser.py',862),
+  ('ident_part -> iclass','ident_part',1,'p_ident_part','parser.py',867),
+  ('ident_part -> id','ident_part',1,'p_ident_part','parser.py',868),
+  ('ident_part -> dom','ident_part',1,'p_ident_part','parser.py',869),
+  ('ident_part -> combinator','ident_part',1,'p_ident_part','parser.py',870),
+  ('ident_part -> color','ident_part',1,'p_ident_part','parser.py',871),
+  ('ident_part -> combinator vendor_property','ident_part',2,'p_ident_part_aux','parser.py',876),
+  ('filter_group -> filter_group filter','filter_group',2,'p_filter_group_aux','parser.py',885),
+  ('filter_group -> filter','filter_group',1,'p_filter_group','parser.py',891),
+  ('filter -> css_filter','filter',1,'p_filter','parser.py',896),
+  ('filter -> css_filter t_ws','filter',2,'p_filter','parser.py',897),
+  ('filter -> t_colon word','filter',2,'p_filter','parser.py',898),
+  ('filter -> t_colon vendor_property','filter',2,'p_filter','parser.py',899),
+  ('filter -> t_colon vendor_property t_ws','filter',3,'p_filter','parser.py',900),
+  ('filter -> t_colon css_property','filter',2,'p_filter','parser.py',901),
+  ('filter -> t_colon css_property t_ws','filter',3,'p_filter','parser.py',902),
+  ('filter -> t_colon css_filter','filter',2,'p_filter','parser.py',903),
+  ('filter -> t_colon css_filter t_ws','filter',3,'p_filter','parser.py',904),
+  ('filter -> t_colon t_colon word','filter',3,'p_filter','parser.py',905),
+  ('filter -> t_colon t_colon vendor_property','filter',3,'p_filter','parser.py',906),
+  ('ms_filter -> css_ms_filter','ms_filter',1,'p_ms_filter','parser.py',915),
+  ('ms_filter -> css_ms_filter t_ws','ms_filter',2,'p_ms_filter','parser.py',916),
+  ('fcall -> word t_popen argument_list t_pclose','fcall',4,'p_fcall','parser.py',921),
+  ('fcall -> property t_popen argument_list t_pclose','fcall',4,'p_fcall','parser.py',922),
+  ('fcall -> vendor_property t_popen argument_list t_pclose','fcall',4,'p_fcall','parser.py',923),
+  ('fcall -> less_open_format argument_list t_pclose','fcall',3,'p_fcall','parser.py',924),
+  ('fcall -> ms_filter t_popen argument_list t_pclose','fcall',4,'p_fcall','parser.py',925),
+  ('argument_list -> empty','argument_list',1,'p_argument_list_empty','parser.py',934),
+  ('argument_list -> argument_list argument','argument_list',2,'p_argument_list_aux','parser.py',939),
+  ('argument_list -> argument_list t_comma argument','argument_list',3,'p_argument_list_aux','parser.py',940),
+  ('argument_list -> argument','argument_list',1,'p_argument_list','parser.py',946),
+  ('argument -> expression','argument',1,'p_argument','parser.py',951),
+  ('argument -> string','argument',1,'p_argument','parser.py',952),
+  ('argument -> estring','argument',1,'p_argument','parser.py',953),
+  ('argument -> word','argument',1,'p_argument','parser.py',954),
+  ('argument -> id','argument',1,'p_argument','parser.py',955),
+  ('argument -> css_uri','argument',1,'p_argument','parser.py',956),
+  ('argument -> =','argument',1,'p_argument','parser.py',957),
+  ('argument -> fcall','argument',1,'p_argument','parser.py',958),
+  ('expression -> expression + expression','expression',3,'p_expression_aux','parser.py',967),
+  ('expression -> expression - expression','expression',3,'p_expression_aux','parser.py',968),
+  ('expression -> expression / expression','expression',3,'p_expression_aux','parser.py',969),
+  ('expression -> expression * expression','expression',3,'p_expression_aux','parser.py',970),
+  ('expression -> word / expression','expression',3,'p_expression_aux','parser.py',971),
+  ('expression -> - t_popen expression t_pclose','expression',4,'p_expression_p_neg','parser.py',976),
+  ('expression -> t_popen expression t_pclose','expression',3,'p_expression_p','parser.py',981),
+  ('expression -> factor','expression',1,'p_expression','parser.py',986),
+  ('factor -> color','factor',1,'p_factor','parser.py',991),
+  ('factor -> number','factor',1,'p_factor','parser.py',992),
+  ('factor -> variable','factor',1,'p_factor','parser.py',993),
+  ('factor -> css_dom','factor',1,'p_factor','parser.py',994),
+  ('factor -> fcall','factor',1,'p_factor','parser.py',995),
+  ('estring -> t_eopen style_list t_eclose','estring',3,'p_escaped_string','parser.py',1004),
+  ('estring -> t_eopen identifier_list t_eclose','estring',3,'p_escaped_string','parser.py',1005),
+  ('string_part -> variable','string_part',1,'p_string_part','parser.py',1014),
+  ('string_part -> css_string','string_part',1,'p_string_part','parser.py',1015),
+  ('string_part_list -> string_part_list string_part','string_part_list',2,'p_string_part_list_aux','parser.py',1020),
+  ('string_part_list -> string_part','string_part_list',1,'p_string_part_list','parser.py',1026),
+  ('string -> t_isopen string_part_list t_isclose','string',3,'p_string_aux','parser.py',1031),
+  ('string -> css_string','string',1,'p_string','parser.py',1036),
+  ('variable -> - variable','variable',2,'p_variable_neg','parser.py',1045),
+  ('variable -> t_popen variable t_pclose','variable',3,'p_variable_strange','parser.py',1050),
+  ('variable -> less_variable','variable',1,'p_variable','parser.py',1055),
+  ('variable -> less_variable t_ws','variable',2,'p_variable','parser.py',1056),
+  ('color -> css_color','color',1,'p_color','parser.py',1062),
+  ('color -> css_color t_ws','color',2,'p_color','parser.py',1063),
+  ('number -> css_number','number',1,'p_number','parser.py',1075),
+  ('number -> css_number t_ws','number',2,'p_number','parser.py',1076),
+  ('dom -> css_dom','dom',1,'p_dom','parser.py',1081),
+  ('dom -> css_dom t_ws','dom',2,'p_dom','parser.py',1082),
+  ('word -> css_ident','word',1,'p_word','parser.py',1087),
+  ('word -> css_ident t_ws','word',2,'p_word','parser.py',1088),
+  ('class -> css_class','class',1,'p_class','parser.py',1097),
+  ('class -> css_class t_ws','class',2,'p_class','parser.py',1098),
+  ('iclass_part -> less_variable','iclass_part',1,'p_interpolated_class_part','parser.py',1103),
+  ('iclass_part -> less_variable t_ws','iclass_part',2,'p_interpolated_class_part','parser.py',1104),
+  ('iclass_part -> class','iclass_part',1,'p_interpolated_class_part','parser.py',1105),
+  ('iclass_part_list -> iclass_part_list iclass_part','iclass_part_list',2,'p_interpolated_class_part_list_aux','parser.py',1110),
+  ('iclass_part_list -> iclass_part','iclass_part_list',1,'p_interpolated_class_part_list','parser.py',1116),
+  ('iclass -> iclass_part_list','iclass',1,'p_interpolated_class','parser.py',1121),
+  ('id -> css_id','id',1,'p_id','parser.py',1130),
+  ('id -> css_id t_ws','id',2,'p_id','parser.py',1131),
+  ('property -> css_property','property',1,'p_property','parser.py',1136),
+  ('property -> css_property t_ws','property',2,'p_property','parser.py',1137),
+  ('page -> css_page','page',1,'p_page','parser.py',1142),
+  ('page -> css_page t_ws','page',2,'p_page','parser.py',1143),
+  ('vendor_property -> css_vendor_property','vendor_property',1,'p_vendor_property','parser.py',1148),
+  ('vendor_property -> css_vendor_property t_ws','vendor_property',2,'p_vendor_property','parser.py',1149),
+  ('media_type -> css_media_type','media_type',1,'p_media_type','parser.py',1154),
+  ('media_type -> css_media_type t_ws','media_type',2,'p_media_type','parser.py',1155),
+  ('combinator -> & t_ws','combinator',2,'p_combinator','parser.py',1160),
+  ('combinator -> &','combinator',1,'p_combinator','parser.py',1161),
+  ('child_selector -> > t_ws','child_selector',2,'p_child_selector','parser.py',1166),
+  ('child_selector -> >','child_selector',1,'p_child_selector','parser.py',1167),
+  ('general_sibling_selector -> t_tilde t_ws','general_sibling_selector',2,'p_general_sibling_selector','parser.py',1172),
+  ('general_sibling_selector -> t_tilde','general_sibling_selector',1,'p_general_sibling_selector','parser.py',1173),
+  ('brace_open -> t_bopen','brace_open',1,'p_scope_open','parser.py',1178),
+  ('brace_close -> t_bclose','brace_close',1,'p_scope_close','parser.py',1184),
+  ('and -> t_and t_ws','and',2,'p_and','parser.py',1189),
+  ('and -> t_and','and',1,'p_and','parser.py',1190),
+  ('not -> t_not t_ws','not',2,'p_not','parser.py',1195),
+  ('not -> t_not','not',1,'p_not','parser.py',1196),
+  ('only -> t_only t_ws','only',2,'p_only','parser.py',1201),
+  ('only -> t_only','only',1,'p_only','parser.py',1202),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',1207),
+]
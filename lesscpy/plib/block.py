@@ -7,8 +7,12 @@
     See LICENSE for details.
 .. moduleauthor:: Johann T. Mariusson <jtm@robot.is>
 """
+from six import StringIO
+
 from .node import Node
+from lesscpy.lessc import stats
 from lesscpy.lessc import utility
+from lesscpy.lessc.formatter import StripWriter
 from lesscpy.plib.identifier import Identifier
 
 
@@ -22,6 +26,8 @@ class Block(Node):
     }
     """
 
+    __slots__ = ('name', 'inner', 'inner_media_queries', 'block_name')
+
     def parse(self, scope):
         """Parse block node.
         args:
@@ -146,35 +152,48 @@ class Block(Node):
         returns:
             str (CSS)
         """
-        f = "%(identifier)s%(ws)s{%(nl)s%(proplist)s}%(eb)s"
-        out = []
+        out = StringIO()
+        self.write(fills, out)
+        return out.getvalue()
+
+    def write(self, fills, stream):
+        """Write formatted block (CSS) to stream. Media query
+        content is indented as it is written.
+        args:
+            fills (dict): Fill elements
+            stream (file): File like object
+        """
         name = self.name.fmt(fills)
-        if self.parsed and any(p for p in self.parsed if str(type(p)) != "<class 'lesscpy.plib.variable.Variable'>"):
-            fills.update({
-                'identifier': name,
-                'proplist': ''.join([p.fmt(fills) for p in self.parsed if p]),
-            })
-            out.append(f % fills)
+        head = '%s%s{%s' % (name, fills['ws'], fills['nl'])
+        tail = '}%s' % fills['eb']
+        if self.parsed and any(p for p in self.parsed
+                               if not getattr(p, 'is_variable', False)):
+            stream.write(head)
+            for p in self.parsed:
+                if p:
+                    p.write(fills, stream)
+            stream.write(tail)
         if hasattr(self, 'inner'):
             if self.name.subparse and len(self.inner) > 0:  # @media
-                inner = ''.join([p.fmt(fills) for p in self.inner])
-                inner = inner.replace(fills['nl'],
-                                      fills['nl'] + fills['tab']).rstrip(fills['tab'])
-                if not fills['nl']:
-                    inner = inner.strip()
-                fills.update({
-                    'identifier': name,
-                    'proplist': fills['tab'] + inner
-                })
-                out.append(f % fills)
+                stream.write(head + fills['tab'])
+                if fills['nl']:
+                    inner = StripWriter(stream, chars=fills['tab'],
+                                        nl=fills['nl'], tab=fills['tab'])
+                else:
+                    inner = StripWriter(stream, lstrip=True)
+                for p in self.inner:
+                    p.write(fills, inner)
+                stream.write(tail)
             else:
-                out.append(''.join([p.fmt(fills) for p in self.inner]))
-        return ''.join(out)
+                for p in self.inner:
+                    p.write(fills, stream)
 
     def copy(self):
         """ Return a full copy of self
         returns: Block object
         """
+        if stats.local.active:
+            stats.local.active.count('block_copy')
         name, inner = self.tokens
         if inner:
             inner = [u.copy() if u else u
@@ -30,6 +30,8 @@ class Call(Node):
     unknown(3px)       -->  unknown(3px)
     """
 
+    __slots__ = ()
+
     def parse(self, scope):
         """Parse Node within scope.
         the functions ~( and e( map to self.escape
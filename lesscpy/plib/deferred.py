@@ -8,10 +8,13 @@
 .. moduleauthor:: Johann T. Mariusson <jtm@robot.is>
 """
 from .node import Node
+from lesscpy.lessc import stats
 
 
 class Deferred(Node):
 
+    __slots__ = ()
+
     def __init__(self, mixin, args, lineno=0):
         """This node represents mixin calls. The calls
         to these mixins are deferred until the second
@@ -24,7 +27,7 @@ class Deferred(Node):
         self.tokens = [mixin, args]
         self.lineno = lineno
 
-    def parse(self, scope, error=False, depth=0):
+    def parse(self, scope, error=False):
         """ Parse function. We search for mixins
         first within current scope then fallback
         to global scope. The special scope.deferred
@@ -41,7 +44,69 @@ class Deferred(Node):
         returns:
             mixed
         """
+        if not stats.local.active:
+            return self._parse(scope, error)
+        stats.local.active.start('mixins')
+        try:
+            return self._parse(scope, error)
+        finally:
+            stats.local.active.stop()
+
+    def _parse(self, scope, error):
+        """ Parse function, see parse(). Mixin calls in the
+        output of a mixin call are expanded from a stack of
+        frames rather than by recursion, so recursive mixins
+        run at constant Python stack depth. At most scope.budget
+        calls are expanded this way. A call that is on the stack
+        already, with the same target and arguments, would expand
+        forever and is a NameError.
+        """
+        res, key = self._call(scope)
+        if not res:
+            return self._done(scope, error, res, False)
+        # Frame: [node, error, output of call, next index, parsed, store,
+        #         target and arguments of call]
+        stack = [self._frame(scope, error, res, key)]
+        calls = 0
+        while True:
+            frame = stack[-1]
+            node, err, res, i, out, store, _ = frame
+            if i < len(res):
+                frame[3] = i + 1
+                p = res[i]
+                if not p:
+                    continue
+                if not isinstance(p, Deferred):
+                    out.append(p.parse(scope))
+                    continue
+                calls += 1
+                if calls > scope.budget:
+                    raise SyntaxError('Mixin call budget (%d) exceeded in `%s`'
+                                      % (scope.budget, p.tokens[0].raw(True)))
+                sub, key = p._call(scope)
+                if sub and any(f[0] is p and f[6] == key for f in stack):
+                    raise SyntaxError('NameError `%s`'
+                                      % p.tokens[0].raw(True))
+                if sub:
+                    stack.append(p._frame(scope, False, sub, key))
+                else:
+                    out.append(p._done(scope, False, sub, False))
+                continue
+            stack.pop()
+            res = node._done(scope, err, out, store)
+            if not stack:
+                return res
+            stack[-1][4].append(res)
+
+    def _call(self, scope):
+        """ Find mixins (or blocks) by name and call them
+        args:
+            scope (Scope): Current scope
+        returns:
+            tuple (list OR False, target and arguments of the call)
+        """
         res = False
+        key = None
         ident, args = self.tokens
         ident.parse(scope)
         mixins = scope.mixins(ident.raw())
@@ -50,9 +115,6 @@ class Deferred(Node):
             ident.parse(None)
             mixins = scope.mixins(ident.raw())
 
-        if depth > 64:
-            raise SyntaxError('NameError `%s`' % ident.raw(True))
-
         if not mixins:
             if scope.deferred:
                 store = [t for t in scope.deferred.parsed[-1]]
@@ -78,37 +140,49 @@ class Deferred(Node):
                 scope.current = scope.real[-1] if scope.real else None
                 res = block.copy_inner(scope)
                 scope.current = None
+                key = (block, None)
 
         if mixins:
             for mixin in mixins:
                 scope.current = scope.real[-1] if scope.real else None
                 res = mixin.call(scope, args)
                 if res:
-                    # Add variables to scope to support
-                    # closures
-                    [scope.add_variable(v) for v in mixin.vars]
                     scope.deferred = ident
+                    key = (mixin, mixin.bound_args(scope))
                     break
+        return res, key
+
+    def _frame(self, scope, error, res, key):
+        """ Frame for parsing the output of a call
+        args:
+            scope (Scope): Current scope
+            error (bool): Raise if there is no output
+            res (list): Output of the call
+            key (tuple): Target and arguments of the call
+        returns:
+            list
+        """
+        store = [t for t in scope.deferred.parsed[
+            -1]] if scope.deferred else False
+        return [self, error, res, 0, [], store, key]
 
+    def _done(self, scope, error, res, store):
+        """ Finish a call once its output is parsed
+        args:
+            scope (Scope): Current scope
+            error (bool): Raise if there is no output
+            res (list): Parsed output
+            store (list): Name parts of scope.deferred to restore
+        returns:
+            list OR False
+        """
         if res:
-            store = [t for t in scope.deferred.parsed[
-                -1]] if scope.deferred else False
-            tmp_res = []
-            for p in res:
-                if p:
-                    if isinstance(p, Deferred):
-                        tmp_res.append(p.parse(scope, depth=depth + 1))
-                    else:
-                        tmp_res.append(p.parse(scope))
-            res = tmp_res
-            #res = [p.parse(scope, depth=depth+1) for p in res if p]
             while(any(t for t in res if isinstance(t, Deferred))):
                 res = [p.parse(scope) for p in res if p]
-            if store:
-                scope.deferred.parsed[-1] = store
-
+        if store:
+            scope.deferred.parsed[-1] = store
         if error and not res:
-            raise SyntaxError('NameError `%s`' % ident.raw(True))
+            raise SyntaxError('NameError `%s`' % self.tokens[0].raw(True))
         return res
 
     def copy(self):
@@ -22,6 +22,8 @@ class Expression(Node):
     and unary negation (handled in the NegatedExpression class).
     """
 
+    __slots__ = ()
+
     def parse(self, scope):
         """ Parse Node
         args:
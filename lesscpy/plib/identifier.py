@@ -18,6 +18,14 @@ class Identifier(Node):
     """Identifier node. Represents block identifier.
     """
 
+    __slots__ = ('subparse', '_raw')
+
+    _subp = (
+        '@media', '@keyframes',
+        '@-moz-keyframes', '@-webkit-keyframes',
+        '@-ms-keyframes'
+    )
+
     def parse(self, scope):
         """Parse node. Block identifiers are stored as
         strings with spaces replaced with ?
@@ -30,11 +38,6 @@ class Identifier(Node):
         """
         names = []
         name = []
-        self._subp = (
-            '@media', '@keyframes',
-            '@-moz-keyframes', '@-webkit-keyframes',
-            '@-ms-keyframes'
-        )
         if self.tokens and hasattr(self.tokens, 'parse'):
             self.tokens = list(utility.flatten([id.split() + [',']
                                                 for id in self.tokens.parse(scope).split(',')]))
@@ -82,6 +85,7 @@ class Identifier(Node):
         self.parsed = [[i for i, j in utility.pairwise(part)
                         if i != ' ' or (j and '?' not in j)]
                        for part in parsed]
+        self._raw = {}
         return self
 
     def root(self, scope, names):
@@ -114,6 +118,8 @@ class Identifier(Node):
                                         parsed.extend(' ')
                                     if parent_part[-1] == ' ':
                                         parent_part.pop()
+                                        if isinstance(parent, Identifier):
+                                            parent._raw = {}
                                     parsed.extend(parent_part)
                                 else:
                                     parsed.append(name_part)
@@ -137,15 +143,22 @@ class Identifier(Node):
         return names
 
     def raw(self, clean=False):
-        """Raw identifier.
+        """Raw identifier. Computed once per parse.
         args:
             clean (bool): clean name
         returns:
             str
         """
+        cache = getattr(self, '_raw', None)
+        if cache is not None and clean in cache:
+            return cache[clean]
         if clean:
-            return ''.join(''.join(p) for p in self.parsed).replace('?', ' ')
-        return '%'.join('%'.join(p) for p in self.parsed).strip().strip('%')
+            raw = ''.join(''.join(p) for p in self.parsed).replace('?', ' ')
+        else:
+            raw = '%'.join('%'.join(p) for p in self.parsed).strip().strip('%')
+        if cache is not None:
+            cache[clean] = raw
+        return raw
 
     def copy(self):
         """ Return copy of self
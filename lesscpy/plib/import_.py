@@ -15,6 +15,8 @@ class Import(Node):
     """Represents CSS property declaration.
     """
 
+    __slots__ = ()
+
     def parse(self, scope):
         """Parse node
         args:
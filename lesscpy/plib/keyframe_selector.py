@@ -19,6 +19,8 @@ class KeyframeSelector(Node):
     http://www.w3.org/TR/css3-animations/#keyframes
     """
 
+    __slots__ = ('keyframe', 'subparse')
+
     def parse(self, scope):
         """Parse node.
         args:
@@ -10,10 +10,16 @@
 import sys
 import copy
 import itertools
+from six import string_types
+
 from .node import Node
 from .block import Block
+from .call import Call
 from .expression import Expression
+from .negated_expression import NegatedExpression
+from .property import Property
 from .variable import Variable
+from lesscpy.lessc import stats
 from lesscpy.lessc import utility
 
 
@@ -22,6 +28,9 @@ class Mixin(Node):
     """ Mixin Node. Represents callable mixin types.
     """
 
+    __slots__ = ('name', 'args', 'guards', 'body', 'vars', 'uses',
+                 'required', 'tests')
+
     def parse(self, scope):
         """Parse node
         args:
@@ -37,8 +46,52 @@ class Mixin(Node):
         self.vars = list(utility.flatten([list(v.values())
                                           for v in [s['__variables__']
                                                     for s in scope]]))
+        self.uses = self.body_variables()
+        self.required = tuple(i for i, a in enumerate(self.args)
+                              if not isinstance(a, Variable)
+                              and utility.is_variable(a))
+        self.tests = self.compile_guards()
         return self
 
+    def compile_guards(self):
+        """ Guard conditions as nodes, built once rather than on
+        every call.
+        returns:
+            tuple (any condition suffices, list of nodes) OR None
+        """
+        if not self.guards:
+            return None
+        return (',' in self.guards,
+                [g[0] if len(g) == 1 else Expression(g)
+                 for g in self.guards if isinstance(g, list)])
+
+    def body_variables(self):
+        """ Names of the variables the body uses, if the body
+        only holds properties and its output depends on nothing
+        but the values of those variables.
+        returns:
+            list OR None
+        """
+        body = [p for p in self.body.tokens[1] or [] if p]
+        if not all(isinstance(p, Property) for p in body):
+            return None
+        names = set()
+        tokens = list(utility.flatten([p.tokens for p in body]))
+        while tokens:
+            t = tokens.pop()
+            if isinstance(t, (Call, Expression, NegatedExpression)):
+                tokens.extend(utility.flatten(t.tokens))
+            elif isinstance(t, Node):
+                return None
+            elif isinstance(t, string_types):
+                if t.startswith('@{'):
+                    names.add('@' + t[2:-1])
+                elif t.startswith('@@') or t.startswith('-@'):
+                    return None
+                elif t.startswith('@'):
+                    names.add(t)
+        return sorted(names)
+
     def raw(self):
         """Raw mixin name
         returns:
@@ -120,23 +173,80 @@ class Mixin(Node):
         returns:
             bool (passes guards)
         """
-        if self.guards:
-            cor = True if ',' in self.guards else False
-            for g in self.guards:
-                if isinstance(g, list):
-                    res = (g[0].parse(scope)
-                           if len(g) == 1
-                           else Expression(g).parse(scope))
-                    if cor:
-                        if res:
-                            return True
-                    elif not res:
-                        return False
+        if self.tests:
+            cor, tests = self.tests
+            for test in tests:
+                res = test.parse(scope)
+                if cor:
+                    if res:
+                        return True
+                elif not res:
+                    return False
         return True
 
+    def accepts(self, args):
+        """ Call has an argument for every parameter without a
+        default. Binding the arguments of a call that does not
+        would fail.
+        args:
+            args (list): arguments
+        returns:
+            bool
+        """
+        if not self.required:
+            return True
+        if not isinstance(args, list):
+            args = [args]
+        n = len(args)
+        return all(i < n and args[i] is not None for i in self.required)
+
+    def memo_key(self, scope):
+        """ Key of a call in the current scope for Scope.calls.
+        The key is made from the resolved values of the variables
+        the body uses, there is none if one can not be resolved.
+        args:
+            scope (Scope): current scope
+        returns:
+            tuple OR None
+        """
+        key = [self]
+        for name in self.uses:
+            var = scope.variables(name)
+            if not var:
+                return None
+            try:
+                key.append(repr(self.process(var.value, scope)))
+            except SyntaxError:
+                return None
+        return tuple(key)
+
+    def bound_args(self, scope):
+        """ Values the parameters of the mixin are bound to in
+        scope, after a call. Values are compared by repr(), nodes
+        never compare equal.
+        args:
+            scope (Scope): current scope
+        returns:
+            tuple
+        """
+        names = ['@arguments']
+        for arg in self.args:
+            if isinstance(arg, Variable):
+                name = arg.tokens[0]
+                names.append(name[0] if isinstance(name, tuple) else name)
+            elif utility.is_variable(arg):
+                names.append(arg)
+        values = []
+        for name in names:
+            var = scope.variables(name)
+            values.append(repr(var.value) if var else None)
+        return tuple(values)
+
     def call(self, scope, args=[]):
         """Call mixin. Parses a copy of the mixins body
-        in the current scope and returns it.
+        in the current scope and returns it. Variables the
+        mixin closes over are added to scope. Calls of mixins
+        with a properties only body are memoized in scope.calls.
         args:
             scope (Scope): current scope
             args (list): arguments
@@ -145,7 +255,11 @@ class Mixin(Node):
         returns:
             list or False
         """
+        if stats.local.active:
+            stats.local.active.count('mixin_call')
         ret = False
+        if not self.accepts(args):
+            return ret
         if args:
             args = [[a.parse(scope)
                     if isinstance(a, Expression)
@@ -157,9 +271,23 @@ class Mixin(Node):
         except SyntaxError:
             pass
         else:
-            if self.parse_guards(scope):
-                body = self.body.copy()
-                ret = body.tokens[1]
-                if ret:
-                    utility.rename(ret, scope, Block)
+            if not self.parse_guards(scope):
+                return ret
+            if (scope.calls is not None and self.uses is not None
+                    and self.body.tokens[1]):
+                scope.add_variables(self.vars)
+                key = self.memo_key(scope)
+                if key is not None:
+                    ret = scope.calls.get(key)
+                    if ret is None:
+                        ret = [p.parse(scope)
+                               for p in self.body.copy().tokens[1] if p]
+                        scope.calls.add(key, ret)
+                    return list(ret)
+                return self.body.copy().tokens[1]
+            body = self.body.copy()
+            ret = body.tokens[1]
+            if ret:
+                utility.rename(ret, scope, Block)
+                scope.add_variables(self.vars)
         return ret
@@ -16,6 +16,8 @@ class NegatedExpression(Node):
 
     """Expressions preceded by unary negation."""
 
+    __slots__ = ()
+
     def parse(self, scope):
         val, = self.process(self.tokens, scope)
         if isinstance(val, six.string_types):
@@ -7,11 +7,18 @@
     See LICENSE for details.
 .. moduleauthor:: Johann T. Mariusson <jtm@robot.is>
 """
+from six import string_types
+
 from lesscpy.lessc import utility
 
 
 class Node(object):
 
+    __slots__ = ('tokens', 'lineno', 'parsed')
+
+    # Class tag, set on Variable. Saves importing the subclass here
+    is_variable = False
+
     def __init__(self, tokens, lineno=0):
         """ Base Node
         args:
@@ -39,21 +46,54 @@ class Node(object):
         returns:
             list
         """
-        while True:
-            tokens = list(utility.flatten(tokens))
-            done = True
-            if any(t for t in tokens if hasattr(t, 'parse')):
-                tokens = [t.parse(scope)
-                          if hasattr(t, 'parse')
-                          else t
-                          for t in tokens]
-                done = False
-            if any(t for t in tokens if (utility.is_variable(t)) or str(type(t)) == "<class 'lesscpy.plib.variable.Variable'>"):
-                tokens = self.replace_variables(tokens, scope)
-                done = False
-            if done:
-                break
-        return tokens
+        out = []
+        self.resolve(tokens, scope, out, {})
+        return out
+
+    def resolve(self, tokens, scope, out, memo):
+        """ Resolve tokens into out in a single walk. Nested lists
+        are flattened, nodes parsed and variables swapped for their
+        values, recursively, until only plain tokens remain.
+        args:
+            tokens (list): tokenlist
+            scope (Scope): Current scope
+            out (list): Resolved tokens are appended here
+            memo (dict): Resolved tokens of each variable name seen
+        """
+        for t in tokens:
+            if isinstance(t, string_types):
+                if t.startswith('@') or t.startswith('-@'):
+                    self.resolve_variable(t, scope, out, memo)
+                else:
+                    out.append(t)
+            elif isinstance(t, Node):
+                t = t.parse(scope)
+                if isinstance(t, Node) and t.is_variable:
+                    # The parse added it to scope, names may now
+                    # resolve differently
+                    memo.clear()
+                    self.resolve_variable(t.name, scope, out, memo)
+                else:
+                    self.resolve((t,), scope, out, memo)
+            elif utility.is_iterable(t):
+                self.resolve(t, scope, out, memo)
+            else:
+                out.append(t)
+
+    def resolve_variable(self, name, scope, out, memo):
+        """ Resolve variable into out
+        args:
+            name (str): Variable name
+            scope (Scope): Current scope
+            out (list): Resolved tokens are appended here
+            memo (dict): Resolved tokens of each variable name seen
+        """
+        if name in memo:
+            out.extend(memo[name])
+            return
+        start = len(out)
+        self.resolve((scope.swap(name),), scope, out, memo)
+        memo[name] = out[start:]
 
     def replace_variables(self, tokens, scope):
         """ Replace variables in tokenlist
@@ -67,7 +107,7 @@ class Node(object):
         for t in tokens:
             if utility.is_variable(t):
                 list.append(scope.swap(t))
-            elif str(type(t)) == "<class 'lesscpy.plib.variable.Variable'>":
+            elif isinstance(t, Node) and t.is_variable:
                 list.append(scope.swap(t.name))
             else:
                 list.append(t)
@@ -81,3 +121,11 @@ class Node(object):
             str
         """
         raise ValueError('No defined format')
+
+    def write(self, fills, stream):
+        """ Write formatted node to stream
+        args:
+            fills (dict): replacements
+            stream (file): File like object
+        """
+        stream.write(self.fmt(fills))
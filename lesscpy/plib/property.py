@@ -9,6 +9,7 @@
 """
 import re
 from .node import Node
+from lesscpy.lessc import utility
 
 
 class Property(Node):
@@ -16,6 +17,8 @@ class Property(Node):
     """Represents CSS property declaration.
     """
 
+    __slots__ = ('property', 'important')
+
     def parse(self, scope):
         """Parse node
         args:
@@ -87,8 +90,13 @@ class Property(Node):
         return f % fills
 
     def copy(self):
-        """ Return a full copy of self
+        """ Return a full copy of self. A property without
+        variables or nodes parses the same in every scope,
+        it is not copied but shared by all its copies.
         Returns:
             Property object
         """
-        return Property([t for t in self.tokens], 0)
+        for t in utility.flatten(self.tokens):
+            if isinstance(t, Node) or utility.is_variable(t):
+                return Property([t for t in self.tokens], 0)
+        return self
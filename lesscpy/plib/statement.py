@@ -16,6 +16,8 @@ class Statement(Node):
     """Represents CSS statement (@import, @charset...)
     """
 
+    __slots__ = ()
+
     def parse(self, scope):
         """Parse node
         args:
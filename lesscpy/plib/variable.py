@@ -12,6 +12,10 @@ from .node import Node
 
 class Variable(Node):
 
+    __slots__ = ('name', 'value')
+
+    is_variable = True
+
     def parse(self, scope):
         """ Parse function
         args:
@@ -16,25 +16,34 @@ import os
 import sys
 import glob
 import copy
+import time
 import argparse
+import multiprocessing
+
+from six import StringIO
 
 sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+from lesscpy import __version__
+from lesscpy.lessc import cache
 from lesscpy.lessc import parser
 from lesscpy.lessc import lexer
 from lesscpy.lessc import formatter
+from lesscpy.lessc import stats
 
 VERSION_STR = 'Lesscpy compiler 0.9h'
 
 
-def ldirectory(inpath, outpath, args, scope):
-    """Compile all *.less files in directory
+def lfiles(inpath, outpath, args, buildcache=None):
+    """Find *.less files in directory that need compiling and create
+    output directories.
     Args:
         inpath (str): Path to compile
         outpath (str): Output directory
         args (object): Argparse Object
-        scope (Scope): Scope object or None
+        buildcache (BuildCache): Cache of compiled files or None
+    Returns:
+        list of (less file, css file, cached css or None) tuples
     """
-    yacctab = 'yacctab' if args.debug else None
     if not outpath:
         sys.exit("Compile directory option needs -o ...")
     else:
@@ -43,38 +52,343 @@ def ldirectory(inpath, outpath, args, scope):
                 print("Creating '%s'" % outpath, file=sys.stderr)
             if not args.dry_run:
                 os.mkdir(outpath)
-    less = glob.glob(os.path.join(inpath, '*.less'))
-    f = formatter.Formatter(args)
+    files = []
+    less = sorted(glob.glob(os.path.join(inpath, '*.less')))
     for lf in less:
         outf = os.path.splitext(os.path.basename(lf))
         minx = '.min' if args.min_ending else ''
         outf = "%s/%s%s.css" % (outpath, outf[0], minx)
-        if not args.force and os.path.exists(outf):
+        css = None
+        if args.force:
+            recompile = True
+        elif buildcache:
+            css = buildcache.get(lf)
+            recompile = css is None
+        elif os.path.exists(outf):
             recompile = os.path.getmtime(outf) < os.path.getmtime(lf)
         else:
             recompile = True
-        if recompile:
+        if recompile or (css is not None and not os.path.exists(outf)):
+            files.append((lf, outf, css))
+        elif args.verbose:
+            print('skipping %s, not modified' % lf, file=sys.stderr)
+    if args.recurse:
+        for name in sorted(os.listdir(inpath)):
+            if (os.path.isdir(os.path.join(inpath, name))
+                    and not name.startswith('.')
+                    and not name == outpath):
+                files.extend(lfiles(os.path.join(inpath, name),
+                                    os.path.join(outpath, name), args,
+                                    buildcache))
+    return files
+
+
+def include(lessparser, includes, debuglevel=0):
+    """Compile included files into one scope
+    Args:
+        lessparser (LessParser): Parser
+        includes (list): Included files
+        debuglevel (int): Parser debuglevel
+    Returns:
+        (Scope object or None, list of files scope was compiled from)
+    """
+    scope = None
+    dependencies = []
+    for u in includes:
+        if os.path.exists(u):
+            lessparser.reset()
+            lessparser.parse(filename=u, debuglevel=debuglevel)
+            dependencies.append(u)
+            dependencies.extend(lessparser.dependencies)
+            if not scope:
+                scope = lessparser.scope
+            else:
+                scope.update(lessparser.scope)
+        else:
+            sys.exit('included file `%s` not found ...' % u)
+        sys.stdout.flush()
+    return scope, dependencies
+
+
+def lcompile(lessparser, scope, fmt, filename):
+    """Compile one file. Messages the parser writes to stderr are
+    collected and returned, as is any exception.
+    Args:
+        lessparser (LessParser): Parser
+        scope (Scope): Scope object or None, not modified
+        fmt (Formatter): Formatter
+        filename (str): File to compile
+    Returns:
+        (css or None, messages, dependencies, error count, exception
+         message or None)
+    """
+    stderr = sys.stderr
+    sys.stderr = messages = StringIO()
+    css = error = None
+    try:
+        lessparser.reset(scope=copy.deepcopy(scope))
+        lessparser.parse(filename=filename, debuglevel=0)
+        css = fmt.format(lessparser)
+    except Exception as e:
+        error = '%s: %s' % (filename, e)
+    finally:
+        sys.stderr = stderr
+    return (css, messages.getvalue(), lessparser.dependencies,
+            lessparser.register.error_count, error)
+
+
+def token_cache(args):
+    """Token cache in the cache directory
+    Args:
+        args (object): Argparse Object
+    Returns:
+        TokenCache or None
+    """
+    if not getattr(args, 'cache_dir', None):
+        return None
+    return cache.TokenCache(os.path.join(args.cache_dir, 'tokens'))
+
+
+# Parser, scope and formatter of a pool worker, see _init_worker()
+_worker = {}
+
+
+def _init_worker(args, includes):
+    """Build the parser of a pool worker and compile included files
+    """
+    p = parser.LessParser(verbose=args.verbose,
+                          import_cache=cache.ImportCache(),
+                          token_cache=token_cache(args))
+    _worker['scope'] = include(p, includes)[0]
+    _worker['parser'] = p
+    _worker['formatter'] = formatter.Formatter(args)
+
+
+def _compile_worker(filename):
+    """Compile file in a pool worker
+    """
+    return lcompile(_worker['parser'], _worker['scope'],
+                    _worker['formatter'], filename)
+
+
+def ldirectory(inpath, outpath, args, scope, lessparser, buildcache=None,
+               includes=()):
+    """Compile all *.less files in directory. With args.jobs above one
+    the files are compiled by a pool of worker processes, each with a
+    parser of its own. Output is written in the same order either way.
+    Args:
+        inpath (str): Path to compile
+        outpath (str): Output directory
+        args (object): Argparse Object
+        scope (Scope): Scope object or None
+        lessparser (LessParser): Parser, reused for all files
+        buildcache (BuildCache): Cache of compiled files or None
+        includes (list): Files scope was compiled from
+    Returns:
+        list of error messages of files that failed to compile
+    """
+    files = lfiles(inpath, outpath, args, buildcache)
+    pending = [lf for lf, outf, css in files if css is None]
+    jobs = getattr(args, 'jobs', 1) or 1
+    if getattr(args, 'profile', False):
+        # Stats are recorded in this process
+        jobs = 1
+    pool = None
+    if jobs > 1 and len(pending) > 1:
+        pool = multiprocessing.Pool(min(jobs, len(pending)), _init_worker,
+                                    (args, args.include.split(',')
+                                     if args.include else []))
+        results = pool.imap(_compile_worker, pending)
+    else:
+        f = formatter.Formatter(args)
+        results = (lcompile(lessparser, scope, f, lf) for lf in pending)
+    failed = []
+    try:
+        for lf, outf, css in files:
+            if css is not None:
+                print('%s -> %s (cached)' % (lf, outf))
+                if not args.dry_run:
+                    with open(outf, 'w') as outfile:
+                        outfile.write(css)
+                continue
             print('%s -> %s' % (lf, outf))
-            p = parser.LessParser(yacc_debug=(args.debug),
-                                  lex_optimize=True,
-                                  yacc_optimize=(not args.debug),
-                                  scope=scope,
-                                  tabfile=yacctab,
-                                  verbose=args.verbose)
-            p.parse(filename=lf, debuglevel=0)
-            css = f.format(p)
+            css, messages, dependencies, errors, error = next(results)
+            sys.stderr.write(messages)
+            if error:
+                failed.append(error)
+                print(error, file=sys.stderr)
+                sys.stdout.flush()
+                continue
+            if errors:
+                failed.append('%s: %d error(s)' % (lf, errors))
             if not args.dry_run:
                 with open(outf, 'w') as outfile:
                     outfile.write(css)
-        elif args.verbose:
-            print('skipping %s, not modified' % lf, file=sys.stderr)
-        sys.stdout.flush()
-    if args.recurse:
-        [ldirectory(os.path.join(inpath, name), os.path.join(outpath, name), args, scope)
-         for name in os.listdir(inpath)
-         if os.path.isdir(os.path.join(inpath, name))
-         and not name.startswith('.')
-         and not name == outpath]
+                # Files with errors are compiled again to show them.
+                if buildcache and not errors:
+                    buildcache.add(lf, list(includes) + dependencies, css)
+            sys.stdout.flush()
+    finally:
+        if pool:
+            pool.terminate()
+            pool.join()
+    return failed
+
+
+class Watcher(object):
+
+    """Compile target and compile again whenever a file it was
+    compiled from changes. The parser and its import cache are kept
+    between builds. Every entry file maps to the set of files it was
+    compiled from, imports that were not found included, so a change
+    only recompiles the entry files that depend on it. Files are
+    polled, see run().
+    """
+
+    def __init__(self, args, lessparser, scope=None, includes=(),
+                 buildcache=None):
+        """
+        Args:
+            args (object): Argparse Object
+            lessparser (LessParser): Parser
+            scope (Scope): Scope compiled from included files or None
+            includes (list): Files scope was compiled from
+            buildcache (BuildCache): Cache of compiled files or None
+        """
+        self.args = args
+        self.lessparser = lessparser
+        self.scope = scope
+        self.includes = set(os.path.abspath(u) for u in includes)
+        self.buildcache = buildcache
+        self.formatter = formatter.Formatter(args)
+        self.entries = {}
+        self.depends = {}
+        self.stamps = {}
+
+    def find(self):
+        """Find entry files
+        Returns:
+            dict of less file: css file or None for stdout
+        """
+        if not os.path.isdir(self.args.target):
+            return {self.args.target: self.args.output}
+        args = copy.copy(self.args)
+        args.force = True
+        return dict((lf, outf) for lf, outf, css
+                    in lfiles(args.target, args.out, args))
+
+    def stamp(self, filename):
+        """Stat stamp of file, None if it does not exist
+        """
+        try:
+            return cache.file_stamp(filename)
+        except OSError:
+            return None
+
+    def scan(self):
+        """Stat all files entry files were compiled from
+        Returns:
+            dict of path: stamp
+        """
+        files = set(self.includes)
+        for depends in self.depends.values():
+            files.update(depends)
+        return dict((f, self.stamp(f)) for f in files)
+
+    def changed(self):
+        """Files that changed since the last build, and entry files
+        that appeared
+        Returns:
+            set
+        """
+        changed = set(f for f, stamp in self.scan().items()
+                      if stamp != self.stamps.get(f))
+        if os.path.isdir(self.args.target):
+            for lf in self.find():
+                if lf not in self.entries:
+                    changed.add(os.path.abspath(lf))
+        return changed
+
+    def build(self, changed=None):
+        """Compile entry files that depend on changed files, all
+        entry files if changed is None
+        Args:
+            changed (set): Changed files
+        Returns:
+            list of compiled entry files
+        """
+        # Stamps from before the build, files that change while it runs
+        # are built again on the next poll.
+        stamps = self.scan()
+        entries = self.find()
+        if changed is not None and changed & self.includes:
+            if self.args.verbose:
+                print('includes changed, compiling all', file=sys.stderr)
+            self.scope, includes = include(self.lessparser,
+                                           self.args.include.split(','))
+            self.includes = set(os.path.abspath(u) for u in includes)
+            changed = None
+        for lf in list(self.depends):
+            if lf not in entries:
+                del self.depends[lf]
+        built = []
+        for lf in sorted(entries):
+            depends = self.depends.get(lf)
+            if (changed is not None and depends is not None
+                    and not depends & changed):
+                continue
+            built.append(lf)
+            css, messages, dependencies, errors, error = lcompile(
+                self.lessparser, self.scope, self.formatter, lf)
+            self.depends[lf] = set(os.path.abspath(f)
+                                   for f in [lf] + dependencies)
+            outf = entries[lf]
+            if outf:
+                print('%s -> %s' % (lf, outf))
+            sys.stderr.write(messages)
+            if error:
+                print(error, file=sys.stderr)
+            elif outf is None:
+                print(css)
+            elif not self.args.dry_run:
+                with open(outf, 'w') as outfile:
+                    outfile.write(css)
+                if self.buildcache and not errors:
+                    self.buildcache.add(lf, list(self.includes) +
+                                        dependencies, css)
+            sys.stdout.flush()
+        self.entries = entries
+        self.stamps = self.scan()
+        self.stamps.update((f, stamp) for f, stamp in stamps.items()
+                           if f in self.stamps)
+        if getattr(self.args, 'profile', False) and self.lessparser.stats:
+            print(self.lessparser.stats.table(), file=sys.stderr)
+            self.lessparser.stats.clear()
+        return built
+
+    def run(self, interval=0.5, debounce=0.2):
+        """Build, then poll for changes until interrupted. Changes are
+        built once files stopped changing for debounce seconds, so an
+        editor or checkout writing several files causes one build.
+        Args:
+            interval (float): Seconds between polls
+            debounce (float): Seconds files have to be unchanged
+        """
+        self.build()
+        while True:
+            time.sleep(interval)
+            changed = self.changed()
+            if not changed:
+                continue
+            stamps = self.scan()
+            while True:
+                time.sleep(debounce)
+                current = self.scan()
+                if current == stamps:
+                    break
+                stamps = current
+            self.build(self.changed() | changed)
+
 #
 #    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 #
@@ -111,6 +425,17 @@ def run():
                         default=False, help="Add '.min' into output filename. eg, name.min.css")
     dgroup.add_argument('-D', '--dry-run', action="store_true",
                         default=False, help="Dry run, do not write files")
+    dgroup.add_argument('-w', '--watch', action="store_true",
+                        default=False, help="Watch files and compile again "
+                        "when they change")
+    dgroup.add_argument('-j', '--jobs', action="store", type=int, default=1,
+                        help="Number of files to compile in parallel "
+                        "(default 1)")
+    dgroup.add_argument('-C', '--cache-dir', action="store",
+                        help="Cache compiled files and their dependencies in "
+                        "directory, only recompile files when one of them "
+                        "changed. Token streams of lexed files are cached "
+                        "there too")
     group = aparse.add_argument_group('Debugging')
     group.add_argument('-g', '--debug', action="store_true",
                        default=False, help="Debugging information")
@@ -120,9 +445,13 @@ def run():
                        default=False, help="Run lexer on target")
     group.add_argument('-N', '--no-css', action="store_true",
                        default=False, help="No css output")
+    group.add_argument('-P', '--profile', action="store_true",
+                       default=False, help="Print time per compilation phase "
+                       "and event counts (compiles in one process)")
     aparse.add_argument('target', help="less file or directory")
     aparse.add_argument('output', nargs='?', help="output file path")
     args = aparse.parse_args()
+    failed = []
     try:
         #
         #    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -143,48 +472,69 @@ def run():
         #
         #    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
         #
-        yacctab = 'yacctab' if args.debug else None
-        scope = None
-        if args.include:
-            for u in args.include.split(','):
-                if os.path.exists(u):
-                    p = parser.LessParser(yacc_debug=(args.debug),
-                                          lex_optimize=True,
-                                          yacc_optimize=(not args.debug),
-                                          tabfile=yacctab,
-                                          verbose=args.verbose)
-                    p.parse(filename=u, debuglevel=args.debug)
-                    if not scope:
-                        scope = p.scope
-                    else:
-                        scope.update(p.scope)
-                else:
-                    sys.exit('included file `%s` not found ...' % u)
-                sys.stdout.flush()
-        p = None
+        # One parser for all compilations, building it is expensive.
+        p = parser.LessParser(yacc_debug=(args.debug),
+                              verbose=args.verbose,
+                              import_cache=cache.ImportCache(),
+                              token_cache=token_cache(args),
+                              stats=stats.Stats() if args.profile else None)
+        scope, includes = include(p, args.include.split(',')
+                                  if args.include else [], args.debug)
+        buildcache = None
+        if args.cache_dir:
+            options = [VERSION_STR, __version__, args.minify, args.xminify,
+                       args.tabs, args.spaces]
+            options = ' '.join([str(o) for o in options] +
+                               [os.path.abspath(u) for u in includes])
+            buildcache = cache.BuildCache(args.cache_dir, options)
         f = formatter.Formatter(args)
         if not os.path.exists(args.target):
             sys.exit("Target not found '%s' ..." % args.target)
-        if os.path.isdir(args.target):
-            ldirectory(args.target, args.out, args, scope)
+        if args.watch:
+            Watcher(args, p, scope, includes, buildcache).run()
+        elif os.path.isdir(args.target):
+            failed = ldirectory(args.target, args.out, args, scope, p,
+                                buildcache, includes)
             if args.dry_run:
                 print('Dry run, nothing done.', file=sys.stderr)
+            if failed:
+                print('\n%d file(s) failed to compile:' % len(failed),
+                      file=sys.stderr)
+                for error in failed:
+                    print('  %s' % error, file=sys.stderr)
         else:
-            p = parser.LessParser(yacc_debug=(args.debug),
-                                  lex_optimize=True,
-                                  yacc_optimize=(not args.debug),
-                                  scope=copy.deepcopy(scope),
-                                  verbose=args.verbose)
-            p.parse(filename=args.target, debuglevel=args.debug)
-            if args.scopemap:
-                args.no_css = True
-                p.scopemap()
-            if not args.no_css and p:
-                out = f.format(p)
+            out = None
+            if buildcache and not (args.force or args.scopemap):
+                out = buildcache.get(args.target)
+            if out is None:
+                p.reset(scope=copy.deepcopy(scope))
+                p.parse(filename=args.target, debuglevel=args.debug)
+                if args.scopemap:
+                    args.no_css = True
+                    p.scopemap()
+                if not args.no_css and p and buildcache:
+                    out = f.format(p)
+                    if not p.register.error_count:
+                        buildcache.add(args.target, includes + p.dependencies,
+                                       out)
+            if args.no_css:
+                pass
+            elif out is None:
+                # Nothing to cache, write straight to output
                 if args.output:
-                    with open(args.output, "w") as f:
-                        f.write(out)
+                    with open(args.output, "w") as outfile:
+                        f.write(p, outfile)
                 else:
-                    print(out)
+                    f.write(p, sys.stdout)
+                    print()
+            elif args.output:
+                with open(args.output, "w") as outfile:
+                    outfile.write(out)
+            else:
+                print(out)
     except (KeyboardInterrupt, SystemExit, IOError):
         sys.exit('\nAborting...')
+    if args.profile:
+        print(p.stats.table(), file=sys.stderr)
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,340 @@
+#!/usr/bin/env python
+"""
+    Lesscpy benchmark script
+
+    Times the compiler phases (lexing, parsing, the post parse cycle and
+    formatting) over the bundled corpora (test/bootstrap3 and test/less)
+    and measures peak memory. Results can be written as JSON and two
+    result files compared:
+
+        python scripts/benchmark.py -o before.json
+        (checkout the other version)
+        python scripts/benchmark.py -o after.json
+        python scripts/benchmark.py --compare before.json after.json
+
+    With --pathological the lexer is also timed over generated inputs
+    that used to take quadratic time: huge comments, unterminated
+    comments, comment openers and strings, and long URIs.
+"""
+from __future__ import print_function
+
+import argparse
+import contextlib
+import gc
+import glob
+import json
+import os
+import platform
+import sys
+import time
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+from six import StringIO
+
+path = os.path.abspath(sys.argv[0])
+while os.path.dirname(path) != path:
+    if os.path.exists(os.path.join(path, 'lesscpy', '__init__.py')):
+        sys.path.insert(0, path)
+        break
+    path = os.path.dirname(path)
+ROOT = path
+
+import lesscpy
+from lesscpy.lessc import lexer
+from lesscpy.lessc import parser
+from lesscpy.lessc import formatter
+
+CORPORA = {
+    'bootstrap3': ['test/bootstrap3/less/bootstrap.less',
+                   'test/bootstrap3/less/theme.less'],
+    'less': ['test/less/*.less'],
+}
+PHASES = ('lex', 'parse', 'post_parse', 'format')
+# Generated lexer inputs of about size characters
+PATHOLOGICAL = {
+    'comment': lambda size: '/*' + 'a { b: c * 2; }\n' * (size // 17) + '*/',
+    'license': lambda size: '/*!\n' + ' * Licensed under the MIT license\n'
+                            * (size // 34) + ' */',
+    'comment_open': lambda size: 'a { b: c; } /*' + ' ' * size,
+    'comment_many': lambda size: 'a { b: c; } /**/' + ' /*' * (size // 3),
+    'string': lambda size: 'a { b: "' + 'c ' * (size // 2) + '"; }',
+    'string_open': lambda size: 'a { b: "' + 'c ' * (size // 2),
+    'uri_data': lambda size: 'a { b: url(data:' + 'c' * size + '); }',
+    'uri_path': lambda size: 'a { b: url(' + '/c' * (size // 2) + '); }',
+    'uri_ident': lambda size: 'a { b: url(' + 'c' * size + '); }',
+    'uri_dots': lambda size: 'a { b: url(' + 'c.' * (size // 2) + '); }',
+}
+timer = getattr(time, 'perf_counter', time.time)
+
+
+class Opt(object):
+    def __init__(self):
+        self.minify = False
+        self.xminify = False
+        self.tabs = False
+        self.spaces = 2
+
+
+def files(corpus):
+    """Entry files of corpus
+    Args:
+        corpus (str): Corpus name
+    Returns:
+        list
+    """
+    return sorted(f for pattern in CORPORA[corpus]
+                  for f in glob.glob(os.path.join(ROOT, pattern)))
+
+
+@contextlib.contextmanager
+def timed(cls, name, phase, times):
+    """Add the time spent in calls of method name of cls, by any
+    instance, to times[phase]. Patching the class rather than an
+    instance also counts the lexers and parsers of imported files,
+    however a version of the parser creates them. Calls made within
+    a timed call are not counted twice.
+    Args:
+        cls (class): Class
+        name (str): Method name
+        phase (str): Phase
+        times (dict): Phase times
+    """
+    method = cls.__dict__[name]
+    depth = [0]
+
+    def timed_method(self, *args, **kwargs):
+        if depth[0]:
+            return method(self, *args, **kwargs)
+        depth[0] += 1
+        start = timer()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            times[phase] += timer() - start
+            depth[0] -= 1
+    setattr(cls, name, timed_method)
+    try:
+        yield
+    finally:
+        setattr(cls, name, method)
+
+
+def compile_file(filename):
+    """Compile file with a new parser and time the phases. Lexing and
+    the post parse cycle are timed in the lexer and parser classes, for
+    the file and every file it imports. Parse time is what is left.
+    Args:
+        filename (str): Entry file
+    Returns:
+        dict of phase: seconds
+    """
+    times = dict((phase, 0.0) for phase in PHASES)
+    with timed(lexer.LessLexer, 'token', 'lex', times):
+        with timed(parser.LessParser, 'post_parse', 'post_parse', times):
+            p = parser.LessParser(fail_with_exc=True)
+            start = timer()
+            p.parse(filename=filename)
+            times['parse'] = (timer() - start - times['post_parse']
+                              - times['lex'])
+    start = timer()
+    formatter.Formatter(Opt()).format(p)
+    times['format'] = timer() - start
+    return times
+
+
+def peak_memory(filename):
+    """Peak memory allocated while compiling file
+    Args:
+        filename (str): Entry file
+    Returns:
+        int (bytes) or None
+    """
+    if tracemalloc is None:
+        return None
+    gc.collect()
+    tracemalloc.start()
+    try:
+        p = parser.LessParser(fail_with_exc=True)
+        p.parse(filename=filename)
+        formatter.Formatter(Opt()).format(p)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark(corpus, repeat):
+    """Benchmark corpus. Times are the best of repeat runs.
+    Args:
+        corpus (str): Corpus name
+        repeat (int): Runs per file
+    Returns:
+        dict
+    """
+    result = dict((phase, 0.0) for phase in PHASES)
+    result.update({'files': 0, 'errors': [], 'peak_memory': 0,
+                   'per_file': {}})
+    for filename in files(corpus):
+        name = os.path.relpath(filename, ROOT)
+        try:
+            runs = [compile_file(filename) for _ in range(repeat)]
+            memory = peak_memory(filename)
+        except Exception as e:
+            result['errors'].append('%s: %s' % (name, e))
+            continue
+        result['files'] += 1
+        best = dict((phase, min(run[phase] for run in runs))
+                    for phase in PHASES)
+        best['peak_memory'] = memory
+        result['per_file'][name] = best
+        for phase in PHASES:
+            result[phase] += best[phase]
+        if memory is None:
+            result['peak_memory'] = None
+        elif result['peak_memory'] is not None:
+            result['peak_memory'] = max(result['peak_memory'], memory)
+    result['total'] = sum(result[phase] for phase in PHASES)
+    return result
+
+
+def pathological(size):
+    """Time the lexer over the generated inputs. Lexer errors are
+    part of the run, an unterminated string is one.
+    Args:
+        size (int): Input size in characters
+    Returns:
+        dict of input: seconds
+    """
+    result = {}
+    lex = lexer.LessLexer()
+    for name, generate in sorted(PATHOLOGICAL.items()):
+        data = generate(size)
+        start = timer()
+        try:
+            lex.input(StringIO(data))
+            while lex.token():
+                pass
+        except SyntaxError:
+            pass
+        result[name] = timer() - start
+    return result
+
+
+def run_benchmarks(corpora, repeat, size=None):
+    """Benchmark corpora
+    Args:
+        corpora (list): Corpus names
+        repeat (int): Runs per file
+        size (int): Size of the pathological inputs, None to skip them
+    Returns:
+        dict
+    """
+    results = {
+        'lesscpy': lesscpy.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'corpora': dict((corpus, benchmark(corpus, repeat))
+                        for corpus in corpora),
+    }
+    if size:
+        results['pathological'] = pathological(size)
+        results['pathological_size'] = size
+    return results
+
+
+def report(results):
+    """Print results table
+    Args:
+        results (dict): Benchmark results
+    """
+    print('lesscpy %(lesscpy)s, Python %(python)s, best of %(repeat)d'
+          % results)
+    print('%-12s %6s' % ('corpus', 'files') +
+          ''.join('%12s' % c for c in PHASES + ('total', 'peak KiB')))
+    for corpus, r in sorted(results['corpora'].items()):
+        memory = ('%12d' % (r['peak_memory'] / 1024)
+                  if r['peak_memory'] is not None else '%12s' % '-')
+        print('%-12s %6d' % (corpus, r['files']) +
+              ''.join('%11.1fms' % (r[c] * 1000)
+                      for c in PHASES + ('total',)) + memory)
+        for error in r['errors']:
+            print('  error: %s' % error)
+    if 'pathological' in results:
+        print('\nlexer, %(pathological_size)d character inputs' % results)
+        for name, t in sorted(results['pathological'].items()):
+            print('%-12s %10.1fms' % (name, t * 1000))
+
+
+def compare(before, after):
+    """Print change from before to after
+    Args:
+        before (dict): Benchmark results
+        after (dict): Benchmark results
+    """
+    print('lesscpy %s -> %s' % (before['lesscpy'], after['lesscpy']))
+    print('%-12s %-12s %12s %12s %9s' % ('corpus', 'phase', 'before',
+                                         'after', 'change'))
+    for corpus in sorted(set(before['corpora']) & set(after['corpora'])):
+        a, b = before['corpora'][corpus], after['corpora'][corpus]
+        if a['files'] != b['files']:
+            print('%-12s files differ: %d -> %d'
+                  % (corpus, a['files'], b['files']))
+        for key in PHASES + ('total', 'peak_memory'):
+            if a.get(key) is None or b.get(key) is None:
+                continue
+            change = ('%+8.1f%%' % ((b[key] - a[key]) * 100.0 / a[key])
+                      if a[key] else '')
+            if key == 'peak_memory':
+                print('%-12s %-12s %9d KiB %9d KiB %9s' % (
+                    corpus, key, a[key] / 1024, b[key] / 1024, change))
+            else:
+                print('%-12s %-12s %10.1fms %10.1fms %9s' % (
+                    corpus, key, a[key] * 1000, b[key] * 1000, change))
+    a, b = before.get('pathological', {}), after.get('pathological', {})
+    if before.get('pathological_size') != after.get('pathological_size'):
+        return
+    for name in sorted(set(a) & set(b)):
+        change = ('%+8.1f%%' % ((b[name] - a[name]) * 100.0 / a[name])
+                  if a[name] else '')
+        print('%-12s %-12s %10.1fms %10.1fms %9s' % (
+            'lexer', name, a[name] * 1000, b[name] * 1000, change))
+
+
+def run():
+    """Run benchmarks
+    """
+    aparse = argparse.ArgumentParser(description='Lesscpy benchmarks')
+    aparse.add_argument('-c', '--corpus', action='append',
+                        choices=sorted(CORPORA),
+                        help="Corpus to run (default all)")
+    aparse.add_argument('-r', '--repeat', type=int, default=5,
+                        help="Runs per file, best is kept (default 5)")
+    aparse.add_argument('-o', '--output', help="Write results to JSON file")
+    aparse.add_argument('-p', '--pathological', type=int, nargs='?',
+                        const=5 * 1024 * 1024, metavar='SIZE',
+                        help="Also lex pathological inputs of SIZE "
+                        "characters (default 5 MiB)")
+    aparse.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'),
+                        help="Compare two JSON result files")
+    args = aparse.parse_args()
+    if args.compare:
+        with open(args.compare[0]) as f:
+            before = json.load(f)
+        with open(args.compare[1]) as f:
+            after = json.load(f)
+        compare(before, after)
+        return
+    results = run_benchmarks(args.corpus or sorted(CORPORA), args.repeat,
+                             args.pathological)
+    report(results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    run()
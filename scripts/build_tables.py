@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+    Lesscpy table generator
+
+    Generates the lexer and parser tables bundled with the package,
+    lesscpy/lessc/lextab.py and lesscpy/lessc/yacctab.py. The tables are
+    only used while they match the lexer rules and the grammar, run this
+    after changing either:
+
+        python scripts/build_tables.py
+"""
+from __future__ import print_function
+
+import io
+import os
+import re
+import sys
+
+import ply.yacc
+
+path = os.path.abspath(sys.argv[0])
+while os.path.dirname(path) != path:
+    if os.path.exists(os.path.join(path, 'lesscpy', '__init__.py')):
+        sys.path.insert(0, path)
+        break
+    path = os.path.dirname(path)
+
+from lesscpy.lessc import lexer
+from lesscpy.lessc import parser
+
+OUTPUT = os.path.join(path, 'lesscpy', 'lessc')
+REFLAGS = re.UNICODE | re.IGNORECASE
+
+
+def ascii_escape(text):
+    """Escape the characters of text outside ASCII. PLY writes the rule
+    patterns with repr(), which keeps printable Latin-1 characters on
+    Python 3. Python 2 refuses to import such a file, and with a coding
+    line would read the patterns as UTF-8 bytes.
+    Args:
+        text (str): Python source, non-ASCII only inside string literals
+    Returns:
+        str
+    """
+    def escape(c):
+        if ord(c) > 0xff:
+            raise ValueError('Cannot escape %r in a byte string' % c)
+        return '\\x%02x' % ord(c)
+    return u''.join(c if c < u'\x80' else escape(c) for c in text)
+
+
+def build_lextab():
+    """Write lextab.py along with the signature of the lexer rules
+    Returns:
+        str (path)
+    """
+    lex = lexer.LessLexer(optimize=False)
+    name = lexer.LEXTAB.split('.')[-1]
+    lex.lexer.writetab(name, OUTPUT)
+    filename = os.path.join(OUTPUT, name + '.py')
+    with io.open(filename, encoding='utf-8') as f:
+        source = f.read()
+    source += u'_lexsignature = %r\n' % lexer.LessLexer.signature(REFLAGS)
+    with io.open(filename, 'w', encoding='ascii') as f:
+        f.write(ascii_escape(source))
+    return filename
+
+
+def build_yacctab():
+    """Write yacctab.py, PLY records the grammar signature in it
+    Returns:
+        str (path)
+    """
+    filename = os.path.join(OUTPUT, parser.YACCTAB.split('.')[-1] + '.py')
+    for stale in (filename, filename + 'c'):
+        if os.path.exists(stale):
+            os.remove(stale)
+    p = parser.LessParser()
+    ply.yacc.yacc(module=p, start='tunit', debug=False, optimize=False,
+                  write_tables=True, tabmodule=parser.YACCTAB,
+                  outputdir=OUTPUT)
+    return filename
+
+
+def run():
+    """Generate tables
+    """
+    for filename in (build_lextab(), build_yacctab()):
+        print('wrote %s' % os.path.relpath(filename, path))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,301 @@
+"""
+Unit tests for the parse caches.
+"""
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from six import StringIO
+
+from lesscpy.lessc import formatter
+from lesscpy.lessc.cache import (BuildCache, CallCache, ImportCache,
+                                 TokenCache, dump_tokens, load_tokens)
+from lesscpy.lessc.parser import LessParser
+from lesscpy.lessc.scope import Scope
+
+
+class Opt(object):
+    def __init__(self):
+        self.minify = True
+        self.xminify = False
+        self.tabs = False
+
+
+class TestImportCache(unittest.TestCase):
+    """
+    Unit tests for ImportCache
+    """
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.cache = ImportCache()
+        self.parser = LessParser(import_cache=self.cache)
+        self.write('part.less', """
+            @width: 2px;
+            .bordered(@w: @width) { border-width: @w; }
+            .part { color: red; }
+            """)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def write(self, name, content):
+        path = os.path.join(self.dir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def compile(self, content):
+        self.parser.reset()
+        self.parser.parse(filename=self.write('main.less', content))
+        return formatter.Formatter(Opt()).format(self.parser)
+
+    def test_reuse(self):
+        """
+        It parses an imported file once and splices in copies.
+        """
+        less = '@import "part"; a { .bordered; } .b { .part; }'
+        first = self.compile(less)
+        self.assertEqual(1, len(self.cache.entries))
+        self.assertEqual(first, self.compile(less))
+        self.assertEqual('.part{color:red;}\na{border-width:2px;}\n'
+                         '.b{color:red;}', first)
+
+    def test_same_file_twice(self):
+        """
+        It can import a cached file twice in one compilation.
+        """
+        out = self.compile('@import "part"; @import "part"; a { .bordered; }')
+        self.assertEqual('.part{color:red;}\n.part{color:red;}\n'
+                         'a{border-width:2px;}', out)
+
+    def test_changed_file(self):
+        """
+        It parses a file again when it was changed.
+        """
+        self.compile('@import "part"; a { .bordered; }')
+        time.sleep(0.01)
+        self.write('part.less', '.bordered(@w: 3px) { border-width: @w; }')
+        out = self.compile('@import "part"; a { .bordered; }')
+        self.assertEqual('a{border-width:3px;}', out)
+
+    def test_importing_scope(self):
+        """
+        It does not reuse a file whose parse used a different value
+        from the importing file.
+        """
+        self.write('media.less', '@media (min-width: @min) { .a { color: red; } }')
+        self.compile('@min: 1px; @import "media";')
+        out = self.compile('@min: 2px; @import "media";')
+        self.assertEqual('@media (min-width:2px){.a{color:red;}}', out)
+
+    def test_threads(self):
+        """
+        It can be shared by parsers in several threads.
+        """
+        main = self.write('main.less', '@import "part"; a { .bordered; }')
+        out = []
+
+        def compile():
+            parser = LessParser(import_cache=self.cache)
+            for _ in range(20):
+                parser.reset()
+                parser.parse(filename=main)
+                out.append(formatter.Formatter(Opt()).format(parser))
+
+        threads = [threading.Thread(target=compile) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(['.part{color:red;}\na{border-width:2px;}'] * 80,
+                         out)
+
+
+class TestCallCache(unittest.TestCase):
+    """
+    Unit tests for CallCache
+    """
+
+    def compile(self, content, **kwargs):
+        parser = LessParser(**kwargs)
+        parser.parse(file=StringIO(content))
+        return formatter.Formatter(Opt()).format(parser), parser.scope.calls
+
+    def test_lru(self):
+        """
+        It drops the least recently used entry when full.
+        """
+        cache = CallCache(2)
+        cache.add('a', [1])
+        cache.add('b', [2])
+        self.assertEqual([1], cache.get('a'))
+        cache.add('c', [3])
+        self.assertEqual(None, cache.get('b'))
+        self.assertEqual([1], cache.get('a'))
+        self.assertEqual([3], cache.get('c'))
+        self.assertEqual((3, 1), (cache.hits, cache.misses))
+
+    def test_memoized_calls(self):
+        """
+        It expands a properties only mixin once per distinct
+        argument value.
+        """
+        less = """
+            @base: 2px;
+            .radius(@r) { border-radius: @r; width: (@r * 2); }
+            .a { .radius(1px); }
+            .b { .radius(1px); }
+            .c { .radius(@base); }
+            .d { .radius(@base); color: red; }
+            """
+        out, calls = self.compile(less)
+        self.assertEqual((2, 2), (calls.hits, calls.misses))
+        self.assertEqual(out, self.compile(less, mixin_cache=0)[0])
+        self.assertEqual('.a{border-radius:1px;width:2px;}\n'
+                         '.b{border-radius:1px;width:2px;}\n'
+                         '.c{border-radius:2px;width:4px;}\n'
+                         '.d{border-radius:2px;width:4px;color:red;}', out)
+
+    def test_supplied_scope(self):
+        """
+        It memoizes calls in a scope passed to the parser.
+        """
+        parser = LessParser(scope=Scope(True))
+        self.assertTrue(isinstance(parser.scope.calls, CallCache))
+        calls = parser.scope.calls
+        parser.reset(scope=parser.scope)
+        self.assertTrue(parser.scope.calls is calls)
+        self.assertEqual(None,
+                         LessParser(scope=Scope(True),
+                                    mixin_cache=0).scope.calls)
+
+    def test_not_memoized(self):
+        """
+        It does not memoize mixins with inner blocks or calls.
+        """
+        out, calls = self.compile("""
+            .m(@w) { width: @w; .x { width: @w; } }
+            .a { .m(1px); }
+            .b { .m(1px); }
+            """)
+        self.assertEqual((0, 0), (calls.hits, calls.misses))
+        self.assertEqual('.a{width:1px;}\n.a .x{width:1px;}\n'
+                         '.b{width:1px;}\n.b .x{width:1px;}', out)
+
+
+class TestBuildCache(unittest.TestCase):
+    """
+    Unit tests for BuildCache
+    """
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.cache = BuildCache(os.path.join(self.dir, 'cache'), 'x')
+        self.main = self.write('main.less', '@import "part";')
+        self.write('part.less', 'a { b: c; }')
+        self.deps = [os.path.join(self.dir, 'part.less'),
+                     os.path.join(self.dir, 'missing.less')]
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def write(self, name, content):
+        path = os.path.join(self.dir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_get(self):
+        """
+        It returns output of unchanged files.
+        """
+        self.assertEqual(None, self.cache.get(self.main))
+        self.cache.add(self.main, self.deps, 'css')
+        self.assertEqual('css', self.cache.get(self.main))
+        self.assertEqual(None, BuildCache(self.cache.directory,
+                                          'y').get(self.main))
+
+    def test_touched(self):
+        """
+        It returns output when a file was written with the same content.
+        """
+        self.cache.add(self.main, self.deps, 'css')
+        time.sleep(0.01)
+        self.write('part.less', 'a { b: c; }')
+        self.assertEqual('css', self.cache.get(self.main))
+
+    def test_changed(self):
+        """
+        It returns nothing when a dependency changed or a missing
+        import appeared.
+        """
+        self.cache.add(self.main, self.deps, 'css')
+        self.write('part.less', 'a { b: d; }')
+        self.assertEqual(None, self.cache.get(self.main))
+        self.cache.add(self.main, self.deps, 'css')
+        self.write('missing.less', '')
+        self.assertEqual(None, self.cache.get(self.main))
+
+
+class TestTokenCache(unittest.TestCase):
+    """
+    Unit tests for TokenCache
+    """
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.cache = TokenCache(self.dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def compile(self, content):
+        parser = LessParser(token_cache=self.cache)
+        parser.parse(file=StringIO(content))
+        return formatter.Formatter(Opt()).format(parser)
+
+    def test_dump(self):
+        """
+        It loads a token stream as it was dumped.
+        """
+        tokens = [('css_dom', 'a', 1, 0), ('t_ws', ' ', 1, 1),
+                  ('t_bopen', '{', 1, 2), ('css_dom', 'a', 3, 70000),
+                  ('t_semicolon', ';', 3, 70001), ('t_bclose', '}', 3, 70001)]
+        self.assertEqual(tokens, load_tokens(dump_tokens(tokens)))
+        self.assertEqual([], load_tokens(dump_tokens([])))
+
+    def test_replay(self):
+        """
+        It replays the tokens of unchanged text only.
+        """
+        less = '@w: 2px; .m(@a) { width: @a; } .a { .m(@w); color: ~"red" }'
+        first = self.compile(less)
+        self.assertEqual((0, 1), (self.cache.hits, self.cache.misses))
+        self.assertEqual(first, self.compile(less))
+        self.assertEqual((1, 1), (self.cache.hits, self.cache.misses))
+        self.assertEqual('.a{width:2px;color:red;}', first)
+        out = self.compile(less.replace('2px', '3px'))
+        self.assertEqual((1, 2), (self.cache.hits, self.cache.misses))
+        self.assertEqual('.a{width:3px;color:red;}', out)
+
+    def test_signature(self):
+        """
+        It does not replay streams of another token signature.
+        """
+        self.compile('a { b: c; }')
+        self.assertEqual(1, len(os.listdir(self.dir)))
+        other = TokenCache(self.dir, 'x')
+        parser = LessParser(token_cache=other)
+        parser.parse(file=StringIO('a { b: c; }'))
+        self.assertEqual((0, 1), (other.hits, other.misses))
+
+    def test_lexer_error(self):
+        """
+        It does not cache the stream of text the lexer fails on.
+        """
+        self.assertRaises(SyntaxError, self.compile, 'a { b: c; } $')
+        self.assertEqual([], os.listdir(self.dir))
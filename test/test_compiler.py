@@ -0,0 +1,118 @@
+"""
+Unit tests for the compiler script.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from lesscpy.lessc.cache import BuildCache
+from lesscpy.lessc.parser import LessParser
+from lesscpy.scripts.compiler import Watcher, ldirectory
+
+
+class TestLdirectory(unittest.TestCase):
+    """
+    Unit tests for ldirectory
+    """
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.src = os.path.join(self.dir, 'src')
+        os.mkdir(self.src)
+        for name, less in (('a', 'a { b: c; }'),
+                           ('b', '@x: 1px; b { c: @x * 2; }'),
+                           ('c', '.c { d: @x; }'),
+                           ('e', '@import "missing"; .e { f: g; }')):
+            with open(os.path.join(self.src, name + '.less'), 'w') as f:
+                f.write(less)
+        os.mkdir(os.path.join(self.src, 'd.less'))
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def compile(self, jobs, buildcache=None):
+        out = os.path.join(self.dir, 'out%d' % jobs)
+        args = argparse.Namespace(
+            minify=True, xminify=False, tabs=False, spaces=2, force=False,
+            min_ending=False, dry_run=False, recurse=False, verbose=False,
+            include=None, jobs=jobs)
+        failed = ldirectory(self.src, out, args, None, LessParser(),
+                            buildcache)
+        css = {}
+        for name in sorted(os.listdir(out)):
+            with open(os.path.join(out, name)) as f:
+                css[name] = f.read()
+        return failed, css
+
+    def test_jobs(self):
+        """
+        It compiles the same with a pool of workers. Warnings do not
+        fail a file.
+        """
+        failed, css = self.compile(1)
+        self.assertEqual((failed, css), self.compile(3))
+        self.assertEqual(['a.css', 'b.css', 'c.css', 'e.css'], sorted(css))
+        self.assertEqual('b{c:2px;}', css['b.css'])
+        self.assertEqual('.e{f:g;}', css['e.css'])
+        self.assertEqual(2, len(failed))
+        self.assertEqual(os.path.join(self.src, 'c.less') + ': 1 error(s)',
+                         failed[0])
+        self.assertTrue(failed[1].startswith(os.path.join(self.src, 'd.less')))
+
+    def test_build_cache(self):
+        """
+        It caches files that compiled with warnings only.
+        """
+        buildcache = BuildCache(os.path.join(self.dir, 'cache'))
+        failed, css = self.compile(1, buildcache)
+        self.assertEqual((failed, css), self.compile(1, buildcache))
+        cached = [name for name in sorted(os.listdir(self.src))
+                  if buildcache.get(os.path.join(self.src, name)) is not None]
+        self.assertEqual(['a.less', 'b.less', 'e.less'], cached)
+
+
+class TestWatcher(unittest.TestCase):
+    """
+    Unit tests for Watcher
+    """
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.write('a.less', '@import "part"; .a { .m; }')
+        self.write('b.less', '@import "other"; .b { c: d; }')
+        self.write('part.less', '.m { color: red; }')
+        args = argparse.Namespace(
+            minify=True, xminify=False, tabs=False, spaces=2, force=False,
+            min_ending=False, dry_run=False, recurse=False, verbose=False,
+            include=None, target=self.dir,
+            out=os.path.join(self.dir, 'out'))
+        self.watcher = Watcher(args, LessParser())
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def write(self, name, content):
+        with open(os.path.join(self.dir, name), 'w') as f:
+            f.write(content)
+
+    def build(self):
+        return [os.path.basename(lf)
+                for lf in self.watcher.build(self.watcher.changed())]
+
+    def test_build(self):
+        """
+        It compiles only entry files that depend on a changed file.
+        """
+        self.assertEqual(3, len(self.watcher.build()))
+        self.assertEqual([], self.build())
+        time.sleep(0.01)
+        self.write('part.less', '.m { color: blue; }')
+        self.assertEqual(['a.less', 'part.less'], self.build())
+        with open(os.path.join(self.dir, 'out', 'a.css')) as f:
+            self.assertEqual('.m{color:blue;}\n.a{color:blue;}', f.read())
+        self.write('other.less', '.o { p: q; }')
+        self.assertEqual(['b.less', 'other.less'], self.build())
+        self.assertEqual([], self.build())
@@ -3,7 +3,9 @@
 """
 import unittest
 
+from lesscpy.lessc.scope import Scope
 from lesscpy.plib.expression import Expression
+from lesscpy.plib.variable import Variable
 
 
 class TestExpression(unittest.TestCase):
@@ -56,3 +58,21 @@ class TestExpression(unittest.TestCase):
         ]:
             e = Expression(test[:3])
             self.assertEqual(test[3], e.parse(None), test)
+
+    def test_variables(self):
+        """
+        It resolves nested variables and expressions in one walk.
+        """
+        scope = Scope(init=True)
+        for name, value in [('@a', ['2px']),
+                            ('@b', [Expression(['@a', '*', '2'])]),
+                            ('@c', [['@b'], ' ', '@b']),
+                            ('@name', ['"a"'])]:
+            var = Variable([name, None, value])
+            var.name, var.value = name, value
+            scope.add_variable(var)
+        e = Expression(['@c', '+', '1'])
+        self.assertEqual(['4px', ' ', '4px'], e.process(['@c'], scope))
+        self.assertEqual(['2px', ' ', '2px'],
+                         e.process(['@@name', ' ', ('@{a}',)], scope))
+        self.assertEqual('5px', Expression(['@b', '+', '1']).parse(scope))
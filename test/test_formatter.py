@@ -0,0 +1,56 @@
+"""
+Unit tests for the formatter.
+"""
+import unittest
+
+from six import StringIO
+
+from lesscpy.lessc.formatter import Formatter
+from lesscpy.lessc.parser import LessParser
+
+
+class Opt(object):
+    def __init__(self):
+        self.minify = False
+        self.xminify = False
+        self.tabs = False
+        self.spaces = 2
+
+
+class TestFormatter(unittest.TestCase):
+    """
+    Unit tests for Formatter
+    """
+
+    def setUp(self):
+        self.parser = LessParser()
+        self.parser.parse(file=StringIO("""
+            @a: 1px;
+            .a { width: @a; }
+            @media print { .b { .a; } }
+            """))
+        self.formatter = Formatter(Opt())
+
+    def test_write(self):
+        """
+        It writes the same as it formats, as it goes.
+        """
+        class Stream(list):
+            write = list.append
+
+        stream = Stream()
+        self.formatter.write(self.parser, stream)
+        self.assertEqual(self.formatter.format(self.parser), ''.join(stream))
+        self.assertEqual('.a {\n  width: 1px;\n}\n@media print {\n'
+                         '  .b {\n    width: 1px;\n  }\n}', ''.join(stream))
+        self.assertIn('  width: 1px;', stream)
+
+    def test_write_minified(self):
+        """
+        It writes the same as it formats when minified.
+        """
+        self.formatter.args.minify = True
+        out = StringIO()
+        self.formatter.write(self.parser, out)
+        self.assertEqual('.a{width:1px;}\n@media print{.b{width:1px;}}',
+                         out.getvalue())
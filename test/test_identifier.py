@@ -99,3 +99,13 @@ class TestIdentifier(unittest.TestCase):
             t, r = i
             id = Identifier(t, 0)
             self.assertEqual(id.parse(sc).fmt(fl), r, i)
+
+    def test_raw(self):
+        id = Identifier(['.a', '>', 'p'], 0).parse(None)
+        self.assertEqual('.a%?>?%p', id.raw())
+        self.assertEqual('.a > p', id.raw(True))
+        self.assertEqual({False: '.a%?>?%p', True: '.a > p'}, id._raw)
+        sc = Scope()
+        sc.push()
+        sc.current = Identifier(['.b'], 0).parse(sc)
+        self.assertEqual('.b% %.a%?>?%p', id.parse(sc).raw())
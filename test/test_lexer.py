@@ -1,11 +1,17 @@
 """
 Unit tests for the lexer.
 """
-from tempfile import NamedTemporaryFile
+import io
+import os
+import re
+import shutil
+import sys
+from tempfile import NamedTemporaryFile, mkdtemp
 import unittest
 
 from six import StringIO
 
+from lesscpy.lessc import lexer
 from lesscpy.lessc.lexer import LessLexer
 
 
@@ -45,3 +51,123 @@ class TestLessLexer(unittest.TestCase):
 
         token = self.lexer.token()
         self.assertEqual('@simple-var', token.value)
+
+    def test_input_resets_state(self):
+        """
+        It starts from a clean state on new input.
+        """
+        self.lexer.input(StringIO("a {\n(\n"))
+        while self.lexer.token():
+            pass
+        self.lexer.input(StringIO("@simple-var: 1;"))
+
+        token = self.lexer.token()
+        self.assertEqual('@simple-var', token.value)
+        self.assertEqual(1, token.lineno)
+        self.assertEqual('INITIAL', self.lexer.lexer.lexstate)
+
+    def test_input_released(self):
+        """
+        It drops the input at the end of it.
+        """
+        self.lexer.input(StringIO("@a: 1;"))
+        while self.lexer.token():
+            pass
+
+        self.assertEqual('', self.lexer.lexer.lexdata)
+        self.assertEqual(None, self.lexer.token())
+
+    def test_bundled_tables(self):
+        """
+        It has bundled tables generated from the current rules.
+        """
+        self.assertTrue(LessLexer.tables_current(re.UNICODE | re.IGNORECASE))
+        self.assertFalse(LessLexer.tables_current(re.UNICODE))
+
+    def test_bundled_tables_ascii(self):
+        """
+        Its bundled tables are ASCII, Python 2 imports them.
+        """
+        filename = os.path.join(os.path.dirname(lexer.__file__), 'lextab.py')
+        with io.open(filename, 'rb') as f:
+            f.read().decode('ascii')
+
+    def test_bundled_tables_broken(self):
+        """
+        It builds the tables in memory when the bundled ones fail to load.
+        """
+        directory = mkdtemp()
+        sys.path.insert(0, directory)
+        try:
+            with open(os.path.join(directory, 'brokentab.py'), 'w') as f:
+                f.write('_tabversion = (\n')
+            lexer.LEXTAB = 'brokentab'
+            self.assertFalse(LessLexer.tables_current(re.UNICODE | re.IGNORECASE))
+            lex = LessLexer()
+            self.assertFalse(lex.lexer.lexoptimize)
+            lex.input(StringIO("@simple-var: 1;"))
+            self.assertEqual('@simple-var', lex.token().value)
+        finally:
+            lexer.LEXTAB = 'lesscpy.lessc.lextab'
+            sys.path.remove(directory)
+            shutil.rmtree(directory)
+
+    def test_ident_types(self):
+        """
+        It classifies identifiers as keywords, properties and DOM
+        elements.
+        """
+        self.lexer.input(StringIO(
+            "DIV textPath when from { font: rect; -x-y: a; }"))
+        tokens = []
+        while True:
+            token = self.lexer.token()
+            if not token:
+                break
+            if token.type.startswith(('css_', 'less_')):
+                tokens.append((token.type, token.value))
+
+        self.assertEqual([('css_dom', 'DIV'), ('css_dom', 'textPath'),
+                          ('less_when', 'when'),
+                          ('css_keyframe_selector', 'from'),
+                          ('css_property', 'font'), ('css_ident', 'rect'),
+                          ('css_vendor_property', '-x-y'),
+                          ('css_ident', 'a')], tokens)
+
+    def test_long_comments_and_uris(self):
+        """
+        It lexes huge comments and long URIs in linear time.
+        """
+        self.lexer.input(StringIO(
+            "/*" + " * x\n" * 100000 + "*/ a { b: url(" +
+            "c." * 50000 + "); }"))
+        tokens = []
+        while True:
+            token = self.lexer.token()
+            if not token:
+                break
+            tokens.append(token)
+
+        self.assertEqual('css_dom', tokens[0].type)
+        self.assertEqual(100001, tokens[0].lineno)
+        uri = [t for t in tokens if t.type == 'css_uri']
+        self.assertEqual(["c." * 49999 + "c"], [t.value for t in uri])
+
+    def test_unclosed_comments(self):
+        """
+        It lexes openers after the last comment end as literals, in
+        linear time.
+        """
+        self.lexer.input(StringIO("/* a\n*/ b" + " /*" * 50000))
+        tokens = []
+        while True:
+            token = self.lexer.token()
+            if not token:
+                break
+            tokens.append(token)
+
+        self.assertEqual(('css_dom', 'b', 2), (tokens[0].type,
+                                               tokens[0].value,
+                                               tokens[0].lineno))
+        self.assertEqual(['t_ws'] + ['/', '*'] * 50000,
+                         [t.type for t in tokens[1:]])
@@ -1,11 +1,24 @@
 """
 Unit test for the parser.
 """
+import copy
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
 import unittest
 
+import ply.yacc
 from six import StringIO
 
+from lesscpy.exceptions import CompilationError
 from lesscpy.lessc.parser import LessParser
+from lesscpy.lessc.scope import Scope
+from lesscpy.lessc import stats as lstats
+from lesscpy.lessc.stats import Stats
 
 
 class TestLessParser(unittest.TestCase):
@@ -33,3 +46,229 @@ class TestLessParser(unittest.TestCase):
         variable = self.parser.result[0]
         self.assertEqual('@nice-blue', variable.name)
         self.assertEqual(['#5b83ad'], variable.value)
+
+    def test_reset(self):
+        """
+        It can be reused for another file after a reset.
+        """
+        self.parser.parse(file=StringIO("@a: 1px;"))
+        self.parser.reset()
+        self.parser.parse(file=StringIO("@b: 2px;"))
+
+        self.assertEqual(1, len(self.parser.result))
+        self.assertEqual('@b', self.parser.result[0].name)
+        self.assertFalse(self.parser.scope.variables('@a'))
+
+    def test_reuse_for_imports(self):
+        """
+        It parses imports with its own tables and restores its state.
+        """
+        import os
+        filename = os.path.join(os.path.dirname(__file__),
+                                'less', 'imports.less')
+        self.parser.parse(filename=filename)
+        first = len(self.parser.result)
+        self.parser.reset()
+        self.parser.parse(filename=filename)
+
+        self.assertEqual(first, len(self.parser.result))
+        self.assertEqual(filename, self.parser.target)
+        self.assertEqual(0, self.parser.importlvl)
+
+    def test_stats(self):
+        """
+        It records phase times and event counts.
+        """
+        stats = Stats()
+        parser = LessParser(stats=stats)
+        parser.parse(file=StringIO("""
+            @a: 1px;
+            .m(@w) { width: @w; }
+            .b { .m(@a); }
+            """))
+
+        self.assertEqual(set(['lex', 'parse', 'post_parse', 'mixins']),
+                         set(stats.times))
+        self.assertEqual(1, stats.counts['mixin_call'])
+        self.assertEqual(1, stats.counts['block_copy'])
+        self.assertTrue(stats.counts['variable_lookup'] >= 1)
+        self.assertIn('mixin_call', stats.table())
+
+    def test_stats_per_thread(self):
+        """
+        It records events of the parser's own thread only.
+        """
+        seen = []
+        with Stats() as stats:
+            thread = threading.Thread(
+                target=lambda: seen.append(lstats.local.active))
+            thread.start()
+            thread.join()
+            self.assertTrue(lstats.local.active is stats)
+        self.assertEqual([None], seen)
+        self.assertEqual(None, lstats.local.active)
+
+    def test_stats_failed_phase(self):
+        """
+        It stops a phase that failed.
+        """
+        class Failing(object):
+            def parse(self, scope):
+                raise RuntimeError('failed')
+
+        stats = Stats()
+        parser = LessParser(stats=stats)
+        parser.result = [Failing()]
+        self.assertRaises(RuntimeError, parser.post_parse)
+        self.assertEqual([], stats._stack)
+        self.assertIn('post_parse', stats.times)
+
+    def test_slotted_nodes(self):
+        """
+        It builds nodes without a per instance dict, copies included.
+        """
+        self.parser.parse(file=StringIO("""
+            @a: 1px;
+            .m(@w) { width: @w !important; }
+            .b { .m(@a); }
+            """))
+
+        block = copy.deepcopy(self.parser.result[-1])
+        self.assertFalse(hasattr(block, '__dict__'))
+        self.assertEqual('.b', block.name.raw())
+        prop = block.parsed[0]
+        self.assertFalse(hasattr(prop, '__dict__'))
+        self.assertEqual('width', prop.property)
+        self.assertTrue(prop.important)
+
+    def test_mixin_shares_static_properties(self):
+        """
+        It shares properties without variables between mixin calls
+        and copies the others.
+        """
+        self.parser.parse(file=StringIO("""
+            .m(@w) { display: block; width: @w; }
+            .a { .m(1px); }
+            .b { .m(2px); }
+            """))
+
+        a, b = [block.parsed for block in self.parser.result]
+        self.assertIs(a[0], b[0])
+        self.assertIsNot(a[1], b[1])
+        self.assertEqual(['1px'], a[1].parsed)
+        self.assertEqual(['2px'], b[1].parsed)
+
+    def test_mixin_overloads(self):
+        """
+        It skips overloads with parameters the call has no
+        argument for, and reuses compiled guards.
+        """
+        self.parser.parse(file=StringIO("""
+            .loop(@i; @unit) when (@i > 0) { height: @unit; }
+            .loop(@i) when (@i > 0) {
+                .w-@{i} { width: (@i * 10px); }
+                .loop(@i - 1);
+            }
+            .loop(0) {}
+            .grid { .loop(2); }
+            """))
+
+        mixins = self.parser.scope.mixins('.loop')
+        self.assertEqual([(0, 1), (0,), ()],
+                         [m.required for m in mixins])
+        self.assertFalse(mixins[0].accepts([['2']]))
+        self.assertTrue(mixins[1].accepts([['2']]))
+        self.assertFalse(mixins[1].accepts(None))
+        cor, tests = mixins[1].tests
+        self.assertEqual((False, 1), (cor, len(tests)))
+        self.assertEqual(['.grid .w-2', '.grid .w-1'],
+                         [b.raw(True) for b in self.parser.result[0].inner])
+
+    def test_deep_recursive_mixin(self):
+        """
+        It expands recursive mixins far deeper than the Python stack
+        allows, up to the call budget.
+        """
+        less = """
+            .loop(@i) when (@i > 0) {
+                .w-@{i} { width: (@i * 1px); }
+                .loop(@i - 1);
+            }
+            .loop(0) {}
+            .grid { .loop(1500); }
+            """
+        self.parser.parse(file=StringIO(less))
+        inner = self.parser.result[0].inner
+        self.assertEqual(1500, len(inner))
+        self.assertEqual('.grid .w-1', inner[-1].raw(True))
+
+        parser = LessParser(fail_with_exc=True, mixin_budget=100)
+        self.assertRaises(CompilationError, parser.parse,
+                          file=StringIO(less))
+
+        parser = LessParser(fail_with_exc=True, mixin_budget=100,
+                            scope=Scope(True))
+        self.assertEqual(100, parser.scope.budget)
+        self.assertRaises(CompilationError, parser.parse,
+                          file=StringIO(less))
+
+    def test_self_recursive_call(self):
+        """
+        It fails a call that expands to itself with the same arguments
+        as a NameError, without spending the call budget.
+        """
+        for less, name in [
+                ('.clearfix { .clearfix(); }', '.clearfix'),
+                ('.m(@a) { width: @a; .m(@a); } .x { .m(1px); }', '.m'),
+                ('.m(@a) { .n(@a); } .n(@b) { .m(@b); } .x { .m(1px); }',
+                 '.n')]:
+            parser = LessParser(fail_with_exc=True, mixin_budget=100)
+            try:
+                parser.parse(file=StringIO(less))
+            except CompilationError as e:
+                self.assertTrue('NameError `%s`' % name in str(e), str(e))
+            else:
+                self.fail('No error for %s' % less)
+
+    def test_bundled_tables(self):
+        """
+        It loads the bundled parser and lexer tables.
+        """
+        self.assertTrue(isinstance(self.parser.parser.productions[1],
+                                   ply.yacc.MiniProduction))
+        self.assertTrue(self.parser.lex.lexer.lexoptimize)
+
+    def test_bundled_tables_generated(self):
+        """
+        Its bundled tables are what scripts/build_tables.py writes.
+        """
+        if sys.version_info < (3, 7):
+            self.skipTest('Tables are generated with ordered dicts')
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script = os.path.join(root, 'scripts', 'build_tables.py')
+        if not os.path.exists(script):
+            self.skipTest('No scripts/build_tables.py')
+        directory = tempfile.mkdtemp()
+        try:
+            shutil.copytree(os.path.join(root, 'lesscpy'),
+                            os.path.join(directory, 'lesscpy'),
+                            ignore=shutil.ignore_patterns('*.pyc',
+                                                          '__pycache__'))
+            os.mkdir(os.path.join(directory, 'scripts'))
+            shutil.copy(script, os.path.join(directory, 'scripts'))
+            with open(os.devnull, 'w') as devnull:
+                subprocess.check_call(
+                    [sys.executable, os.path.join(directory, 'scripts',
+                                                  'build_tables.py')],
+                    stdout=devnull)
+            for name in ('lextab.py', 'yacctab.py'):
+                with io.open(os.path.join(root, 'lesscpy', 'lessc',
+                                          name), 'rb') as f:
+                    bundled = f.read()
+                with io.open(os.path.join(directory, 'lesscpy', 'lessc',
+                                          name), 'rb') as f:
+                    self.assertTrue(f.read() == bundled,
+                                    '%s is stale, run scripts/'
+                                    'build_tables.py' % name)
+        finally:
+            shutil.rmtree(directory)
@@ -2,10 +2,12 @@
 Test the high-level compile function
 
 """
+import threading
 import unittest
 
 from six import StringIO
 
+import lesscpy
 from lesscpy import compile
 
 
@@ -42,3 +44,32 @@ class TestCompileFunction(unittest.TestCase):
 
         fail_func = lambda: compile(StringIO("a }"), minify=True)
         self.assertRaises(CompilationError, fail_func)
+
+    def test_compile_reuses_parser(self):
+        """
+        It can compile several inputs in a row.
+        """
+        output = compile(StringIO("@a: 2px; a { border-width: @a; }"), minify=True)
+        self.assertEqual(output, "a{border-width:2px;}")
+        output = compile(StringIO("b { border-width: 3px; }"), minify=True)
+        self.assertEqual(output, "b{border-width:3px;}")
+
+    def test_compile_in_threads(self):
+        """
+        It compiles in several threads, sharing parsed imports.
+        """
+        out = []
+        caches = []
+
+        def run():
+            out.append(compile(StringIO("a { border-width: 2px; }"),
+                               minify=True))
+            caches.append(lesscpy._local.parser.import_cache)
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(["a{border-width:2px;}"] * 4, out)
+        self.assertEqual(1, len(set(id(c) for c in caches)))
@@ -0,0 +1,147 @@
+"""
+Unit tests for the hand-written scanner.
+"""
+import glob
+import os
+import unittest
+
+from six import StringIO
+
+from lesscpy.lessc import formatter
+from lesscpy.lessc import scanner
+from lesscpy.lessc.lexer import LessLexer
+from lesscpy.lessc.parser import LessParser
+from lesscpy.lessc.scanner import LessScanner
+
+here = os.path.dirname(__file__)
+
+
+class Opt(object):
+    def __init__(self):
+        self.minify = True
+        self.xminify = False
+        self.tabs = False
+
+
+class TestLessScanner(unittest.TestCase):
+    """
+    Unit tests for LessScanner
+    """
+
+    def setUp(self):
+        self.lexer = LessLexer()
+        self.scanner = LessScanner()
+
+    def stream(self, lexer, state, content):
+        lexer.input(StringIO(content))
+        tokens = []
+        while True:
+            try:
+                t = lexer.token()
+            except (SyntaxError, IndexError) as e:
+                tokens.append(('error', str(e)))
+                break
+            if not t:
+                break
+            tokens.append((t.type, t.value, t.lineno, t.lexpos, state()))
+        return tokens
+
+    def assertSameTokens(self, content):
+        self.assertEqual(
+            self.stream(self.lexer, lambda: self.lexer.lexer.lexstate,
+                        content),
+            self.stream(self.scanner, lambda: self.scanner.lexstate,
+                        content))
+
+    def test_corpus(self):
+        """
+        It produces the tokens of the lexer for every test file.
+        """
+        files = glob.glob(os.path.join(here, '*', '*.less'))
+        files += glob.glob(os.path.join(here, '*', '*', '*.less'))
+        self.assertTrue(files)
+        for filename in sorted(files):
+            with open(filename) as f:
+                self.assertSameTokens(f.read())
+
+    def test_states(self):
+        """
+        It switches states like the lexer.
+        """
+        for content in [
+            '@media screen and (max-width: 1px), not print { a { b: c } }',
+            '@import url("a.css") handheld and (min-width: 1px);',
+            '.a-@{b}_c d, .e.f:hover { g: ~"h-@{i}" ~\'j\'; }',
+            'a { b: "c @{d}" \'e\' url(http://f.g/h.png) %(i, j); }',
+            'a[b="c"]:not(.d) > e:nth-child(2n+1) { f: #fff !important }',
+            'a { b: progid:DXImageTransform.Microsoft.gradient(c=1) }',
+            '/* a\n*/ // b\n\ta { b: -c-d 1.5em -.5px \xe9 }',
+            '/**/ a { b: c /* d */ } /*/ e */ /* f /*\n',
+        ]:
+            self.assertSameTokens(content)
+
+    def test_chunks(self):
+        """
+        It produces the same tokens when tokens span chunks of input.
+        """
+        files = glob.glob(os.path.join(here, 'less', '*.less'))
+        contents = []
+        for filename in sorted(files):
+            with open(filename) as f:
+                contents.append(f.read())
+        contents += [
+            'a { b: "c\nd"; e: "f @{g}\nh"; i: ! \n important; }',
+            'a[b=\n"c"] { d: progid:DX.e(\nf=1); g: url(data:\nh) }',
+            '/* a\n*/ b /*/ c */ /* d /*\r\n\r\ne:and (f\ng) { }',
+        ]
+        size = scanner.CHUNK_SIZE
+        try:
+            for scanner.CHUNK_SIZE in (1, 5):
+                for content in contents:
+                    self.assertSameTokens(content)
+        finally:
+            scanner.CHUNK_SIZE = size
+
+    def test_buffer(self):
+        """
+        It keeps no more than the unscanned part of a chunk or two.
+        """
+        self.scanner.input(StringIO('a { b: c; }\n' * 20000))
+        longest = 0
+        while self.scanner.token():
+            longest = max(longest, len(self.scanner.lexdata))
+        self.assertTrue(longest <= 2 * scanner.CHUNK_SIZE, longest)
+
+    def test_stream_left_open(self):
+        """
+        It leaves a stream it was given open.
+        """
+        stream = StringIO('a { b: "c @{d}"; }')
+        self.scanner.input(stream)
+        while self.scanner.token():
+            pass
+        self.assertFalse(stream.closed)
+
+    def test_errors(self):
+        """
+        It fails on the same input as the lexer.
+        """
+        self.assertSameTokens('a { b: c; } $')
+        self.assertSameTokens('@media a;')
+
+    def test_parser(self):
+        """
+        It can be used by the parser.
+        """
+        less = """
+            @w: 2px;
+            .m(@a) { width: @a; }
+            @media screen { .a { .m(@w); color: ~"red" } }
+            """
+        out = []
+        for fast_lexer in (False, True):
+            parser = LessParser(fast_lexer=fast_lexer)
+            parser.parse(file=StringIO(less))
+            out.append(formatter.Formatter(Opt()).format(parser))
+        self.assertEqual(out[0], out[1])
+        self.assertEqual('@media screen{.a{width:2px;color:red;}}', out[1])
@@ -0,0 +1,92 @@
+"""
+Unit tests for the scope.
+"""
+import unittest
+
+from lesscpy.lessc.scope import Scope
+from lesscpy.plib.variable import Variable
+
+
+def variable(name, value):
+    var = Variable([name, None, [value]])
+    var.name, var.value = name, [value]
+    return var
+
+
+class TestScope(unittest.TestCase):
+    """
+    Unit tests for Scope
+    """
+
+    def setUp(self):
+        self.scope = Scope(init=True)
+
+    def test_shadowing(self):
+        """
+        It finds the innermost variable and restores outer ones on pop.
+        """
+        outer, inner = variable('@a', '1px'), variable('@a', '2px')
+        self.scope.add_variable(outer)
+        self.scope.push()
+        self.scope.push()
+        self.assertIs(outer, self.scope.variables('@a'))
+        self.scope.add_variable(inner)
+        self.assertIs(inner, self.scope.variables('@a'))
+        self.assertIs(inner, self.scope.variables('@{a}'))
+        self.scope.pop()
+        self.assertIs(outer, self.scope.variables('@a'))
+        self.scope.pop()
+        self.scope.pop()
+        self.assertFalse(self.scope.variables('@a'))
+
+    def test_update(self):
+        """
+        It indexes variables added below the top level.
+        """
+        other = Scope(init=True)
+        outer, inner = variable('@a', '1px'), variable('@a', '2px')
+        other.add_variable(outer)
+        self.scope.push()
+        self.scope.add_variable(inner)
+        self.scope.update(other)
+        self.assertIs(inner, self.scope.variables('@a'))
+        self.scope.pop()
+        self.assertIs(outer, self.scope.variables('@a'))
+
+    def test_add_variables(self):
+        """
+        It only adds variables that change what a name resolves to.
+        """
+        a, b, c = (variable('@a', '1px'), variable('@b', '1px'),
+                   variable('@b', '2px'))
+        self.scope.add_variables([a, b])
+        self.scope.push()
+        self.scope.add_variable(c)
+        self.scope.add_variables([a, b])
+        self.assertEqual({'@b': b}, self.scope[-1]['__variables__'])
+        self.assertIs(b, self.scope.variables('@b'))
+
+    def test_blocks(self):
+        """
+        It finds blocks by name, inner blocks through their parent,
+        and forgets removed blocks.
+        """
+        class Block(object):
+            def __init__(self, name, inner=()):
+                self.name = name
+                self.tokens = [name, list(inner)]
+
+            def raw(self):
+                return self.name
+
+        inner = Block('.a?>?.b')
+        a, c = Block('.a', [inner]), Block('.c')
+        for block in (Block('.x'), a, c):
+            self.scope.add_block(block)
+        self.scope.push()
+        self.assertIs(a, self.scope.blocks('.a'))
+        self.assertIs(inner, self.scope.blocks('.a?>?.b'))
+        self.assertFalse(self.scope.blocks('.a .c'))
+        self.scope.remove_block(a, index=0)
+        self.assertFalse(self.scope.blocks('.a'))
+        self.assertIs(c, self.scope.blocks('.c'))
@@ -103,3 +103,15 @@ class TestUtility(unittest.TestCase):
         self.assertEqual(3.0, test(10.0 / 3, 0))
         self.assertEqual(4, test(3.5))
         self.assertEqual(4, test(4.5))
+
+    def test_flatten(self):
+        test = utility.flatten
+        self.assertEqual([], list(test([])))
+        self.assertEqual(['a', 'b'], list(test(['a', 'b'])))
+        self.assertEqual(['a', 'b', 'c', 'd', 'e'],
+                         list(test([['a', ('b', [[['c']]])], [], 'd', ('e',)])))
+        self.assertEqual(['ab', 1, None], list(test((['ab'], 1, [None]))))
+        deep = 'x'
+        for _ in range(5000):
+            deep = [deep]
+        self.assertEqual(['x'], list(test(deep)))